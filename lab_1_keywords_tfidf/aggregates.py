@@ -0,0 +1,342 @@
+"""
+Lab 1.
+
+Mergeable corpus-level aggregates for map-reduce keyword extraction
+"""
+
+import heapq
+from multiprocessing import Pool
+from typing import Any, Iterable, Literal
+
+from lab_1_keywords_tfidf.main import (
+    calculate_frequencies,
+    calculate_tf,
+    check_dict,
+    check_list,
+    check_positive_int,
+    clean_and_tokenize_fast,
+    remove_stop_words,
+    validation_policy,
+)
+from lab_1_keywords_tfidf.pipeline import UNKNOWN_TERM_IDF
+
+MetricType = Literal["count", "documents", "tfidf"]
+"Type alias for metrics of corpus aggregates."
+
+
+class CorpusAggregate:
+    """
+    Partial statistics of a shard of documents which can be merged with others.
+
+    Merging is associative and commutative, so shards can be aggregated on
+    different processes or machines and combined in any order. TF-IDF sums are
+    floats, so they are equal up to rounding for different merge orders.
+
+    Attributes:
+        _documents (int): Number of documents
+        _term_counts (dict[str, int]): Token occurrences in all documents
+        _document_freqs (dict[str, int]): Number of documents including a token
+        _tfidf_sums (dict[str, float]): Sums of TF-IDF values over documents
+    """
+
+    def __init__(
+        self,
+        documents: int = 0,
+        term_counts: dict[str, int] | None = None,
+        document_freqs: dict[str, int] | None = None,
+        tfidf_sums: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Initialize an instance of CorpusAggregate, empty by default.
+
+        Args:
+            documents (int): Number of documents
+            term_counts (dict[str, int] | None): Token occurrences in all documents
+            document_freqs (dict[str, int] | None): Number of documents including a token
+            tfidf_sums (dict[str, float] | None): Sums of TF-IDF values over documents
+        """
+        self._documents = documents
+        self._term_counts = dict(term_counts or {})
+        self._document_freqs = dict(document_freqs or {})
+        self._tfidf_sums = dict(tfidf_sums or {})
+
+    def __len__(self) -> int:
+        """
+        Get the number of aggregated documents.
+
+        Returns:
+            int: Number of documents
+        """
+        return self._documents
+
+    def add_document(self, tokens: list[str], idf: dict[str, float]) -> int:
+        """
+        Add statistics of a document with lab 1 functions.
+
+        The IDF table is shared by all documents and is not validated here,
+        build_aggregate and aggregate_corpus check it once per shard.
+
+        Args:
+            tokens (list[str]): Tokens of the document without stop words
+            idf (dict[str, float]): Inverse document frequency values
+
+        Returns:
+            int: 0 if the document is added, 1 otherwise.
+
+        In case of corrupt input arguments, 1 is returned.
+        """
+        frequencies = calculate_frequencies(tokens)
+        if frequencies is None or not isinstance(idf, dict):
+            return 1
+        self._documents += 1
+        for token, count in frequencies.items():
+            self._term_counts[token] = self._term_counts.get(token, 0) + count
+            self._document_freqs[token] = self._document_freqs.get(token, 0) + 1
+        for token, value in (calculate_tf(frequencies) or {}).items():
+            self._tfidf_sums[token] = (self._tfidf_sums.get(token, 0.0)
+                                       + value * idf.get(token, UNKNOWN_TERM_IDF))
+        return 0
+
+    def get_term_counts(self) -> dict[str, int]:
+        """
+        Get token occurrences in all documents.
+
+        Returns:
+            dict[str, int]: Occurrences by token
+        """
+        return self._term_counts
+
+    def get_document_freqs(self) -> dict[str, int]:
+        """
+        Get numbers of documents including every token.
+
+        Returns:
+            dict[str, int]: Document frequencies by token
+        """
+        return self._document_freqs
+
+    def get_tfidf_sums(self) -> dict[str, float]:
+        """
+        Get sums of TF-IDF values over documents.
+
+        Returns:
+            dict[str, float]: Sums of TF-IDF values by token
+        """
+        return self._tfidf_sums
+
+    def update(self, other: "CorpusAggregate") -> None:
+        """
+        Add statistics of another shard to this aggregate in place.
+
+        Args:
+            other (CorpusAggregate): Aggregate of another shard
+        """
+        self._documents += len(other)
+        for counts, other_counts in (
+            (self._term_counts, other.get_term_counts()),
+            (self._document_freqs, other.get_document_freqs()),
+        ):
+            for token, count in other_counts.items():
+                counts[token] = counts.get(token, 0) + count
+        for token, value in other.get_tfidf_sums().items():
+            self._tfidf_sums[token] = self._tfidf_sums.get(token, 0.0) + value
+
+    def merge(self, other: "CorpusAggregate") -> "CorpusAggregate":
+        """
+        Combine statistics of two shards into a new aggregate.
+
+        Args:
+            other (CorpusAggregate): Aggregate of another shard
+
+        Returns:
+            CorpusAggregate: Aggregate of both shards
+        """
+        merged = CorpusAggregate()
+        merged.update(self)
+        merged.update(other)
+        return merged
+
+    def get_top(self, top: int, metric: MetricType = "tfidf") -> list[str] | None:
+        """
+        Extract the most characteristic tokens of the corpus with a bounded heap.
+
+        Ties are broken alphabetically, so the result does not depend on the
+        order in which shards were merged.
+
+        Args:
+            top (int): Number of tokens to extract
+            metric (MetricType): Statistics to rank tokens by: occurrences,
+                number of documents or sum of TF-IDF values
+
+        Returns:
+            list[str] | None: Top-K tokens.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        statistics = self.to_dict().get({
+            "count": "term_counts",
+            "documents": "document_freqs",
+            "tfidf": "tfidf_sums",
+        }.get(metric, ""))
+        if statistics is None or not check_positive_int(top):
+            return None
+        return [item[0] for item in heapq.nsmallest(
+            top, statistics.items(), key=lambda item: (-item[1], item[0])
+        )]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the aggregate to a JSON-serializable dictionary to send it elsewhere.
+
+        Returns:
+            dict[str, Any]: Statistics of the aggregate
+        """
+        return {
+            "documents": self._documents,
+            "term_counts": self._term_counts,
+            "document_freqs": self._document_freqs,
+            "tfidf_sums": self._tfidf_sums,
+        }
+
+
+def load_aggregate(data: dict[str, Any]) -> CorpusAggregate | None:
+    """
+    Restore an aggregate from the dictionary made by CorpusAggregate.to_dict.
+
+    Args:
+        data (dict[str, Any]): Statistics of the aggregate
+
+    Returns:
+        CorpusAggregate | None: Restored aggregate.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("documents"), int)
+        or not check_dict(data.get("term_counts"), str, int, True)
+        or not check_dict(data.get("document_freqs"), str, int, True)
+        or not check_dict(data.get("tfidf_sums"), str, float, True)
+    ):
+        return None
+    return CorpusAggregate(
+        data["documents"], data["term_counts"], data["document_freqs"], data["tfidf_sums"]
+    )
+
+
+def build_aggregate(
+    texts: Iterable[str], stop_words: list[str] | frozenset[str], idf: dict[str, float]
+) -> CorpusAggregate | None:
+    """
+    Aggregate statistics of a shard of documents.
+
+    Args:
+        texts (Iterable[str]): Original texts of the shard
+        stop_words (list[str] | frozenset[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+
+    Returns:
+        CorpusAggregate | None: Aggregate of the shard.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not check_dict(idf, str, float, True):
+        return None
+    if isinstance(stop_words, list):
+        if not check_list(stop_words, str, True):
+            return None
+        stop_words = frozenset(stop_words)
+    aggregate = CorpusAggregate()
+    for text in texts:
+        tokens = clean_and_tokenize_fast(text)
+        if tokens is None:
+            return None
+        with validation_policy("off"):
+            tokens = remove_stop_words(tokens, stop_words)
+            if tokens is None or aggregate.add_document(tokens, idf):
+                return None
+    return aggregate
+
+
+def merge_aggregates(aggregates: Iterable[CorpusAggregate]) -> CorpusAggregate:
+    """
+    Combine aggregates of many shards.
+
+    Args:
+        aggregates (Iterable[CorpusAggregate]): Aggregates of shards
+
+    Returns:
+        CorpusAggregate: Aggregate of all shards
+    """
+    merged = CorpusAggregate()
+    for aggregate in aggregates:
+        merged.update(aggregate)
+    return merged
+
+
+#: Stop words and IDF values of the current worker process, set by _init_worker
+_WORKER_STATE: dict[str, tuple[frozenset[str], dict[str, float]]] = {}
+
+
+def _init_worker(stop_words: frozenset[str], idf: dict[str, float]) -> None:
+    """
+    Store shared resources in a worker process.
+
+    Args:
+        stop_words (frozenset[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+    """
+    _WORKER_STATE["resources"] = (stop_words, idf)
+
+
+def _aggregate_in_worker(texts: list[str]) -> CorpusAggregate | None:
+    """
+    Aggregate a shard with resources of a worker process.
+
+    Args:
+        texts (list[str]): Original texts of the shard
+
+    Returns:
+        CorpusAggregate | None: Aggregate of the shard.
+
+    In case the worker is not initialized, None is returned.
+    """
+    resources = _WORKER_STATE.get("resources")
+    if resources is None:
+        return None
+    return build_aggregate(texts, *resources)
+
+
+def aggregate_corpus(
+    shards: Iterable[list[str]],
+    stop_words: list[str],
+    idf: dict[str, float],
+    processes: int | None = None,
+) -> CorpusAggregate | None:
+    """
+    Aggregate shards of a corpus on a pool of processes and merge the results.
+
+    Args:
+        shards (Iterable[list[str]]): Original texts split into shards
+        stop_words (list[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+        processes (int | None): Number of worker processes, all cores by default
+
+    Returns:
+        CorpusAggregate | None: Aggregate of the whole corpus.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if (
+        not check_list(stop_words, str, True)
+        or not check_dict(idf, str, float, True)
+        or (processes is not None and not check_positive_int(processes))
+    ):
+        return None
+    merged = CorpusAggregate()
+    with Pool(processes, initializer=_init_worker, initargs=(frozenset(stop_words), idf)) as pool:
+        for aggregate in pool.imap_unordered(_aggregate_in_worker, shards):
+            if aggregate is None:
+                return None
+            merged.update(aggregate)
+    return merged
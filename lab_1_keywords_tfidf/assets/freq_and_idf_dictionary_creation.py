@@ -3,27 +3,48 @@ Example of frequency and IDF dictionaries creation.
 """
 
 import json
-import shutil
 import subprocess
 import zipfile
 from collections import Counter
-from functools import reduce
+from importlib.util import find_spec
 from math import log
+from multiprocessing import Pool
 from pathlib import Path
-
-from spacy.tokens import Token
+from typing import Iterable, Iterator, TYPE_CHECKING
 
 from config.cli_unifier import choose_python_exe
+from lab_1_keywords_tfidf.deduplication import iter_unique
 
 ASSETS_PATH = Path(__file__).parent
 ZIP_FILE = ASSETS_PATH / "fairy_tales.zip"
-TEXTS_FOLDER = ASSETS_PATH / "fairy_tales"
 FREQUENCY_PATH = ASSETS_PATH / "corpus_frequencies.json"
 IDF_PATH = ASSETS_PATH / "IDF.json"
+MODEL_NAME = "ru_core_news_sm"
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Token
+
+#: spaCy model of the current worker process, set by load_model
+_WORKER_STATE: dict[str, "Language"] = {}
+
+
+def load_model(model_name: str = MODEL_NAME) -> None:
+    """
+    Load the spaCy model of the current process.
+
+    spaCy is imported here, so that the module can be imported without it.
+
+    Args:
+        model_name (str): Name of the installed spaCy model.
+    """
+    import spacy  # pylint: disable=import-outside-toplevel
+
+    _WORKER_STATE["nlp"] = spacy.load(model_name)
 
 
 # tokenize texts
-def token_is_valid(token: Token) -> bool:
+def token_is_valid(token: "Token") -> bool:
     """
     Check if the token is valid.
 
@@ -46,67 +67,77 @@ def tokenize(text: str) -> list[str]:
     Returns:
         list[str]: List of tokens.
     """
-    return [token.text.lower() for token in NLP(text) if token_is_valid(token)]
+    return [token.text.lower() for token in _WORKER_STATE["nlp"](text) if token_is_valid(token)]
 
 
-def extend_tokens(all_tokens: list[str], tokens: list[str]) -> list[str]:
+def read_texts(zip_file: Path) -> Iterator[str]:
     """
-    Extend tokens list.
+    Read texts from the archive one by one without extracting it to disk.
 
     Args:
-        all_tokens (list[str]): List to extend.
-        tokens (list[str]): List to add.
+        zip_file (Path): Path to the archive.
+
+    Yields:
+        str: Text of a tale.
+    """
+    with zipfile.ZipFile(zip_file, "r") as zip_ref:
+        for name in zip_ref.namelist():
+            if not name.endswith("/"):
+                yield zip_ref.read(name).decode("utf-8")
+
+
+def count_statistics(tokenized_texts: Iterable[list[str]]) -> tuple[Counter, Counter, int]:
+    """
+    Count term and document frequencies in one pass per document.
+
+    Args:
+        tokenized_texts (Iterable[list[str]]): Tokens of every text.
 
     Returns:
-        list[str]: Extended list of tokens.
+        tuple[Counter, Counter, int]: Term frequencies, document frequencies
+        and the number of texts.
     """
-    return all_tokens + tokens
+    frequency_dict: Counter = Counter()
+    n_including_docs: Counter = Counter()
+    texts_count = 0
+    for tokens in tokenized_texts:
+        frequency_dict.update(tokens)
+        n_including_docs.update(set(tokens))
+        texts_count += 1
+    return frequency_dict, n_including_docs, texts_count
 
 
-def main() -> None:
+def main(processes: int | None = None) -> None:
     """
     Creates the dictionaries.
-    """
-    # unpack text files
-    with zipfile.ZipFile(ZIP_FILE, "r") as zip_ref:
-        zip_ref.extractall(TEXTS_FOLDER)
 
-    # read the texts
-    texts = []
-    for tale in TEXTS_FOLDER.iterdir():
-        with open(tale, "r", encoding="utf-8") as file:
-            texts.append(file.read())
+    Near-duplicate variants of tales are skipped, so that they do not inflate
+    corpus and document frequencies.
 
-    tokenized_texts = list(map(tokenize, texts))
-    all_tokens = reduce(extend_tokens, tokenized_texts)
+    Args:
+        processes (int | None): Number of processes tokenizing texts, all cores by default.
+    """
+    with Pool(processes, initializer=load_model) as pool:
+        frequency_dict, n_including_docs, texts_count = count_statistics(
+            pool.imap(tokenize, (text for _, text in iter_unique(read_texts(ZIP_FILE))))
+        )
 
     # create frequency dict
-    frequency_dict = Counter(all_tokens)
     with open(FREQUENCY_PATH, "w", encoding="utf-8") as file:
         json.dump(frequency_dict, file, ensure_ascii=False)
 
     # create IDF dict
-    unique_tokens = [list(set(tokens)) for tokens in tokenized_texts]
-    unique_occurrences = reduce(extend_tokens, unique_tokens)
-    n_including_docs = Counter(unique_occurrences)
-    idf = {key: log(len(texts) / (value + 1)) for key, value in n_including_docs.items()}
+    idf = {key: log(texts_count / (value + 1)) for key, value in n_including_docs.items()}
     with open(IDF_PATH, "w", encoding="utf-8") as file:
         json.dump(idf, file, ensure_ascii=False)
 
-    # clean up
-    shutil.rmtree(TEXTS_FOLDER)
-
     print("Everything is generated!")
 
 
 if __name__ == "__main__":
-    try:
-        import spacy
-
-        subprocess.run(
-            [choose_python_exe(), "-m", "spacy", "download", "ru_core_news_sm"], check=True
-        )
-        NLP = spacy.load("ru_core_news_sm")
-        main()
-    except ModuleNotFoundError as exc:
+    if find_spec("spacy") is None or subprocess.run(
+        [choose_python_exe(), "-m", "spacy", "download", MODEL_NAME], check=False
+    ).returncode:
         print("Couldn't download the model.")
+    else:
+        main()
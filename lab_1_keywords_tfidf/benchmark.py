@@ -0,0 +1,555 @@
+"""
+Keyword extraction benchmarks
+"""
+
+# pylint:disable=duplicate-code
+import argparse
+import json
+import platform
+import random
+import subprocess
+import timeit
+import tracemalloc
+import zipfile
+from array import array
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from lab_1_keywords_tfidf.main import (
+    calculate_chi_values,
+    calculate_expected_frequency,
+    calculate_frequencies,
+    calculate_tf,
+    calculate_tfidf,
+    clean_and_tokenize,
+    clean_and_tokenize_fast,
+    extract_significant_words,
+    get_top_n,
+    remove_stop_words,
+)
+from lab_1_keywords_tfidf.pipeline import ChiSquaredScorer
+from lab_1_keywords_tfidf.sparse_matrix import build_matrix
+from lab_1_keywords_tfidf.vocabulary_index import VocabularyIndex
+
+ASSETS_PATH = Path(__file__).parent / "assets"
+
+#: Default path of the benchmark suite results, relative to the working directory
+RESULTS_PATH = Path("benchmark_results.json")
+
+#: Stages of keyword extraction in order of execution
+STAGES = ("tokenize", "remove_stop_words", "frequencies", "tf", "tfidf", "chi_squared", "top_n")
+
+
+@dataclass(frozen=True)
+class SuiteConfig:
+    """
+    Settings of the benchmark suite.
+
+    Attributes:
+        documents (int): Number of synthetic texts
+        document_length (int): Number of words in a synthetic text
+        vocabulary_size (int): Number of the most frequent corpus words to draw from
+        exponent (float): Exponent of the Zipf distribution
+        seed (int): Seed of the synthetic corpus
+        repeats (int): Number of time measurements of every stage
+    """
+
+    documents: int = 200
+    document_length: int = 1000
+    vocabulary_size: int = 20000
+    exponent: float = 1.0
+    seed: int = 0
+    repeats: int = 3
+
+
+def read_fairy_tales() -> list[str]:
+    """
+    Read texts of fairy tales from the archive without extracting it to disk.
+
+    Returns:
+        list[str]: Texts of fairy tales
+    """
+    with zipfile.ZipFile(ASSETS_PATH / "fairy_tales.zip", "r") as archive:
+        return [archive.read(name).decode("utf-8") for name in archive.namelist()
+                if not name.endswith("/")]
+
+
+def read_assets() -> tuple[list[str], dict[str, float], dict[str, int]]:
+    """
+    Read stop words, IDF values and corpus frequencies of the lab.
+
+    Returns:
+        tuple[list[str], dict[str, float], dict[str, int]]: Stop words, IDF values
+            and corpus frequencies
+    """
+    with open(ASSETS_PATH / "stop_words.txt", "r", encoding="utf-8") as file:
+        stop_words = file.read().split("\n")
+    with open(ASSETS_PATH / "IDF.json", "r", encoding="utf-8") as file:
+        idf = json.load(file)
+    with open(ASSETS_PATH / "corpus_frequencies.json", "r", encoding="utf-8") as file:
+        corpus_freqs = json.load(file)
+    return stop_words, idf, corpus_freqs
+
+
+def generate_zipf_corpus(
+    vocabulary: list[str],
+    documents: int,
+    document_length: int,
+    exponent: float = 1.0,
+    seed: int = 0,
+) -> list[str]:
+    """
+    Generate texts whose word frequencies follow Zipf's law.
+
+    The word of rank r is drawn with probability proportional to 1 / r ** exponent,
+    and sentences of random length end with a period, so the texts exercise
+    tokenization as well. The same arguments always give the same corpus.
+
+    Args:
+        vocabulary (list[str]): Words ordered by rank, the most frequent first
+        documents (int): Number of texts
+        document_length (int): Number of words in a text
+        exponent (float): Exponent of the Zipf distribution
+        seed (int): Seed of the random generator
+
+    Returns:
+        list[str]: Generated texts
+    """
+    generator = random.Random(seed)
+    cumulative_weights = []
+    total = 0.0
+    for rank in range(1, len(vocabulary) + 1):
+        total += 1 / rank ** exponent
+        cumulative_weights.append(total)
+    texts = []
+    for _ in range(documents):
+        words = generator.choices(vocabulary, cum_weights=cumulative_weights, k=document_length)
+        sentences = []
+        start = 0
+        while start < len(words):
+            end = start + generator.randint(5, 20)
+            sentences.append(" ".join(words[start:end]).capitalize() + ".")
+            start = end
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def get_zipf_vocabulary(corpus_freqs: dict[str, int], size: int) -> list[str]:
+    """
+    Rank words of the corpus frequencies to use them as a synthetic vocabulary.
+
+    Args:
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+        size (int): Number of words to take
+
+    Returns:
+        list[str]: The most frequent words, ties broken alphabetically
+    """
+    ranked = sorted(corpus_freqs.items(), key=lambda item: (-item[1], item[0]))
+    return [word for word, _ in ranked[:size]]
+
+
+def score_with_chain(
+    frequencies: dict[str, int], corpus_freqs: dict[str, int]
+) -> dict[str, float] | None:
+    """
+    Select significant tokens with the chain of chi-squared functions of main.py.
+
+    Args:
+        frequencies (dict[str, int]): Token frequencies in document
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+
+    Returns:
+        dict[str, float] | None: Dictionary with significant tokens
+    """
+    expected = calculate_expected_frequency(frequencies, corpus_freqs) or {}
+    return extract_significant_words(calculate_chi_values(expected, frequencies) or {}, 0.001)
+
+
+def measure_stage(function: Callable[[Any], object], inputs: list[Any], repeats: int) -> tuple[
+    list[Any], float, int
+]:
+    """
+    Apply a stage to every input, measuring the best time and the peak memory.
+
+    Args:
+        function (Callable[[Any], object]): Stage to measure
+        inputs (list[Any]): Outputs of the previous stage
+        repeats (int): Number of time measurements
+
+    Returns:
+        tuple[list[Any], float, int]: Outputs of the stage, the best time in seconds
+            and the peak of memory allocated while running the stage once
+    """
+    seconds = time_per_text(function, inputs, repeats)
+    tracemalloc.start()
+    try:
+        outputs = [function(item) for item in inputs]
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return outputs, seconds, peak
+
+
+def benchmark_stages(
+    texts: list[str],
+    stop_words: list[str],
+    idf: dict[str, float],
+    corpus_freqs: dict[str, int],
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """
+    Time every stage of keyword extraction with the functions of main.py.
+
+    Every stage gets the outputs of the previous one, so it is measured in
+    isolation over exactly the data the pipeline passes to it.
+
+    Args:
+        texts (list[str]): Texts to extract keywords from
+        stop_words (list[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+        repeats (int): Number of time measurements of every stage
+
+    Returns:
+        dict[str, Any]: Sizes of the corpus and seconds, tokens per second and
+            peak memory in bytes of every stage
+    """
+    tokens = [clean_and_tokenize(text) or [] for text in texts]
+    tokens_count = sum(len(document) for document in tokens)
+    stages: dict[str, tuple[Callable[[Any], Any], str]] = {
+        "tokenize": (clean_and_tokenize, "texts"),
+        "remove_stop_words": (lambda document: remove_stop_words(document, stop_words), "tokenize"),
+        "frequencies": (calculate_frequencies, "remove_stop_words"),
+        "tf": (calculate_tf, "frequencies"),
+        "tfidf": (lambda term_freq: calculate_tfidf(term_freq, idf), "tf"),
+        "chi_squared": (lambda frequencies: score_with_chain(frequencies, corpus_freqs),
+                        "frequencies"),
+        "top_n": (lambda tfidf: get_top_n(tfidf, 10), "tfidf"),
+    }
+    outputs: dict[str, list[Any]] = {"texts": texts}
+    results = {}
+    for stage in STAGES:
+        function, source = stages[stage]
+        outputs[stage], seconds, peak = measure_stage(function, outputs[source], repeats)
+        results[stage] = {
+            "seconds": seconds,
+            "tokens_per_second": tokens_count / seconds,
+            "peak_memory_bytes": peak,
+        }
+    return {"documents": len(texts), "tokens": tokens_count, "stages": results}
+
+
+def get_revision() -> str | None:
+    """
+    Get the git revision of the working tree.
+
+    Returns:
+        str | None: Hash of the current commit, None outside a git repository
+    """
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent,
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run_suite(config: SuiteConfig = SuiteConfig()) -> dict[str, Any]:
+    """
+    Benchmark every stage on a synthetic Zipfian corpus and on fairy_tales.zip.
+
+    Args:
+        config (SuiteConfig): Settings of the synthetic corpus and measurements
+
+    Returns:
+        dict[str, Any]: Environment, settings and results for every corpus
+    """
+    stop_words, idf, corpus_freqs = read_assets()
+    corpora = {
+        "zipf": generate_zipf_corpus(
+            get_zipf_vocabulary(corpus_freqs, config.vocabulary_size),
+            config.documents, config.document_length, config.exponent, config.seed
+        ),
+        "fairy_tales.zip": read_fairy_tales(),
+    }
+    return {
+        "environment": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": get_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "settings": asdict(config),
+        "corpora": {name: benchmark_stages(texts, stop_words, idf, corpus_freqs, config.repeats)
+                    for name, texts in corpora.items()},
+    }
+
+
+def time_per_text(function: Callable[[Any], object], texts: list[Any], repeats: int) -> float:
+    """
+    Measure the best time of applying a function to every text.
+
+    Args:
+        function (Callable[[Any], object]): Function to measure
+        texts (list[Any]): Texts or other documents to process
+        repeats (int): Number of measurements
+
+    Returns:
+        float: The best time in seconds
+    """
+    return min(timeit.repeat(lambda: [function(text) for text in texts], number=1, repeat=repeats))
+
+
+def benchmark_tokenizers(texts: list[str], repeats: int = 5) -> dict[str, float]:
+    """
+    Compare tokenization throughput of the reference and the fast tokenizers.
+
+    Args:
+        texts (list[str]): Texts to tokenize
+        repeats (int): Number of measurements
+
+    Returns:
+        dict[str, float]: Tokens per second for every tokenizer
+    """
+    tokens_count = sum(len(clean_and_tokenize(text) or []) for text in texts)
+    tokenizers = {
+        "clean_and_tokenize": clean_and_tokenize,
+        "clean_and_tokenize_fast": clean_and_tokenize_fast,
+    }
+    return {name: tokens_count / time_per_text(tokenizer, texts, repeats)
+            for name, tokenizer in tokenizers.items()}
+
+
+def benchmark_chi_squared(
+    texts: list[str], stop_words: list[str], corpus_freqs: dict[str, int], repeats: int = 5
+) -> dict[str, float]:
+    """
+    Compare the chain of chi-squared functions with the fused scorer.
+
+    Args:
+        texts (list[str]): Texts to score
+        stop_words (list[str]): Tokens to exclude
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+        repeats (int): Number of measurements
+
+    Returns:
+        dict[str, float]: Documents per second for every way of scoring
+    """
+    documents = []
+    for text in texts:
+        tokens = remove_stop_words(clean_and_tokenize(text) or [], stop_words) or []
+        documents.append(calculate_frequencies(tokens) or {})
+    scorer = ChiSquaredScorer(corpus_freqs)
+
+    scorers: dict[str, Callable[[dict[str, int]], dict[str, float] | None]] = {
+        "chain of main.py functions": lambda document: score_with_chain(document, corpus_freqs),
+        "ChiSquaredScorer": scorer.score,
+    }
+    assert (
+        [scorers["chain of main.py functions"](document) for document in documents]
+        == [scorer.score(document) for document in documents]
+    ), "Fused scorer differs from chain"
+    return {name: len(documents) / time_per_text(function, documents, repeats)
+            for name, function in scorers.items()}
+
+
+def measure_memory(function: Callable[[], object]) -> tuple[object, int]:
+    """
+    Measure memory allocated by a function and kept in its result.
+
+    Args:
+        function (Callable[[], object]): Function to measure
+
+    Returns:
+        tuple[object, int]: Result of the function and allocated bytes
+    """
+    tracemalloc.start()
+    try:
+        result = function()
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, allocated
+
+
+def benchmark_document_term_matrix(
+    texts: list[str], stop_words: list[str], idf: dict[str, float], repeats: int = 5
+) -> dict[str, tuple[float, int]]:
+    """
+    Compare lists of per-document TF-IDF dictionaries with a CSR matrix.
+
+    Args:
+        texts (list[str]): Texts to vectorize
+        stop_words (list[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+        repeats (int): Number of measurements
+
+    Returns:
+        dict[str, tuple[float, int]]: Documents per second and bytes kept in memory
+            for every representation
+    """
+    documents = [remove_stop_words(clean_and_tokenize(text) or [], stop_words) or []
+                 for text in texts]
+
+    def build_dicts() -> list[dict[str, float]]:
+        """
+        Calculate TF-IDF dictionaries with the chain of main.py functions.
+
+        Returns:
+            list[dict[str, float]]: TF-IDF values of every document
+        """
+        return [calculate_tfidf(calculate_tf(calculate_frequencies(tokens) or {}) or {}, idf) or {}
+                for tokens in documents]
+
+    builders = {
+        "list of TF-IDF dictionaries": build_dicts,
+        "DocumentTermMatrix": lambda: build_matrix(documents, idf),
+    }
+    results = {}
+    for name, builder in builders.items():
+        seconds = min(timeit.repeat(builder, number=1, repeat=repeats))
+        results[name] = (len(documents) / seconds, measure_memory(builder)[1])
+    return results
+
+
+def benchmark_vocabulary_index(
+    texts: list[str],
+    stop_words: list[str],
+    idf: dict[str, float],
+    corpus_freqs: dict[str, int],
+    repeats: int = 5,
+) -> dict[str, tuple[float, int]]:
+    """
+    Compare TF-IDF and chi-squared values of main.py dictionaries with VocabularyIndex arrays.
+
+    Args:
+        texts (list[str]): Texts to score
+        stop_words (list[str]): Tokens to exclude
+        idf (dict[str, float]): Inverse document frequency values
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+        repeats (int): Number of measurements
+
+    Returns:
+        dict[str, tuple[float, int]]: Documents per second and bytes kept in memory
+            for every way of scoring
+    """
+    documents = [remove_stop_words(clean_and_tokenize(text) or [], stop_words) or []
+                 for text in texts]
+    index = VocabularyIndex(idf, corpus_freqs)
+
+    def score_dicts() -> list[tuple[dict[str, float], dict[str, float]]]:
+        """
+        Calculate TF-IDF and chi-squared values with the chain of main.py functions.
+
+        Returns:
+            list[tuple[dict[str, float], dict[str, float]]]: Values of every document
+        """
+        values = []
+        for tokens in documents:
+            frequencies = calculate_frequencies(tokens) or {}
+            expected = calculate_expected_frequency(frequencies, corpus_freqs) or {}
+            values.append((calculate_tfidf(calculate_tf(frequencies) or {}, idf) or {},
+                           calculate_chi_values(expected, frequencies) or {}))
+        return values
+
+    def score_arrays() -> list[tuple[array, array]]:
+        """
+        Calculate TF-IDF and chi-squared values over the vocabulary index.
+
+        Returns:
+            list[tuple[array, array]]: Values of every document
+        """
+        values = []
+        for tokens in documents:
+            ids, counts, _ = index.count(tokens) or (array('q'), array('q'), ())
+            values.append((index.calculate_tfidf(ids, index.calculate_tf(counts)),
+                           index.calculate_chi(counts, index.calculate_expected(ids, counts))))
+        return values
+
+    scorers: dict[str, Callable[[], object]] = {
+        "chain of main.py functions": score_dicts,
+        "VocabularyIndex": score_arrays,
+    }
+    results = {}
+    for name, scorer in scorers.items():
+        seconds = min(timeit.repeat(scorer, number=1, repeat=repeats))
+        results[name] = (len(documents) / seconds, measure_memory(scorer)[1])
+    return results
+
+
+def report_suite(results: dict[str, Any], output: Path) -> None:
+    """
+    Store results of the stage suite and print their throughput.
+
+    Args:
+        results (dict[str, Any]): Results made by run_suite
+        output (Path): JSON file to store results
+    """
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=4)
+    for corpus_name, corpus in results["corpora"].items():
+        print(f"Stages on {corpus_name} "
+              f"({corpus['documents']} texts, {corpus['tokens']:,} tokens):")
+        for stage, measurement in corpus["stages"].items():
+            print(f"    {stage}: {measurement['tokens_per_second']:,.0f} tokens/s, "
+                  f"peak {measurement['peak_memory_bytes']:,} bytes")
+    print(f"Results are stored in {output}")
+
+
+def report_comparisons() -> None:
+    """
+    Print throughput of alternative implementations on the lab corpora.
+    """
+    with open(ASSETS_PATH / "Дюймовочка.txt", "r", encoding="utf-8") as file:
+        corpora = {"Дюймовочка.txt": [file.read()], "fairy_tales.zip": read_fairy_tales()}
+    for corpus_name, texts in corpora.items():
+        print(f"Tokenization of {corpus_name}:")
+        for name, throughput in benchmark_tokenizers(texts).items():
+            print(f"    {name}: {throughput:,.0f} tokens/s")
+    stop_words, idf, corpus_freqs = read_assets()
+    print("Chi-squared scoring of fairy_tales.zip:")
+    for name, throughput in benchmark_chi_squared(
+        corpora["fairy_tales.zip"], stop_words, corpus_freqs
+    ).items():
+        print(f"    {name}: {throughput:,.0f} documents/s")
+    print("Document-term representation of fairy_tales.zip:")
+    for name, (throughput, size) in benchmark_document_term_matrix(
+        corpora["fairy_tales.zip"], stop_words, idf
+    ).items():
+        print(f"    {name}: {throughput:,.0f} documents/s, {size:,} bytes")
+    print("TF-IDF and chi-squared values of fairy_tales.zip:")
+    for name, (throughput, size) in benchmark_vocabulary_index(
+        corpora["fairy_tales.zip"], stop_words, idf, corpus_freqs
+    ).items():
+        print(f"    {name}: {throughput:,.0f} documents/s, {size:,} bytes")
+
+
+def main() -> None:
+    """
+    Launches benchmarks.
+    """
+    defaults = SuiteConfig()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH,
+                        help="JSON file to store results of the stage suite, "
+                             "relative to the working directory")
+    parser.add_argument("--documents", type=int, default=defaults.documents)
+    parser.add_argument("--document-length", type=int, default=defaults.document_length)
+    parser.add_argument("--vocabulary-size", type=int, default=defaults.vocabulary_size)
+    parser.add_argument("--exponent", type=float, default=defaults.exponent)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeats", type=int, default=defaults.repeats)
+    arguments = parser.parse_args()
+
+    config = SuiteConfig(arguments.documents, arguments.document_length,
+                         arguments.vocabulary_size, arguments.exponent, arguments.seed,
+                         arguments.repeats)
+    report_suite(run_suite(config), arguments.output)
+    report_comparisons()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Lab 1.
+
+Near-duplicate detection with MinHash signatures and locality-sensitive hashing
+"""
+
+import hashlib
+from array import array
+from typing import Iterable, Iterator
+
+from lab_1_keywords_tfidf.incremental_idf import DocumentFrequencyIndex
+from lab_1_keywords_tfidf.main import (
+    check_list,
+    check_positive_int,
+    clean_and_tokenize,
+    remove_stop_words,
+)
+
+#: Largest value of a signature component
+MAX_HASH = (1 << 32) - 1
+
+
+def get_shingles(tokens: list[str], size: int = 3) -> set[str] | None:
+    """
+    Collect contiguous token sequences of a document.
+
+    Documents shorter than a shingle give a single shingle of all their tokens.
+
+    Args:
+        tokens (list[str]): Tokens of a document, for example from clean_and_tokenize
+        size (int): Number of tokens in a shingle
+
+    Returns:
+        set[str] | None: Shingles with tokens joined by spaces.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not check_list(tokens, str, True) or not check_positive_int(size):
+        return None
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[start:start + size]) for start in range(len(tokens) - size + 1)}
+
+
+def estimate_jaccard(first: array, second: array) -> float:
+    """
+    Estimate Jaccard similarity of shingle sets by their MinHash signatures.
+
+    Args:
+        first (array): Signature of the first document
+        second (array): Signature of the second document
+
+    Returns:
+        float: Share of equal signature components
+    """
+    return float(sum(left == right for left, right in zip(first, second)) / len(first))
+
+
+class MinHasher:
+    """
+    Compute MinHash signatures of shingle sets.
+
+    Every shingle is hashed once with the SHAKE-128 extendable-output function
+    into as many 32-bit words as there are signature components, and each
+    component is the minimum of its word over shingles. Hashing does not depend
+    on the process hash seed, so signatures can be compared across runs.
+
+    Attributes:
+        _permutations (int): Number of signature components
+        _salt (bytes): Seed prepended to every shingle
+    """
+
+    def __init__(self, permutations: int = 128, seed: int = 1) -> None:
+        """
+        Initialize an instance of MinHasher.
+
+        Args:
+            permutations (int): Number of signature components
+            seed (int): Seed of hash functions
+        """
+        if not check_positive_int(permutations) or not isinstance(seed, int):
+            raise ValueError('Invalid input: number of permutations must be positive')
+        self._permutations = permutations
+        self._salt = f"{seed}:".encode("utf-8")
+
+    def __len__(self) -> int:
+        """
+        Get the number of signature components.
+
+        Returns:
+            int: Length of signatures
+        """
+        return self._permutations
+
+    def get_signature(self, shingles: set[str]) -> array | None:
+        """
+        Compute a MinHash signature of a shingle set.
+
+        Args:
+            shingles (set[str]): Shingles of a document
+
+        Returns:
+            array | None: Signature components, all equal to the largest 32-bit value
+                for an empty set.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(shingles, (set, frozenset)) or not all(
+            isinstance(shingle, str) for shingle in shingles
+        ):
+            return None
+        if not shingles:
+            return array('I', [MAX_HASH]) * self._permutations
+        size = 4 * self._permutations
+        hashes = [
+            array('I', hashlib.shake_128(self._salt + shingle.encode("utf-8")).digest(size))
+            for shingle in shingles
+        ]
+        return array('I', map(min, zip(*hashes)))
+
+
+class LshIndex:
+    """
+    Banded locality-sensitive hashing index of MinHash signatures.
+
+    Signatures are split into bands of rows; documents sharing all rows of at
+    least one band become candidates. Documents with Jaccard similarity s are
+    candidates with probability 1 - (1 - s ** rows) ** bands, so only a small
+    part of the index is compared with a query.
+
+    Attributes:
+        _rows (int): Number of signature components in a band
+        _buckets (list[dict[bytes, list[int]]]): Documents by band values, for every band
+        _signatures (list[array]): Signatures of documents by identifier
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 8) -> None:
+        """
+        Initialize an instance of LshIndex.
+
+        Args:
+            bands (int): Number of bands
+            rows (int): Number of signature components in a band
+        """
+        if not check_positive_int(bands) or not check_positive_int(rows):
+            raise ValueError('Invalid input: bands and rows must be positive')
+        self._rows = rows
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+        self._signatures: list[array] = []
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed documents.
+
+        Returns:
+            int: Number of documents
+        """
+        return len(self._signatures)
+
+    def add(self, signature: array) -> int | None:
+        """
+        Index a signature.
+
+        Args:
+            signature (array): MinHash signature of bands * rows components
+
+        Returns:
+            int | None: Identifier of the document, equal to the number of documents added before.
+
+        In case of signatures of wrong length, None is returned.
+        """
+        if not self._check_signature(signature):
+            return None
+        document_id = len(self._signatures)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._get_band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(document_id)
+        return document_id
+
+    def query(self, signature: array, threshold: float = 0.8) -> list[int] | None:
+        """
+        Find indexed documents similar to a signature.
+
+        Candidates sharing a band are verified by estimated Jaccard similarity.
+
+        Args:
+            signature (array): MinHash signature of bands * rows components
+            threshold (float): Minimal estimated Jaccard similarity in range (0, 1]
+
+        Returns:
+            list[int] | None: Identifiers of similar documents in ascending order.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if (
+            not self._check_signature(signature)
+            or not isinstance(threshold, (int, float))
+            or isinstance(threshold, bool)
+            or not 0 < threshold <= 1
+        ):
+            return None
+        candidates: set[int] = set()
+        for band, key in enumerate(self._get_band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        return sorted(candidate for candidate in candidates
+                      if estimate_jaccard(signature, self._signatures[candidate]) >= threshold)
+
+    def _check_signature(self, signature: array) -> bool:
+        """
+        Check that a signature fits the bands of the index.
+
+        Args:
+            signature (array): MinHash signature
+
+        Returns:
+            bool: True if the signature is an array of bands * rows components
+        """
+        return isinstance(signature, array) and len(signature) == len(self._buckets) * self._rows
+
+    def _get_band_keys(self, signature: array) -> Iterator[bytes]:
+        """
+        Split a signature into hashable bands.
+
+        Args:
+            signature (array): MinHash signature
+
+        Yields:
+            bytes: Raw components of a band
+        """
+        for start in range(0, len(signature), self._rows):
+            yield signature[start:start + self._rows].tobytes()
+
+
+def iter_unique(
+    texts: Iterable[str],
+    threshold: float = 0.8,
+    shingle_size: int = 3,
+    bands: int = 16,
+    rows: int = 8,
+) -> Iterator[tuple[int, str]]:
+    """
+    Skip texts which are near-duplicates of earlier ones.
+
+    Texts are shingled over clean_and_tokenize tokens and processed as a
+    stream, so the first variant of every group of near-duplicates is kept.
+    A text which is not a string raises ValueError when it is reached.
+
+    Args:
+        texts (Iterable[str]): Texts to deduplicate
+        threshold (float): Minimal estimated Jaccard similarity of near-duplicates
+        shingle_size (int): Number of tokens in a shingle
+        bands (int): Number of LSH bands
+        rows (int): Number of signature components in a band
+
+    Yields:
+        tuple[int, str]: Position of a unique text in the input and the text
+    """
+    for position, text, _ in _iter_unique_tokens(texts, threshold, shingle_size, bands, rows):
+        yield position, text
+
+
+def _iter_unique_tokens(
+    texts: Iterable[str],
+    threshold: float = 0.8,
+    shingle_size: int = 3,
+    bands: int = 16,
+    rows: int = 8,
+) -> Iterator[tuple[int, str, list[str]]]:
+    """
+    Skip near-duplicates of earlier texts, keeping tokens of unique ones.
+
+    Args:
+        texts (Iterable[str]): Texts to deduplicate
+        threshold (float): Minimal estimated Jaccard similarity of near-duplicates
+        shingle_size (int): Number of tokens in a shingle
+        bands (int): Number of LSH bands
+        rows (int): Number of signature components in a band
+
+    Yields:
+        tuple[int, str, list[str]]: Position of a unique text in the input,
+            the text and its clean_and_tokenize tokens
+    """
+    if (
+        not isinstance(threshold, (int, float))
+        or isinstance(threshold, bool)
+        or not 0 < threshold <= 1
+    ):
+        raise ValueError('Invalid input: threshold must be in range (0, 1]')
+    hasher = MinHasher(bands * rows)
+    index = LshIndex(bands, rows)
+    for position, text in enumerate(texts):
+        tokens = clean_and_tokenize(text)
+        if tokens is None:
+            raise ValueError('Invalid input: texts must be strings')
+        signature = hasher.get_signature(get_shingles(tokens, shingle_size) or set())
+        if signature is not None and not index.query(signature, threshold):
+            index.add(signature)
+            yield position, text, tokens
+
+
+def build_deduplicated_index(
+    texts: Iterable[str], stop_words: list[str], threshold: float = 0.8
+) -> DocumentFrequencyIndex | None:
+    """
+    Build document frequencies of a corpus without its near-duplicates.
+
+    Documents are identified by their positions in the input, so the IDF
+    values and corpus frequencies of the index count every variant once.
+    Every text is tokenized once, for deduplication and for the index.
+
+    Args:
+        texts (Iterable[str]): Texts of the corpus
+        stop_words (list[str]): Tokens to exclude
+        threshold (float): Minimal estimated Jaccard similarity of near-duplicates
+
+    Returns:
+        DocumentFrequencyIndex | None: Index of unique texts.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if (
+        not check_list(stop_words, str, True)
+        or not isinstance(threshold, (int, float))
+        or isinstance(threshold, bool)
+        or not 0 < threshold <= 1
+    ):
+        return None
+    excluded = frozenset(stop_words)
+    document_index = DocumentFrequencyIndex()
+    try:
+        for position, _, tokens in _iter_unique_tokens(texts, threshold):
+            document_index.add_document(str(position),
+                                        remove_stop_words(tokens, excluded) or [])
+    except ValueError:
+        return None
+    return document_index
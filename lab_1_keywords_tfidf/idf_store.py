@@ -0,0 +1,277 @@
+"""
+Lab 1.
+
+Binary memory-mapped store of IDF values and corpus frequencies
+"""
+
+import json
+import math
+import mmap
+import struct
+from pathlib import Path
+
+from lab_1_keywords_tfidf.main import check_dict
+
+#: Signature of the store file
+STORE_MAGIC = b"L1IDFBIN"
+
+#: Version of the store file layout
+STORE_VERSION = 2
+
+#: Corpus count of terms missing from corpus frequencies
+MISSING_COUNT = -1
+
+#: Header layout: signature, version, number of terms, number of tokens in corpus
+HEADER_FORMAT = "<8sIIq"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+def compile_store(idf: dict[str, float], corpus_freqs: dict[str, int], path: str | Path) -> None:
+    """
+    Write IDF values and corpus frequencies to a binary store.
+
+    The file contains a header, an array of IDF values (NaN for terms missing
+    from IDF), an array of corpus counts (MISSING_COUNT for terms missing from
+    corpus frequencies), an array of term offsets and the UTF-8 terms sorted
+    bytewise, so that a reader can binary search them.
+
+    Args:
+        idf (dict[str, float]): Inverse document frequency values
+        corpus_freqs (dict[str, int]): Token frequencies in corpus
+        path (str | Path): Path of the store file
+    """
+    if not check_dict(idf, str, float, True) or not check_dict(corpus_freqs, str, int, True):
+        raise ValueError('Invalid input: corrupt IDF or corpus frequencies')
+    if not isinstance(path, (str, Path)) or not str(path):
+        raise ValueError('Invalid path')
+    encoded_terms = sorted(term.encode("utf-8") for term in {**idf, **corpus_freqs})
+    terms = [term.decode("utf-8") for term in encoded_terms]
+    offsets = [0]
+    for term in encoded_terms:
+        offsets.append(offsets[-1] + len(term))
+    count = len(terms)
+    with open(path, "wb") as file:
+        file.write(struct.pack(
+            HEADER_FORMAT, STORE_MAGIC, STORE_VERSION, count, sum(corpus_freqs.values())
+        ))
+        file.write(struct.pack(f"<{count}d", *(idf.get(term, math.nan) for term in terms)))
+        file.write(struct.pack(
+            f"<{count}q", *(corpus_freqs.get(term, MISSING_COUNT) for term in terms)
+        ))
+        file.write(struct.pack(f"<{count + 1}Q", *offsets))
+        file.write(b"".join(encoded_terms))
+
+
+def compile_assets(idf_path: str | Path, frequencies_path: str | Path, path: str | Path) -> None:
+    """
+    Compile IDF.json and corpus_frequencies.json assets into a binary store.
+
+    Args:
+        idf_path (str | Path): Path of JSON file with IDF values
+        frequencies_path (str | Path): Path of JSON file with corpus frequencies
+        path (str | Path): Path of the store file
+    """
+    with open(idf_path, "r", encoding="utf-8") as file:
+        idf = json.load(file)
+    with open(frequencies_path, "r", encoding="utf-8") as file:
+        corpus_freqs = json.load(file)
+    compile_store(idf, corpus_freqs, path)
+
+
+class IdfStore:
+    """
+    Read-only view of a binary store mapped into memory.
+
+    Nothing is deserialized on opening: lookups binary search the sorted terms
+    directly in the mapped file, and the pages are shared by all processes
+    which open the same store.
+
+    Attributes:
+        _file (BinaryIO): Opened store file
+        _map (mmap.mmap): Memory map of the store file
+        _count (int): Number of terms
+        _corpus_total (int): Number of tokens in corpus
+        _idf (memoryview): IDF values by term position
+        _counts (memoryview): Corpus counts by term position
+        _offsets (memoryview): Offsets of terms in the terms section
+        _terms_start (int): Position of the terms section in the file
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize an instance of IdfStore.
+
+        Args:
+            path (str | Path): Path of the store file
+        """
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, corpus_total = struct.unpack_from(HEADER_FORMAT, self._map)
+            idf_end = HEADER_SIZE + 8 * count
+            counts_end = idf_end + 8 * count
+            self._terms_start = counts_end + 8 * (count + 1)
+            if (
+                magic != STORE_MAGIC
+                or version != STORE_VERSION
+                or len(self._map) < self._terms_start
+            ):
+                raise ValueError('Invalid store header')
+            view = memoryview(self._map)
+            self._idf = view[HEADER_SIZE:idf_end].cast("d")
+            self._counts = view[idf_end:counts_end].cast("q")
+            self._offsets = view[counts_end:self._terms_start].cast("Q")
+            view.release()
+            if len(self._map) != self._terms_start + self._offsets[count]:
+                raise ValueError('Store file is truncated')
+        except (ValueError, struct.error) as error:
+            self.close()
+            raise ValueError('Invalid store file') from error
+        self._count = int(count)
+        self._corpus_total = int(corpus_total)
+
+    def __enter__(self) -> "IdfStore":
+        """
+        Enter the runtime context of the store.
+
+        Returns:
+            IdfStore: The store itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the store on leaving the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of terms in the store.
+
+        Returns:
+            int: Number of terms
+        """
+        return self._count
+
+    def __contains__(self, term: object) -> bool:
+        """
+        Check if the term is in the store.
+
+        Args:
+            term (object): Term to look up
+
+        Returns:
+            bool: True if the term is stored, False otherwise
+        """
+        return isinstance(term, str) and self._find(term) is not None
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file.
+        """
+        for view in ("_idf", "_counts", "_offsets"):
+            if hasattr(self, view):
+                getattr(self, view).release()
+        if hasattr(self, "_map"):
+            self._map.close()
+        self._file.close()
+
+    def get_corpus_total(self) -> int:
+        """
+        Get the number of tokens in corpus.
+
+        Returns:
+            int: Sum of corpus frequencies
+        """
+        return self._corpus_total
+
+    def get_idf(self, term: str) -> float | None:
+        """
+        Retrieve IDF value of a term.
+
+        Args:
+            term (str): Term to look up
+
+        Returns:
+            float | None: IDF value.
+
+        In case of terms without IDF value or corrupt input arguments, None is returned.
+        """
+        if not isinstance(term, str):
+            return None
+        position = self._find(term)
+        if position is None or math.isnan(self._idf[position]):
+            return None
+        return float(self._idf[position])
+
+    def get_frequency(self, term: str) -> int:
+        """
+        Retrieve corpus frequency of a term.
+
+        Args:
+            term (str): Term to look up
+
+        Returns:
+            int: Occurrences of the term in corpus, 0 for unknown terms
+        """
+        if not isinstance(term, str):
+            return 0
+        position = self._find(term)
+        return 0 if position is None else max(int(self._counts[position]), 0)
+
+    def to_dicts(self) -> tuple[dict[str, float], dict[str, int]]:
+        """
+        Deserialize the whole store into dictionaries of main.py functions.
+
+        Returns:
+            tuple[dict[str, float], dict[str, int]]: IDF values and corpus frequencies
+        """
+        idf = {}
+        corpus_freqs = {}
+        for position in range(self._count):
+            term = self._get_term(position).decode("utf-8")
+            if not math.isnan(self._idf[position]):
+                idf[term] = float(self._idf[position])
+            if self._counts[position] != MISSING_COUNT:
+                corpus_freqs[term] = int(self._counts[position])
+        return idf, corpus_freqs
+
+    def _get_term(self, position: int) -> bytes:
+        """
+        Read encoded term at the position.
+
+        Args:
+            position (int): Position of the term
+
+        Returns:
+            bytes: UTF-8 encoded term
+        """
+        start = self._terms_start + self._offsets[position]
+        end = self._terms_start + self._offsets[position + 1]
+        return self._map[start:end]
+
+    def _find(self, term: str) -> int | None:
+        """
+        Binary search the term among sorted terms.
+
+        Args:
+            term (str): Term to look up
+
+        Returns:
+            int | None: Position of the term, None if it is not stored
+        """
+        key = term.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_term(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._get_term(low) == key:
+            return low
+        return None
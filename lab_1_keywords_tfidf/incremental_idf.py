@@ -0,0 +1,211 @@
+"""
+Lab 1.
+
+Incremental maintenance of document frequencies and IDF values
+"""
+
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+
+from lab_1_keywords_tfidf.main import calculate_frequencies, check_dict
+
+
+def write_atomically(path: str | Path, content: str) -> None:
+    """
+    Replace a file with new content so that readers never see a partial file.
+
+    The content is written to a temporary file in the same directory, flushed
+    to disk and then moved over the target in one rename.
+
+    Args:
+        path (str | Path): Path of the file
+        content (str): Content to write
+    """
+    if not isinstance(path, (str, Path)) or not str(path):
+        raise ValueError('Invalid path')
+    directory = Path(path).resolve().parent
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False
+    ) as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    try:
+        os.replace(file.name, path)
+    except OSError:
+        os.remove(file.name)
+        raise
+
+
+class DocumentFrequencyIndex:
+    """
+    Keep document and corpus frequencies up to date as documents come and go.
+
+    Adding or removing a document costs O(unique terms of the document), IDF
+    values are computed on demand with the same formula as in
+    assets/freq_and_idf_dictionary_creation.py.
+
+    Attributes:
+        _documents (dict[str, dict[str, int]]): Token occurrences of every document
+        _document_freqs (dict[str, int]): Number of documents including a token
+        _corpus_freqs (dict[str, int]): Token occurrences in all documents
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty instance of DocumentFrequencyIndex.
+        """
+        self._documents: dict[str, dict[str, int]] = {}
+        self._document_freqs: dict[str, int] = {}
+        self._corpus_freqs: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of documents.
+
+        Returns:
+            int: Number of documents in the index
+        """
+        return len(self._documents)
+
+    def add_document(self, document_id: str, tokens: list[str]) -> int:
+        """
+        Add tokens of a new document.
+
+        Args:
+            document_id (str): Unique identifier of the document
+            tokens (list[str]): Tokens of the document
+
+        Returns:
+            int: 0 if the document is added, 1 otherwise.
+
+        In case of corrupt input arguments or already known identifier, 1 is returned.
+        """
+        frequencies = calculate_frequencies(tokens)
+        if frequencies is None:
+            return 1
+        return self.add_frequencies(document_id, frequencies)
+
+    def add_frequencies(self, document_id: str, frequencies: dict[str, int]) -> int:
+        """
+        Add token occurrences of a new document.
+
+        Args:
+            document_id (str): Unique identifier of the document
+            frequencies (dict[str, int]): A dictionary {token: occurrences} of the document
+
+        Returns:
+            int: 0 if the document is added, 1 otherwise.
+
+        In case of corrupt input arguments or already known identifier, 1 is returned.
+        """
+        if (
+            not isinstance(document_id, str)
+            or document_id in self._documents
+            or not check_dict(frequencies, str, int, True)
+            or not all(count > 0 for count in frequencies.values())
+        ):
+            return 1
+        self._documents[document_id] = dict(frequencies)
+        for token, count in frequencies.items():
+            self._document_freqs[token] = self._document_freqs.get(token, 0) + 1
+            self._corpus_freqs[token] = self._corpus_freqs.get(token, 0) + count
+        return 0
+
+    def remove_document(self, document_id: str) -> int:
+        """
+        Remove tokens of a known document.
+
+        Args:
+            document_id (str): Identifier of the document
+
+        Returns:
+            int: 0 if the document is removed, 1 if it is unknown
+        """
+        if not isinstance(document_id, str) or document_id not in self._documents:
+            return 1
+        for token, count in self._documents.pop(document_id).items():
+            self._document_freqs[token] -= 1
+            self._corpus_freqs[token] -= count
+            if not self._document_freqs[token]:
+                del self._document_freqs[token]
+                del self._corpus_freqs[token]
+        return 0
+
+    def get_idf(self, token: str) -> float | None:
+        """
+        Calculate IDF value of a token.
+
+        Args:
+            token (str): Token to calculate IDF for
+
+        Returns:
+            float | None: IDF value.
+
+        In case of tokens missing from all documents, None is returned.
+        """
+        document_freq = self._document_freqs.get(token) if isinstance(token, str) else None
+        if document_freq is None:
+            return None
+        return math.log(len(self._documents) / (document_freq + 1))
+
+    def get_idf_dict(self) -> dict[str, float]:
+        """
+        Calculate IDF values of all tokens.
+
+        Returns:
+            dict[str, float]: Dictionary with tokens and IDF values
+        """
+        documents_count = len(self._documents)
+        return {token: math.log(documents_count / (document_freq + 1))
+                for token, document_freq in self._document_freqs.items()}
+
+    def get_corpus_frequencies(self) -> dict[str, int]:
+        """
+        Get token occurrences in all documents.
+
+        Returns:
+            dict[str, int]: Dictionary with tokens and corpus frequencies
+        """
+        return dict(self._corpus_freqs)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Atomically save the index to a JSON file.
+
+        Args:
+            path (str | Path): Path of the file
+        """
+        write_atomically(path, json.dumps({"documents": self._documents}, ensure_ascii=False))
+
+    def export_assets(self, idf_path: str | Path, frequencies_path: str | Path) -> None:
+        """
+        Atomically write IDF.json and corpus_frequencies.json assets.
+
+        Args:
+            idf_path (str | Path): Path of JSON file with IDF values
+            frequencies_path (str | Path): Path of JSON file with corpus frequencies
+        """
+        write_atomically(idf_path, json.dumps(self.get_idf_dict(), ensure_ascii=False))
+        write_atomically(frequencies_path, json.dumps(self._corpus_freqs, ensure_ascii=False))
+
+
+def load_document_frequency_index(path: str | Path) -> DocumentFrequencyIndex:
+    """
+    Load DocumentFrequencyIndex from a JSON file.
+
+    Args:
+        path (str | Path): Path of the file
+
+    Returns:
+        DocumentFrequencyIndex: Index with all saved documents
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    index = DocumentFrequencyIndex()
+    for document_id, frequencies in data.get("documents", {}).items():
+        index.add_frequencies(document_id, frequencies)
+    return index
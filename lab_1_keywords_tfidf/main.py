@@ -5,11 +5,126 @@ Extract keywords based on frequency related metrics
 """
 
 # pylint:disable=unused-argument
+import heapq
 import math
-from typing import Any
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from typing import Any, Iterable, Iterator, Literal
 
+from lab_1_keywords_tfidf.profiling import profiled
 
-def check_list(user_input: Any, elements_type: type, can_be_empty: bool) -> bool:
+#: Symbols which are neither alphanumeric nor whitespace, \w matches isalnum and underscore
+NOT_ALNUM_PATTERN = re.compile(r"[^\w\s]|_")
+
+ValidationPolicy = Literal["strict", "prefix", "off"]
+"Type alias for element checks of collections: all, a bounded prefix or none."
+
+#: Policies accepted by check_list, check_dict and validation_policy
+VALIDATION_POLICIES: tuple[ValidationPolicy, ...] = ("strict", "prefix", "off")
+
+#: Maximum number of elements checked by the prefix validation policy
+VALIDATION_PREFIX_SIZE = 32
+
+#: Validation policy of the current context, strict unless changed by validation_policy
+_VALIDATION_POLICY: ContextVar[ValidationPolicy] = ContextVar(
+    "validation_policy", default="strict"
+)
+
+
+@contextmanager
+def validation_policy(policy: ValidationPolicy) -> Iterator[None]:
+    """
+    Set the policy of check_list and check_dict for the current context.
+
+    Pipelines which validated their data once, or produced it themselves, can
+    switch element checks off for the functions they call. The container type
+    and emptiness are checked under every policy.
+
+    Args:
+        policy (ValidationPolicy): Policy to use inside the context
+
+    Yields:
+        None: Control to the body of the context
+    """
+    token = _VALIDATION_POLICY.set(_get_policy(policy))
+    try:
+        yield
+    finally:
+        _VALIDATION_POLICY.reset(token)
+
+
+def _get_policy(policy: ValidationPolicy | None) -> ValidationPolicy:
+    """
+    Resolve the validation policy of a call.
+
+    Args:
+        policy (ValidationPolicy | None): Policy of the call, None for the policy
+            of the current context
+
+    Returns:
+        ValidationPolicy: Policy to apply
+    """
+    if policy is None:
+        return _VALIDATION_POLICY.get()
+    if policy not in VALIDATION_POLICIES:
+        raise ValueError(f'Invalid validation policy: {policy}')
+    return policy
+
+
+def _get_prefix(elements: Iterable) -> list:
+    """
+    Take the first elements checked by the prefix validation policy.
+
+    Args:
+        elements (Iterable): Elements of a collection
+
+    Returns:
+        list: At most VALIDATION_PREFIX_SIZE first elements
+    """
+    return list(islice(elements, VALIDATION_PREFIX_SIZE))
+
+
+def _are_instances(elements: Iterable, elements_type: type) -> bool:
+    """
+    Check if every element is an instance of a type.
+
+    Args:
+        elements (Iterable): Elements to check
+        elements_type (type): Expected type of elements
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    return all(isinstance(element, elements_type) for element in elements)
+
+
+def _check_elements(elements: Iterable, elements_type: type, policy: ValidationPolicy) -> bool:
+    """
+    Check elements of a collection as the validation policy requires.
+
+    Args:
+        elements (Iterable): Elements of a collection
+        elements_type (type): Expected type of elements
+        policy (ValidationPolicy): Which elements to check
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    if policy == "off":
+        return True
+    if policy == "prefix":
+        return _are_instances(_get_prefix(elements), elements_type)
+    return _are_instances(elements, elements_type)
+
+
+def check_list(
+    user_input: Any,
+    elements_type: type,
+    can_be_empty: bool,
+    policy: ValidationPolicy | None = None,
+) -> bool:
     """
     Check if the object is a list containing elements of a certain type.
 
@@ -17,19 +132,27 @@ def check_list(user_input: Any, elements_type: type, can_be_empty: bool) -> bool
         user_input (Any): Object to check
         elements_type (type): Expected type of list elements
         can_be_empty (bool): Whether an empty list is allowed
+        policy (ValidationPolicy | None): Which elements to check,
+            the policy of the current context by default
 
     Returns:
         bool: True if valid, False otherwise
     """
+    policy = _get_policy(policy)
     if not isinstance(user_input, list):
         return False
     if not user_input:
         return can_be_empty
-    return all(isinstance(element, elements_type) for element in user_input)
-
+    return _check_elements(user_input, elements_type, policy)
 
 
-def check_dict(user_input: Any, key_type: type, value_type: type, can_be_empty: bool) -> bool:
+def check_dict(
+    user_input: Any,
+    key_type: type,
+    value_type: type,
+    can_be_empty: bool,
+    policy: ValidationPolicy | None = None,
+) -> bool:
     """
     Check if the object is a dictionary with keys and values of given types.
 
@@ -38,16 +161,19 @@ def check_dict(user_input: Any, key_type: type, value_type: type, can_be_empty:
         key_type (type): Expected type of dictionary keys
         value_type (type): Expected type of dictionary values
         can_be_empty (bool): Whether an empty dictionary is allowed
+        policy (ValidationPolicy | None): Which items to check,
+            the policy of the current context by default
 
     Returns:
         bool: True if valid, False otherwise
     """
+    policy = _get_policy(policy)
     if not isinstance(user_input, dict):
         return False
     if not user_input:
         return can_be_empty
-    return (all(isinstance(key, key_type) for key in user_input) and
-        all(isinstance(value, value_type) for value in user_input.values()))
+    return (_check_elements(user_input, key_type, policy) and
+        _check_elements(user_input.values(), value_type, policy))
 
 
 def check_positive_int(user_input: Any) -> bool:
@@ -76,6 +202,7 @@ def check_float(user_input: Any) -> bool:
     return isinstance(user_input, float)
 
 
+@profiled()
 def clean_and_tokenize(text: str) -> list[str] | None:
     """
     Remove punctuation, convert to lowercase, and split into tokens.
@@ -100,24 +227,90 @@ def clean_and_tokenize(text: str) -> list[str] | None:
     return tokens
 
 
-def remove_stop_words(tokens: list[str], stop_words: list[str]) -> list[str] | None:
+@profiled()
+def clean_and_tokenize_fast(text: str) -> list[str] | None:
+    """
+    Remove punctuation, convert to lowercase, and split into tokens with a precompiled pattern.
+
+    Gives the same tokens as clean_and_tokenize, but removes all non-alphanumeric
+    symbols of the text in one regular expression pass instead of cleaning words
+    symbol by symbol.
+
+    Args:
+        text (str): Original text
+
+    Returns:
+        list[str] | None: A list of lowercase tokens without punctuation.
+        In case of corrupt input arguments, None is returned.
+    """
+    if not isinstance(text, str):
+        return None
+    return NOT_ALNUM_PATTERN.sub('', text.lower()).split()
+
+
+def iter_clean_tokens(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily remove punctuation, convert to lowercase, and split chunks of text into tokens.
+
+    Chunks may be lines of a file object or arbitrary pieces of a text: a word
+    split between neighbouring chunks is glued back before cleaning, so the
+    tokens are the same as clean_and_tokenize gives for the joined text.
+
+    Args:
+        chunks (Iterable[str]): Pieces of the original text
+
+    Yields:
+        str: Lowercase tokens without punctuation.
+        A chunk which is not a string raises ValueError when it is reached,
+        so a corrupt stream is not mistaken for a complete one.
+    """
+    carry = ''
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            raise ValueError('Invalid input: chunks must be strings')
+        if not chunk:
+            continue
+        words = (carry + chunk).split()
+        carry = words.pop() if words and not chunk[-1].isspace() else ''
+        for word in words:
+            cleaned_word = ''.join(symbol for symbol in word.lower() if symbol.isalnum())
+            if cleaned_word:
+                yield cleaned_word
+    cleaned_word = ''.join(symbol for symbol in carry.lower() if symbol.isalnum())
+    if cleaned_word:
+        yield cleaned_word
+
+
+@profiled()
+def remove_stop_words(
+    tokens: list[str], stop_words: list[str] | frozenset[str]
+) -> list[str] | None:
     """
     Exclude stop words from the token sequence.
 
     Args:
         tokens (list[str]): Original token sequence
-        stop_words (list[str]): Tokens to exclude
+        stop_words (list[str] | frozenset[str]): Tokens to exclude, a frozenset
+            is used as is instead of building a set on every call
 
     Returns:
         list[str] | None: Token sequence without stop words.
         In case of corrupt input arguments, None is returned.
     """
-    if not all([check_list(tokens, str, True),
-        check_list(stop_words, str, True)]):
+    if isinstance(stop_words, frozenset):
+        if not _check_elements(stop_words, str, _get_policy(None)):
+            return None
+        excluded = stop_words
+    elif check_list(stop_words, str, True):
+        excluded = frozenset(stop_words)
+    else:
         return None
-    return [token for token in tokens if token not in set(stop_words)]
+    if not check_list(tokens, str, True):
+        return None
+    return [token for token in tokens if token not in excluded]
 
 
+@profiled()
 def calculate_frequencies(tokens: list[str]) -> dict[str, int] | None:
     """
     Create a frequency dictionary from the token sequence.
@@ -137,14 +330,21 @@ def calculate_frequencies(tokens: list[str]) -> dict[str, int] | None:
     return frequencies
 
 
-def get_top_n(frequencies: dict[str, int | float], top: int) -> list[str] | None:
+@profiled()
+def get_top_n(
+    frequencies: dict[str, int | float], top: int, trusted: bool = False
+) -> list[str] | None:
     """
     Extract the most frequent tokens.
 
+    Tokens are selected with a bounded heap in O(n log top) instead of sorting
+    the whole dictionary, ties keep the order of the dictionary as a stable sort does.
+
     Args:
 
         frequencies (dict[str, int | float]): A dictionary with tokens and their frequencies
         top (int): Number of tokens to extract
+        trusted (bool): Skip type checks of every item for dictionaries built internally
 
     Returns:
         list[str] | None: Top-N tokens sorted by frequency.
@@ -152,13 +352,14 @@ def get_top_n(frequencies: dict[str, int | float], top: int) -> list[str] | None
     """
     if not all([isinstance(frequencies, dict), check_positive_int(top), frequencies]):
         return None
-    for key, value in frequencies.items():
-        if not isinstance(value, (int, float)) or not isinstance(key, str):
-            return None
-    return [item[0] for item in sorted(frequencies.items(),
-                   key=lambda item: item[1], reverse=True)[:top]]
+    if not trusted:
+        for key, value in frequencies.items():
+            if not isinstance(value, (int, float)) or not isinstance(key, str):
+                return None
+    return [item[0] for item in heapq.nlargest(top, frequencies.items(), key=lambda item: item[1])]
 
 
+@profiled()
 def calculate_tf(frequencies: dict[str, int]) -> dict[str, float] | None:
     """
     Calculate Term Frequency (TF) for each token.
@@ -176,6 +377,7 @@ def calculate_tf(frequencies: dict[str, int]) -> dict[str, float] | None:
     return {token: word_count / dict_length for token, word_count in frequencies.items()}
 
 
+@profiled()
 def calculate_tfidf(term_freq: dict[str, float], idf: dict[str, float]) -> dict[str, float] | None:
     """
     Calculate TF-IDF score for tokens.
@@ -197,6 +399,7 @@ def calculate_tfidf(term_freq: dict[str, float], idf: dict[str, float]) -> dict[
     return tfidf_dict
 
 
+@profiled()
 def calculate_expected_frequency(
     doc_freqs: dict[str, int], corpus_freqs: dict[str, int]
 ) -> dict[str, float] | None:
@@ -224,6 +427,7 @@ def calculate_expected_frequency(
     return dict(sorted(expected_frequency.items()))
 
 
+@profiled()
 def calculate_chi_values(
     expected: dict[str, float], observed: dict[str, int]
 ) -> dict[str, float] | None:
@@ -245,6 +449,7 @@ def calculate_chi_values(
             expected[term] for term in observed}
 
 
+@profiled()
 def extract_significant_words(
     chi_values: dict[str, float], alpha: float
 ) -> dict[str, float] | None:
@@ -0,0 +1,655 @@
+"""
+Lab 1.
+
+Batch keyword extraction over document collections
+"""
+
+import hashlib
+import json
+import math
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from lab_1_keywords_tfidf.incremental_idf import write_atomically
+from lab_1_keywords_tfidf.main import (
+    check_dict,
+    check_list,
+    check_positive_int,
+    clean_and_tokenize_fast,
+    get_top_n,
+)
+from lab_1_keywords_tfidf.profiling import profiled
+from lab_1_keywords_tfidf.significance import chi_squared_critical_value
+
+KeywordsType = tuple[list[str], list[str]]
+"Type alias for TF-IDF and chi-squared keywords of a single document."
+
+#: IDF value used for terms missing from the IDF table, same as in calculate_tfidf
+UNKNOWN_TERM_IDF = math.log(47 / 1)
+
+#: Chi-squared critical values supported by extract_significant_words
+CHI_CRITERION = {0.05: 3.842, 0.01: 6.635, 0.001: 10.828}
+
+#: Stop word lists shipped with the labs by language
+STOP_WORDS_PATHS = {
+    "ru": Path(__file__).parent / "assets" / "stop_words.txt",
+    "en": Path(__file__).parent.parent / "lab_2_spellcheck" / "assets" / "stop_words_en.txt",
+}
+
+
+class StopWordFilter:
+    """
+    Precompiled set of stop words reused by every document.
+
+    Attributes:
+        _words (frozenset[str]): Tokens to exclude
+    """
+
+    def __init__(self, stop_words: Iterable[str]) -> None:
+        """
+        Initialize an instance of StopWordFilter.
+
+        Args:
+            stop_words (Iterable[str]): Tokens to exclude
+        """
+        try:
+            words = frozenset(stop_words)
+        except TypeError as error:
+            raise ValueError('Invalid input: stop words must be strings') from error
+        if not all(isinstance(word, str) for word in words):
+            raise ValueError('Invalid input: stop words must be strings')
+        self._words = words
+
+    def __contains__(self, token: object) -> bool:
+        """
+        Check if the token is a stop word.
+
+        Args:
+            token (object): Token to check
+
+        Returns:
+            bool: True if the token is a stop word, False otherwise
+        """
+        return token in self._words
+
+    def __len__(self) -> int:
+        """
+        Get the number of stop words.
+
+        Returns:
+            int: Number of stop words
+        """
+        return len(self._words)
+
+    def get_words(self) -> frozenset[str]:
+        """
+        Get stop words, ready to be passed to remove_stop_words.
+
+        Returns:
+            frozenset[str]: Tokens to exclude
+        """
+        return self._words
+
+    def remove(self, tokens: list[str]) -> list[str]:
+        """
+        Exclude stop words from the token sequence in O(n).
+
+        Args:
+            tokens (list[str]): Original token sequence
+
+        Returns:
+            list[str]: Token sequence without stop words
+        """
+        words = self._words
+        return [token for token in tokens if token not in words]
+
+    def filter(self, tokens: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily exclude stop words from a stream of tokens.
+
+        Args:
+            tokens (Iterable[str]): Original tokens, for example from iter_clean_tokens
+
+        Yields:
+            str: Tokens which are not stop words
+        """
+        words = self._words
+        for token in tokens:
+            if token not in words:
+                yield token
+
+
+def load_stop_words(language: str = "ru") -> StopWordFilter | None:
+    """
+    Load the stop word list shipped with the labs for a language.
+
+    Args:
+        language (str): Language code, "ru" or "en"
+
+    Returns:
+        StopWordFilter | None: Filter with stop words of the language.
+
+    In case of unknown language, None is returned.
+    """
+    if language not in STOP_WORDS_PATHS:
+        return None
+    with open(STOP_WORDS_PATHS[language], "r", encoding="utf-8") as file:
+        return StopWordFilter(word for word in file.read().splitlines() if word)
+
+
+def get_chi_threshold(alpha: float) -> float | None:
+    """
+    Get the chi-squared critical value used for the significance level.
+
+    Levels supported by extract_significant_words use its rounded critical values,
+    so that results match the main.py chain, other levels are calculated.
+
+    Args:
+        alpha (float): Significance level in range (0, 1)
+
+    Returns:
+        float | None: Critical value.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    threshold = chi_squared_critical_value(alpha)
+    if threshold is None:
+        return None
+    return CHI_CRITERION.get(alpha, threshold)
+
+
+class ChiSquaredScorer:
+    """
+    Select significant chi-squared tokens of documents in a single traversal.
+
+    Corpus frequencies are validated and summed once, then observed counts,
+    expected frequencies, chi-squared values and the significance filter are
+    computed together for every token of a document.
+
+    Attributes:
+        _corpus_freqs (dict[str, int]): Token frequencies in corpus
+        _corpus_total (int): Number of tokens in corpus
+        _threshold (float): Chi-squared critical value for the significance level
+    """
+
+    def __init__(self, corpus_freqs: dict[str, int], alpha: float = 0.001) -> None:
+        """
+        Initialize an instance of ChiSquaredScorer.
+
+        Args:
+            corpus_freqs (dict[str, int]): Token frequencies in corpus
+            alpha (float): Significance level controlling chi-squared threshold, levels
+                supported by extract_significant_words use its rounded critical values
+        """
+        threshold = get_chi_threshold(alpha)
+        if threshold is None or not check_dict(corpus_freqs, str, int, True):
+            raise ValueError('Invalid input: corrupt corpus frequencies or significance level')
+        self._corpus_freqs = corpus_freqs
+        self._corpus_total = sum(corpus_freqs.values())
+        self._threshold = threshold
+
+    def score(self, frequencies: dict[str, int]) -> dict[str, float] | None:
+        """
+        Select significant tokens of a document by their frequencies.
+
+        Gives the same dictionary as extract_significant_words over
+        calculate_chi_values over calculate_expected_frequency.
+
+        Args:
+            frequencies (dict[str, int]): Token frequencies in document
+
+        Returns:
+            dict[str, float] | None: Dictionary with significant tokens and chi-squared values.
+
+        In case of corrupt input arguments or empty document, None is returned.
+        """
+        if not check_dict(frequencies, str, int, False):
+            return None
+        return self._score(frequencies)
+
+    def score_tokens(self, tokens: list[str]) -> dict[str, float] | None:
+        """
+        Select significant tokens of a document by its token sequence.
+
+        Args:
+            tokens (list[str]): Token sequence without stop words
+
+        Returns:
+            dict[str, float] | None: Dictionary with significant tokens and chi-squared values.
+
+        In case of corrupt input arguments or empty document, None is returned.
+        """
+        if not check_list(tokens, str, False):
+            return None
+        frequencies: dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        return self._score(frequencies)
+
+    def _score(self, frequencies: dict[str, int]) -> dict[str, float] | None:
+        """
+        Select significant tokens of a document by validated frequencies.
+
+        Args:
+            frequencies (dict[str, int]): Non-empty token frequencies in document
+
+        Returns:
+            dict[str, float] | None: Dictionary with significant tokens and chi-squared values.
+
+        In case of non-positive token frequencies, None is returned.
+        """
+        total_doc = sum(frequencies.values())
+        total = total_doc + self._corpus_total
+        corpus_freqs = self._corpus_freqs
+        threshold = self._threshold
+        significant = {}
+        for token, observed in frequencies.items():
+            if observed <= 0:
+                return None
+            expected = ((observed + corpus_freqs.get(token, 0)) * total_doc) / total
+            chi_value = ((observed - expected) ** 2) / expected
+            if chi_value > threshold:
+                significant[token] = chi_value
+        return significant
+
+
+class KeywordExtractor:
+    """
+    Extract keywords from many documents sharing corpus-level resources.
+
+    Stop words, IDF table and corpus frequencies are validated once on creation,
+    so documents are scored without re-checking shared dictionaries every time.
+
+    Attributes:
+        _stop_words (StopWordFilter): Tokens to exclude
+        _idf (dict[str, float]): Inverse document frequency values
+        _corpus_freqs (dict[str, int]): Token frequencies in corpus
+        _corpus_total (int): Number of tokens in corpus
+        _top (int): Number of keywords to extract
+        _alpha (float): Significance level controlling chi-squared threshold
+        _threshold (float): Chi-squared critical value for the significance level
+        _fingerprint (str | None): Hash of resources and settings, computed on demand
+    """
+
+    def __init__(
+        self,
+        stop_words: list[str] | StopWordFilter,
+        idf: dict[str, float],
+        corpus_freqs: dict[str, int],
+        top: int = 10,
+        alpha: float = 0.001,
+    ) -> None:
+        """
+        Initialize an instance of KeywordExtractor.
+
+        Args:
+            stop_words (list[str] | StopWordFilter): Tokens to exclude
+            idf (dict[str, float]): Inverse document frequency values
+            corpus_freqs (dict[str, int]): Token frequencies in corpus
+            top (int): Number of keywords to extract
+            alpha (float): Significance level controlling chi-squared threshold, levels
+                supported by extract_significant_words use its rounded critical values
+        """
+        threshold = get_chi_threshold(alpha)
+        if threshold is None or not all([
+            isinstance(stop_words, StopWordFilter) or check_list(stop_words, str, True),
+            check_dict(idf, str, float, True),
+            check_dict(corpus_freqs, str, int, True),
+            check_positive_int(top),
+        ]):
+            raise ValueError('Invalid input: corrupt extraction resources')
+        if not isinstance(stop_words, StopWordFilter):
+            stop_words = StopWordFilter(stop_words)
+        self._stop_words = stop_words
+        self._idf = idf
+        self._corpus_freqs = corpus_freqs
+        self._corpus_total = sum(corpus_freqs.values())
+        self._top = top
+        self._alpha = alpha
+        self._threshold = threshold
+        self._fingerprint: str | None = None
+
+    def get_fingerprint(self) -> str:
+        """
+        Get the hash of resources and settings of the extractor.
+
+        Extractors built from different stop words, IDF table, corpus frequencies,
+        number of keywords or significance level have different fingerprints.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest
+        """
+        if self._fingerprint is None:
+            resources = [sorted(self._stop_words.get_words()), self._idf, self._corpus_freqs,
+                         self._top, self._alpha]
+            self._fingerprint = hashlib.sha256(
+                json.dumps(resources, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        return self._fingerprint
+
+    def extract(self, text: str) -> KeywordsType | None:
+        """
+        Extract TF-IDF and chi-squared keywords from a document.
+
+        Gives the same keywords as the chain of main.py functions: get_top_n over
+        calculate_tfidf values and get_top_n over extract_significant_words values.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            KeywordsType | None: Top-N TF-IDF keywords and top-N significant
+            chi-squared keywords.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        tokens = clean_and_tokenize_fast(text)
+        if tokens is None:
+            return None
+        return self._score(self._count(tokens))
+
+    def extract_batch(self, texts: Iterable[str]) -> list[KeywordsType | None]:
+        """
+        Extract keywords from every document of a collection.
+
+        Args:
+            texts (Iterable[str]): Original texts
+
+        Returns:
+            list[KeywordsType | None]: Keywords for each document in the original order.
+            Corrupt documents get None in their position.
+        """
+        return [self.extract(text) for text in texts]
+
+    def extract_parallel(
+        self, texts: Iterable[str], processes: int | None = None, chunksize: int = 8
+    ) -> Iterator[KeywordsType | None] | None:
+        """
+        Extract keywords from documents sharded across a pool of processes.
+
+        The extractor is sent to every worker once on its start, so shared
+        resources are not pickled with each document. Results are streamed
+        back in the original order of documents.
+
+        Args:
+            texts (Iterable[str]): Original texts
+            processes (int | None): Number of worker processes, all cores by default
+            chunksize (int): Number of documents sent to a worker at a time
+
+        Returns:
+            Iterator[KeywordsType | None] | None: Keywords for each document,
+                None for corrupt ones.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if (
+            (processes is not None and not check_positive_int(processes))
+            or not check_positive_int(chunksize)
+        ):
+            return None
+        return self._iter_parallel(texts, processes, chunksize)
+
+    def _iter_parallel(
+        self, texts: Iterable[str], processes: int | None, chunksize: int
+    ) -> Iterator[KeywordsType | None]:
+        """
+        Stream keywords of documents from a pool of processes.
+
+        Args:
+            texts (Iterable[str]): Original texts
+            processes (int | None): Number of worker processes
+            chunksize (int): Number of documents sent to a worker at a time
+
+        Yields:
+            KeywordsType | None: Keywords for each document, None for corrupt ones
+        """
+        with Pool(processes, initializer=_init_worker, initargs=(self,)) as pool:
+            yield from pool.imap(_extract_in_worker, texts, chunksize)
+
+    @profiled("KeywordExtractor.count", method=True)
+    def _count(self, tokens: list[str]) -> dict[str, int]:
+        """
+        Count tokens which are not stop words.
+
+        Args:
+            tokens (list[str]): Token sequence
+
+        Returns:
+            dict[str, int]: A dictionary {token: occurrences} in order of first occurrence
+        """
+        stop_words = self._stop_words.get_words()
+        frequencies: dict[str, int] = {}
+        for token in tokens:
+            if token not in stop_words:
+                frequencies[token] = frequencies.get(token, 0) + 1
+        return frequencies
+
+    @profiled("KeywordExtractor.score", method=True)
+    def _score(self, frequencies: dict[str, int]) -> KeywordsType:
+        """
+        Score counted tokens with TF-IDF and chi-squared metrics.
+
+        Args:
+            frequencies (dict[str, int]): Raw occurrences of tokens
+
+        Returns:
+            KeywordsType: Top-N TF-IDF keywords and top-N significant chi-squared keywords
+        """
+        if not frequencies:
+            return [], []
+        total_doc = sum(frequencies.values())
+        total = total_doc + self._corpus_total
+        idf = self._idf
+        corpus_freqs = self._corpus_freqs
+        tfidf = {}
+        significant = {}
+        for token, observed in frequencies.items():
+            tfidf[token] = observed / total_doc * idf.get(token, UNKNOWN_TERM_IDF)
+            expected = ((observed + corpus_freqs.get(token, 0)) * total_doc) / total
+            chi_value = ((observed - expected) ** 2) / expected
+            if chi_value > self._threshold:
+                significant[token] = chi_value
+        return (get_top_n(tfidf, self._top, trusted=True) or [],
+                get_top_n(significant, self._top, trusted=True) or [])
+
+
+class KeywordCache:
+    """
+    Cache keywords of documents by hash of their content.
+
+    Keys include the fingerprint of the extractor, so keywords computed with
+    another IDF table, stop words or significance level are never returned.
+    Recently used keywords are kept in memory, older ones are evicted; an
+    optional directory keeps entries on disk between runs. Once the directory
+    holds more than disk_capacity entries, the least recently used half of
+    them is removed, so the store does not grow without bound.
+
+    Attributes:
+        _extractor (KeywordExtractor): Extractor computing keywords on cache misses
+        _capacity (int): Maximum number of entries kept in memory
+        _directory (Path | None): Directory of the on-disk store
+        _disk_capacity (int): Maximum number of entries kept on disk
+        _disk_entries (int): Number of entries on disk
+        _entries (dict[str, tuple[tuple[str, ...], tuple[str, ...]]]): Entries in order of use
+    """
+
+    def __init__(
+        self,
+        extractor: KeywordExtractor,
+        capacity: int = 4096,
+        directory: str | Path | None = None,
+        disk_capacity: int = 65536,
+    ) -> None:
+        """
+        Initialize an instance of KeywordCache.
+
+        Args:
+            extractor (KeywordExtractor): Extractor computing keywords on cache misses
+            capacity (int): Maximum number of entries kept in memory
+            directory (str | Path | None): Directory of the on-disk store, None to keep
+                entries in memory only
+            disk_capacity (int): Maximum number of entries kept on disk
+        """
+        if (
+            not isinstance(extractor, KeywordExtractor)
+            or not check_positive_int(capacity)
+            or not check_positive_int(disk_capacity)
+        ):
+            raise ValueError('Invalid input: corrupt extractor or capacity')
+        self._extractor = extractor
+        self._capacity = capacity
+        self._directory = None if directory is None else Path(directory)
+        self._disk_capacity = disk_capacity
+        self._disk_entries = 0
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._disk_entries = len(list(self._directory.glob("*.json")))
+        self._entries: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries kept in memory.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+    def extract(self, text: str) -> KeywordsType | None:
+        """
+        Extract keywords of a document, reusing them if the document was seen.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            KeywordsType | None: Top-N TF-IDF keywords and top-N significant
+            chi-squared keywords.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(text, str):
+            return None
+        key = hashlib.sha256(
+            (self._extractor.get_fingerprint() + text).encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = self._load(key)
+        if entry is None:
+            keywords = self._extractor.extract(text)
+            if keywords is None:
+                return None
+            entry = (tuple(keywords[0]), tuple(keywords[1]))
+            self._store(key, entry)
+        self._entries[key] = entry
+        if len(self._entries) > self._capacity:
+            del self._entries[next(iter(self._entries))]
+        return list(entry[0]), list(entry[1])
+
+    def extract_batch(self, texts: Iterable[str]) -> list[KeywordsType | None]:
+        """
+        Extract keywords from every document of a collection using the cache.
+
+        Args:
+            texts (Iterable[str]): Original texts
+
+        Returns:
+            list[KeywordsType | None]: Keywords for each document in the original order.
+            Corrupt documents get None in their position.
+        """
+        return [self.extract(text) for text in texts]
+
+    def _load(self, key: str) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+        """
+        Read an entry from the on-disk store.
+
+        Args:
+            key (str): Key of the entry
+
+        Returns:
+            tuple[tuple[str, ...], tuple[str, ...]] | None: Stored keywords.
+
+        In case of missing or unreadable entry, None is returned.
+        """
+        if self._directory is None:
+            return None
+        path = self._directory / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                tfidf_keywords, chi_keywords = json.load(file)
+            path.touch()
+        except (OSError, TypeError, ValueError):
+            return None
+        return tuple(tfidf_keywords), tuple(chi_keywords)
+
+    def _store(self, key: str, entry: tuple[tuple[str, ...], tuple[str, ...]]) -> None:
+        """
+        Write an entry to the on-disk store.
+
+        Args:
+            key (str): Key of the entry
+            entry (tuple[tuple[str, ...], tuple[str, ...]]): Keywords to store
+        """
+        if self._directory is None:
+            return
+        path = self._directory / f"{key}.json"
+        if not path.exists():
+            self._disk_entries += 1
+        write_atomically(path, json.dumps(entry, ensure_ascii=False))
+        if self._disk_entries > self._disk_capacity:
+            self._prune(self._directory)
+
+    def _prune(self, directory: Path) -> None:
+        """
+        Remove the least recently used half of the on-disk store.
+
+        Entries are ordered by modification time, which _load refreshes on every hit.
+        Removing half of the entries at once keeps directory scans rare.
+
+        Args:
+            directory (Path): Directory of the on-disk store
+        """
+        ages = {}
+        for path in directory.glob("*.json"):
+            try:
+                ages[path] = path.stat().st_mtime_ns
+            except OSError:
+                continue
+        kept = self._disk_capacity // 2
+        for path in sorted(ages, key=ages.__getitem__)[:max(len(ages) - kept, 0)]:
+            path.unlink(missing_ok=True)
+        self._disk_entries = min(len(ages), kept)
+
+
+#: Extractor of the current worker process under the "extractor" key, set by _init_worker
+_WORKER_STATE: dict[str, KeywordExtractor] = {}
+
+
+def _init_worker(extractor: KeywordExtractor) -> None:
+    """
+    Store the extractor in a worker process.
+
+    Args:
+        extractor (KeywordExtractor): Extractor with shared resources
+    """
+    _WORKER_STATE["extractor"] = extractor
+
+
+def _extract_in_worker(text: str) -> KeywordsType | None:
+    """
+    Extract keywords from a document with the extractor of a worker process.
+
+    Args:
+        text (str): Original text
+
+    Returns:
+        KeywordsType | None: Keywords of the document.
+
+    In case the worker is not initialized, None is returned.
+    """
+    extractor = _WORKER_STATE.get("extractor")
+    if extractor is None:
+        return None
+    return extractor.extract(text)
@@ -0,0 +1,202 @@
+"""
+Lab 1.
+
+Per-stage profiling hooks of keyword extraction
+"""
+
+import functools
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, ParamSpec, TypeVar
+
+StageRecordType = dict[str, Any]
+"Type alias for a measurement of a stage call."
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class StageRecorder:
+    """
+    Collect wall time, sizes and allocations of profiled stages.
+
+    Stages record themselves only inside the context of a recorder, and
+    recorders are kept in a context variable, so concurrent threads and tasks
+    do not mix their measurements. Times of nested stages are inclusive.
+
+    Attributes:
+        _records (list[StageRecordType]): Measurements in order of completion
+        _callback (Callable[[StageRecordType], None] | None): Function called with
+            every measurement
+        _tokens (list): Tokens restoring previous recorders on exit
+    """
+
+    def __init__(self, callback: Callable[[StageRecordType], None] | None = None) -> None:
+        """
+        Initialize an instance of StageRecorder.
+
+        Args:
+            callback (Callable[[StageRecordType], None] | None): Function to call
+                with every measurement, for example to stream it to a log
+        """
+        if callback is not None and not callable(callback):
+            raise ValueError('Invalid input: callback must be callable')
+        self._records: list[StageRecordType] = []
+        self._callback = callback
+        self._tokens: list = []
+
+    def __enter__(self) -> "StageRecorder":
+        """
+        Start recording stages of the current context.
+
+        Returns:
+            StageRecorder: The recorder itself
+        """
+        self._tokens.append(_RECORDER.set(self))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Stop recording and restore the previous recorder.
+
+        Args:
+            *args (object): Exception details
+        """
+        _RECORDER.reset(self._tokens.pop())
+
+    def __len__(self) -> int:
+        """
+        Get the number of recorded stage calls.
+
+        Returns:
+            int: Number of measurements
+        """
+        return len(self._records)
+
+    def record(self, measurement: StageRecordType) -> None:
+        """
+        Store a measurement and pass it to the callback.
+
+        Args:
+            measurement (StageRecordType): Stage name, seconds, sizes of the input
+                and the output and the change of allocated memory blocks
+        """
+        self._records.append(measurement)
+        if self._callback is not None:
+            self._callback(measurement)
+
+    def get_records(self) -> list[StageRecordType]:
+        """
+        Get measurements of all recorded calls.
+
+        Returns:
+            list[StageRecordType]: Measurements in order of completion
+        """
+        return self._records
+
+    def summarize(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregate measurements by stage.
+
+        Returns:
+            dict[str, dict[str, float]]: Number of calls, total seconds, total
+                input and output sizes and total change of allocated blocks
+                of every stage in order of the first call
+        """
+        summary: dict[str, dict[str, float]] = {}
+        for measurement in self._records:
+            totals = summary.setdefault(measurement["stage"], {
+                "calls": 0, "seconds": 0.0, "input_size": 0, "output_size": 0,
+                "allocated_blocks": 0,
+            })
+            totals["calls"] += 1
+            totals["seconds"] += measurement["seconds"]
+            totals["input_size"] += measurement["input_size"] or 0
+            totals["output_size"] += measurement["output_size"] or 0
+            totals["allocated_blocks"] += measurement["allocated_blocks"]
+        return summary
+
+
+#: Recorder of the current context, None while profiling is disabled
+_RECORDER: ContextVar[StageRecorder | None] = ContextVar("stage_recorder", default=None)
+
+
+def get_size(value: object) -> int | None:
+    """
+    Get the size of a stage input or output.
+
+    Args:
+        value (object): Argument or result of a stage
+
+    Returns:
+        int | None: Length of sized values, None for other values
+    """
+    try:
+        return len(value)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+
+def profiled(
+    stage: str | None = None, method: bool = False
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """
+    Make a function record its calls in the recorder of the current context.
+
+    Without a recorder the wrapper only reads a context variable before
+    calling the function, so profiling hooks cost next to nothing when disabled.
+    The input size is the size of the first argument.
+
+    Args:
+        stage (str | None): Name of the stage, the name of the function by default
+        method (bool): Whether the function is a method, so that the size of
+            the argument following self is recorded
+
+    Returns:
+        Callable[[Callable[_P, _R]], Callable[_P, _R]]: Decorator of stage functions
+    """
+    def decorator(function: Callable[_P, _R]) -> Callable[_P, _R]:
+        """
+        Wrap a stage function.
+
+        Args:
+            function (Callable[_P, _R]): Stage function
+
+        Returns:
+            Callable[_P, _R]: Function recording its calls
+        """
+        name = stage or function.__name__
+        position = 1 if method else 0
+
+        @functools.wraps(function)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            """
+            Call the stage function, measuring it if a recorder is active.
+
+            Args:
+                *args (_P.args): Positional arguments of the stage
+                **kwargs (_P.kwargs): Keyword arguments of the stage
+
+            Returns:
+                _R: Result of the stage
+            """
+            recorder = _RECORDER.get()
+            if recorder is None:
+                return function(*args, **kwargs)
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            recorder.record({
+                "stage": name,
+                "seconds": seconds,
+                "input_size": get_size(args[position]) if len(args) > position else None,
+                "output_size": get_size(result),
+                "allocated_blocks": sys.getallocatedblocks() - blocks,
+            })
+            return result
+
+        return wrapper
+
+    return decorator
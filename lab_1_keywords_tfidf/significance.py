@@ -0,0 +1,221 @@
+"""
+Lab 1.
+
+Chi-squared critical values and significance filters for arbitrary alpha
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Sequence
+
+from lab_1_keywords_tfidf.main import check_dict, check_float, check_positive_int
+
+#: Relative precision of series, continued fractions and root search
+EPSILON = 1e-14
+
+#: Smallest number which is safe to divide by in continued fractions
+TINY = 1e-300
+
+#: Maximum number of iterations of series and continued fractions
+MAX_ITERATIONS = 1000
+
+
+def _lower_gamma_series(shape: float, value: float) -> float:
+    """
+    Calculate the regularized lower incomplete gamma function with a series.
+
+    Converges quickly for value < shape + 1.
+
+    Args:
+        shape (float): Shape parameter
+        value (float): Upper limit of integration
+
+    Returns:
+        float: Value of P(shape, value)
+    """
+    term = total = 1.0 / shape
+    denominator = shape
+    for _ in range(MAX_ITERATIONS):
+        denominator += 1
+        term *= value / denominator
+        total += term
+        if abs(term) < abs(total) * EPSILON:
+            break
+    return total * math.exp(-value + shape * math.log(value) - math.lgamma(shape))
+
+
+def _upper_gamma_fraction(shape: float, value: float) -> float:
+    """
+    Calculate the regularized upper incomplete gamma function with a continued fraction.
+
+    Converges quickly for value >= shape + 1.
+
+    Args:
+        shape (float): Shape parameter
+        value (float): Lower limit of integration
+
+    Returns:
+        float: Value of Q(shape, value)
+    """
+    b_term = value + 1 - shape
+    c_term = 1 / TINY
+    d_term = 1 / b_term
+    fraction = d_term
+    for index in range(1, MAX_ITERATIONS):
+        a_term = -index * (index - shape)
+        b_term += 2
+        d_term = a_term * d_term + b_term
+        d_term = TINY if abs(d_term) < TINY else d_term
+        c_term = b_term + a_term / c_term
+        c_term = TINY if abs(c_term) < TINY else c_term
+        d_term = 1 / d_term
+        delta = d_term * c_term
+        fraction *= delta
+        if abs(delta - 1) < EPSILON:
+            break
+    return fraction * math.exp(-value + shape * math.log(value) - math.lgamma(shape))
+
+
+def chi_squared_survival(chi_value: float, degrees_of_freedom: int = 1) -> float | None:
+    """
+    Calculate the probability that a chi-squared variable exceeds the value.
+
+    Args:
+        chi_value (float): Chi-squared value
+        degrees_of_freedom (int): Degrees of freedom of the distribution
+
+    Returns:
+        float | None: Upper tail probability (p-value).
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if (
+        not isinstance(chi_value, (int, float))
+        or isinstance(chi_value, bool)
+        or not check_positive_int(degrees_of_freedom)
+    ):
+        return None
+    if chi_value <= 0:
+        return 1.0
+    shape, value = degrees_of_freedom / 2, chi_value / 2
+    if value < shape + 1:
+        return 1.0 - _lower_gamma_series(shape, value)
+    return _upper_gamma_fraction(shape, value)
+
+
+@lru_cache(maxsize=None)
+def _critical_value(alpha: float, degrees_of_freedom: int) -> float:
+    """
+    Find the chi-squared value with the given upper tail probability.
+
+    Args:
+        alpha (float): Significance level in range (0, 1)
+        degrees_of_freedom (int): Degrees of freedom of the distribution
+
+    Returns:
+        float: Critical value
+    """
+    low, high = 0.0, float(max(1, degrees_of_freedom))
+    while (chi_squared_survival(high, degrees_of_freedom) or 0.0) > alpha:
+        low, high = high, high * 2
+    while high - low > EPSILON * high:
+        middle = (low + high) / 2
+        if (chi_squared_survival(middle, degrees_of_freedom) or 0.0) > alpha:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def chi_squared_critical_value(alpha: float, degrees_of_freedom: int = 1) -> float | None:
+    """
+    Calculate the chi-squared critical value for any significance level.
+
+    Values are memoized, so repeated requests for the same level are free.
+
+    Args:
+        alpha (float): Significance level in range (0, 1)
+        degrees_of_freedom (int): Degrees of freedom of the distribution
+
+    Returns:
+        float | None: Value exceeded by a chi-squared variable with probability alpha.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not check_float(alpha) or not 0 < alpha < 1 or not check_positive_int(degrees_of_freedom):
+        return None
+    return _critical_value(alpha, degrees_of_freedom)
+
+
+def filter_above(values: Sequence[float], threshold: float) -> array:
+    """
+    Select positions of values exceeding the threshold.
+
+    Args:
+        values (Sequence[float]): Scores, for example an array of chi-squared values
+        threshold (float): Critical value
+
+    Returns:
+        array: Positions of values greater than the threshold in ascending order
+    """
+    return array('q', [index for index, value in enumerate(values) if value > threshold])
+
+
+def sweep_significance(
+    values: Sequence[float], alphas: list[float], degrees_of_freedom: int = 1
+) -> dict[float, array] | None:
+    """
+    Select significant values for several significance levels in one pass.
+
+    Every value is placed among the sorted critical values with a binary search,
+    so the scores are traversed once whatever the number of levels is.
+
+    Args:
+        values (Sequence[float]): Chi-squared values
+        alphas (list[float]): Significance levels
+        degrees_of_freedom (int): Degrees of freedom of the distribution
+
+    Returns:
+        dict[float, array] | None: Positions of significant values for every level.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not isinstance(alphas, list) or not alphas:
+        return None
+    criteria = {}
+    for alpha in alphas:
+        threshold = chi_squared_critical_value(alpha, degrees_of_freedom)
+        if threshold is None:
+            return None
+        criteria[alpha] = threshold
+    levels = sorted(criteria, key=criteria.__getitem__)
+    thresholds = [criteria[alpha] for alpha in levels]
+    positions = [array('q') for _ in levels]
+    for index, value in enumerate(values):
+        for level in range(bisect_left(thresholds, value)):
+            positions[level].append(index)
+    return {alpha: positions[levels.index(alpha)] for alpha in alphas}
+
+
+def extract_significant(
+    chi_values: dict[str, float], alpha: float, degrees_of_freedom: int = 1
+) -> dict[str, float] | None:
+    """
+    Select tokens with chi-squared values greater than the critical value of any level.
+
+    Args:
+        chi_values (dict[str, float]): Dictionary with chi-squared values
+        alpha (float): Significance level in range (0, 1)
+        degrees_of_freedom (int): Degrees of freedom of the distribution
+
+    Returns:
+        dict[str, float] | None: Dictionary with significant tokens.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    threshold = chi_squared_critical_value(alpha, degrees_of_freedom)
+    if threshold is None or not check_dict(chi_values, str, float, False):
+        return None
+    return {token: value for token, value in chi_values.items() if value > threshold}
@@ -0,0 +1,212 @@
+"""
+Lab 1.
+
+Cosine similarity search over TF-IDF vectors with an inverted index
+"""
+
+import heapq
+import math
+from array import array
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, check_positive_int
+from lab_1_keywords_tfidf.sparse_matrix import DocumentTermMatrix
+
+SimilarityType = tuple[int, float]
+"Type alias for a document identifier and its cosine similarity to a query."
+
+
+def normalize(vector: dict[str, float]) -> dict[str, float]:
+    """
+    Scale a sparse vector to unit Euclidean length.
+
+    Args:
+        vector (dict[str, float]): Dictionary with terms and their weights
+
+    Returns:
+        dict[str, float]: Vector of unit length, empty for a zero vector
+    """
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    if not norm:
+        return {}
+    return {term: value / norm for term, value in vector.items() if value}
+
+
+class SimilarityIndex:
+    """
+    Inverted index of L2-normalized TF-IDF vectors answering top-K cosine queries.
+
+    Every term keeps a posting list of document identifiers and normalized
+    weights in typed arrays. A query accumulates dot products only over the
+    posting lists of its own terms, so documents sharing no terms with the
+    query are never touched.
+
+    Attributes:
+        _postings (dict[str, tuple[array, array]]): Identifiers of documents
+            containing a term and weights of the term in them
+        _documents (int): Number of indexed documents
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of SimilarityIndex.
+        """
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._documents = 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed documents.
+
+        Returns:
+            int: Number of documents
+        """
+        return self._documents
+
+    def add(self, vector: dict[str, float]) -> int | None:
+        """
+        Index a document vector, for example the result of calculate_tfidf.
+
+        Args:
+            vector (dict[str, float]): Dictionary with terms and their weights
+
+        Returns:
+            int | None: Identifier of the document, equal to the number of documents added before.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not check_dict(vector, str, float, True):
+            return None
+        document_id = self._documents
+        self._documents += 1
+        for term, weight in normalize(vector).items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array('i'), array('f'))
+            posting[0].append(document_id)
+            posting[1].append(weight)
+        return document_id
+
+    def query(self, vector: dict[str, float], top: int = 10) -> list[SimilarityType] | None:
+        """
+        Find documents most similar to a vector.
+
+        Args:
+            vector (dict[str, float]): Dictionary with query terms and their weights
+            top (int): Number of documents to return
+
+        Returns:
+            list[SimilarityType] | None: Identifiers and cosine similarities of documents
+                in descending order of similarity, ties broken by smaller identifier.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not check_dict(vector, str, float, True) or not check_positive_int(top):
+            return None
+        return self._search(normalize(vector), top)
+
+    def query_batch(
+        self, vectors: list[dict[str, float]], top: int = 10
+    ) -> list[list[SimilarityType]] | None:
+        """
+        Find documents most similar to every vector of a batch.
+
+        The batch is validated once, then every query is answered as by query.
+
+        Args:
+            vectors (list[dict[str, float]]): Query vectors
+            top (int): Number of documents to return for every query
+
+        Returns:
+            list[list[SimilarityType]] | None: Results of queries in the same order.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if (
+            not check_list(vectors, dict, True)
+            or not all(check_dict(vector, str, float, True) for vector in vectors)
+            or not check_positive_int(top)
+        ):
+            return None
+        return [self._search(normalize(vector), top) for vector in vectors]
+
+    def find_near_duplicates(self, threshold: float = 0.9) -> list[tuple[int, int, float]] | None:
+        """
+        Find pairs of indexed documents with cosine similarity above the threshold.
+
+        Args:
+            threshold (float): Minimal similarity of near-duplicates in range (0, 1]
+
+        Returns:
+            list[tuple[int, int, float]] | None: Identifiers of both documents, the smaller
+                first, and their similarity, ordered by identifiers.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if (
+            not isinstance(threshold, (int, float))
+            or isinstance(threshold, bool)
+            or not 0 < threshold <= 1
+        ):
+            return None
+        vectors: list[dict[str, float]] = [{} for _ in range(self._documents)]
+        for term, (ids, weights) in self._postings.items():
+            for document_id, weight in zip(ids, weights):
+                vectors[document_id][term] = weight
+        pairs = []
+        for document_id, vector in enumerate(vectors):
+            scores = self._accumulate(vector)
+            pairs.extend((document_id, other_id, score)
+                         for other_id, score in sorted(scores.items())
+                         if other_id > document_id and score >= threshold)
+        return pairs
+
+    def _accumulate(self, vector: dict[str, float]) -> dict[int, float]:
+        """
+        Accumulate dot products of a normalized vector with indexed documents.
+
+        Args:
+            vector (dict[str, float]): Normalized query vector
+
+        Returns:
+            dict[int, float]: Dot products of documents sharing terms with the vector
+        """
+        scores: dict[int, float] = {}
+        postings = self._postings
+        for term, query_weight in vector.items():
+            posting = postings.get(term)
+            if posting is None:
+                continue
+            for document_id, weight in zip(*posting):
+                scores[document_id] = scores.get(document_id, 0.0) + query_weight * weight
+        return scores
+
+    def _search(self, vector: dict[str, float], top: int) -> list[SimilarityType]:
+        """
+        Select the most similar documents for a normalized vector with a bounded heap.
+
+        Args:
+            vector (dict[str, float]): Normalized query vector
+            top (int): Number of documents to return
+
+        Returns:
+            list[SimilarityType]: Identifiers and cosine similarities of documents
+        """
+        scores = self._accumulate(vector)
+        return heapq.nsmallest(top, scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def index_matrix(matrix: DocumentTermMatrix) -> SimilarityIndex:
+    """
+    Index every row of a document-term matrix, keeping row positions as identifiers.
+
+    Args:
+        matrix (DocumentTermMatrix): TF-IDF weighted matrix
+
+    Returns:
+        SimilarityIndex: Index of the matrix documents
+    """
+    index = SimilarityIndex()
+    vocabulary = matrix.get_vocabulary()
+    for columns, weights in matrix.iter_rows():
+        index.add({vocabulary[column]: float(weight) for column, weight in zip(columns, weights)})
+    return index
@@ -0,0 +1,377 @@
+"""
+Lab 1.
+
+Sparse document-term matrix in compressed sparse row (CSR) format
+"""
+
+import mmap
+import struct
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Literal, Sequence
+
+from lab_1_keywords_tfidf.main import check_dict, check_list
+
+WeightingType = Literal["tf", "tfidf"]
+"Type alias for weighting schemes of document-term matrices."
+
+MatrixArraysType = tuple[Sequence[int], Sequence[int], Sequence[float]]
+"Type alias for row boundaries, column indices and weights of a CSR matrix."
+
+#: Codes of weighting schemes in matrix files
+WEIGHTING_CODES: dict[WeightingType, int] = {"tf": 0, "tfidf": 1}
+
+#: Signature of the matrix file
+MATRIX_MAGIC = b"L1CSRMAT"
+
+#: Version of the matrix file layout
+MATRIX_VERSION = 1
+
+#: Header layout: signature, version, weighting code, rows, columns, stored values
+HEADER_FORMAT = "<8sIIQQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+class DocumentTermMatrix:
+    """
+    Documents as rows of a CSR matrix over a fixed vocabulary.
+
+    Row i keeps its column indices in indices[indptr[i]:indptr[i + 1]] in
+    ascending order and their weights at the same positions of data. Column
+    indices are int32 and weights are float32, which takes 8 bytes per stored
+    value instead of a dictionary entry with a string key and a float object.
+
+    A matrix is either built in memory from typed arrays or loaded from a file
+    with load_matrix, in which case the arrays are views of a memory map.
+
+    Attributes:
+        _indptr (Sequence[int]): Boundaries of rows in indices and data
+        _indices (Sequence[int]): Column indices of stored values
+        _data (Sequence[float]): Stored weights
+        _vocabulary (list[str]): Terms ordered by their column indices
+        _weighting (WeightingType): Weighting scheme of stored values
+        _resources (tuple[mmap.mmap, BinaryIO] | tuple[()]): Memory map and file
+            to release on closing
+    """
+
+    def __init__(
+        self,
+        arrays: MatrixArraysType,
+        vocabulary: list[str],
+        weighting: WeightingType,
+        resources: tuple[mmap.mmap, BinaryIO] | tuple[()] = (),
+    ) -> None:
+        """
+        Initialize an instance of DocumentTermMatrix.
+
+        Args:
+            arrays (MatrixArraysType): Boundaries of rows in indices and data,
+                column indices of stored values and stored weights
+            vocabulary (list[str]): Terms ordered by their column indices
+            weighting (WeightingType): Weighting scheme of stored values
+            resources (tuple[mmap.mmap, BinaryIO] | tuple[()]): Memory map and file
+                the arrays are views of, released on closing
+        """
+        indptr, indices, data = arrays
+        if (
+            not indptr
+            or indptr[0] != 0
+            or indptr[-1] != len(indices)
+            or len(indices) != len(data)
+            or weighting not in WEIGHTING_CODES
+        ):
+            raise ValueError('Invalid input: inconsistent matrix arrays')
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+        self._vocabulary = vocabulary
+        self._weighting = weighting
+        self._resources = resources
+
+    def __enter__(self) -> "DocumentTermMatrix":
+        """
+        Enter the runtime context of the matrix.
+
+        Returns:
+            DocumentTermMatrix: The matrix itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the matrix on leaving the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Get the number of documents.
+
+        Returns:
+            int: Number of rows
+        """
+        return len(self._indptr) - 1
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file of a loaded matrix.
+
+        Rows returned by get_row and iter_rows are views of the memory map
+        too. They stay readable after closing, and the map is unmapped once
+        the last of them is released or garbage collected.
+        """
+        for view in (self._indptr, self._indices, self._data):
+            if isinstance(view, memoryview):
+                view.release()
+        if self._resources:
+            mapped, file = self._resources
+            file.close()
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._resources = ()
+
+    def get_shape(self) -> tuple[int, int]:
+        """
+        Get the numbers of documents and terms.
+
+        Returns:
+            tuple[int, int]: Numbers of rows and columns
+        """
+        return len(self), len(self._vocabulary)
+
+    def get_nnz(self) -> int:
+        """
+        Get the number of stored values.
+
+        Returns:
+            int: Number of non-zero weights
+        """
+        return len(self._data)
+
+    def get_weighting(self) -> WeightingType:
+        """
+        Get the weighting scheme of stored values.
+
+        Returns:
+            WeightingType: Either TF or TF-IDF
+        """
+        return self._weighting
+
+    def get_vocabulary(self) -> list[str]:
+        """
+        Get terms ordered by their column indices.
+
+        Returns:
+            list[str]: Vocabulary of the matrix
+        """
+        return self._vocabulary
+
+    def get_row(self, index: int) -> tuple[Sequence[int], Sequence[float]] | None:
+        """
+        Get column indices and weights of a document without copying them.
+
+        Args:
+            index (int): Position of the document
+
+        Returns:
+            tuple[Sequence[int], Sequence[float]] | None: Column indices and weights.
+
+        In case of unknown position, None is returned.
+        """
+        if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < len(self):
+            return None
+        start, end = self._indptr[index], self._indptr[index + 1]
+        return self._indices[start:end], self._data[start:end]
+
+    def iter_rows(self) -> Iterator[tuple[Sequence[int], Sequence[float]]]:
+        """
+        Iterate over column indices and weights of all documents.
+
+        Yields:
+            tuple[Sequence[int], Sequence[float]]: Column indices and weights of a document
+        """
+        indptr, indices, data = self._indptr, self._indices, self._data
+        for index in range(len(self)):
+            start, end = indptr[index], indptr[index + 1]
+            yield indices[start:end], data[start:end]
+
+    def to_dict(self, index: int) -> dict[str, float] | None:
+        """
+        Convert a document to a dictionary of main.py functions.
+
+        Args:
+            index (int): Position of the document
+
+        Returns:
+            dict[str, float] | None: Dictionary with terms and their weights.
+
+        In case of unknown position, None is returned.
+        """
+        row = self.get_row(index)
+        if row is None:
+            return None
+        vocabulary = self._vocabulary
+        return {vocabulary[column]: float(value) for column, value in zip(*row)}
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the matrix to a file which can be memory mapped by load_matrix.
+
+        The file contains a header, the int64 row boundaries, the int32 column
+        indices, the float32 weights, the int64 offsets of terms and the UTF-8
+        terms in column order. Every section starts at a multiple of 8 bytes.
+
+        Args:
+            path (str | Path): Path of the matrix file
+        """
+        if not isinstance(path, (str, Path)) or not str(path):
+            raise ValueError('Invalid path')
+        encoded_terms = [term.encode("utf-8") for term in self._vocabulary]
+        offsets = array('q', [0])
+        for term in encoded_terms:
+            offsets.append(offsets[-1] + len(term))
+        nnz = self.get_nnz()
+        with open(path, "wb") as file:
+            file.write(struct.pack(
+                HEADER_FORMAT, MATRIX_MAGIC, MATRIX_VERSION, WEIGHTING_CODES[self._weighting],
+                len(self), len(self._vocabulary), nnz
+            ))
+            for values, typecode in ((self._indptr, 'q'), (self._indices, 'i'), (self._data, 'f')):
+                file.write(values if isinstance(values, (array, memoryview))
+                           else array(typecode, values))
+            file.write(offsets)
+            file.write(b"".join(encoded_terms))
+
+
+def build_matrix(
+    documents: Iterable[list[str]], idf: dict[str, float], weighting: WeightingType = "tfidf"
+) -> DocumentTermMatrix | None:
+    """
+    Build a document-term matrix over the vocabulary of IDF values.
+
+    Term Frequency of a term is its count divided by the number of all tokens
+    of the document, as in calculate_tf, so tokens missing from the vocabulary
+    are not stored but still count in the document length. TF-IDF weights are
+    equal to calculate_tfidf values of vocabulary terms.
+
+    Args:
+        documents (Iterable[list[str]]): Tokens of documents without stop words
+        idf (dict[str, float]): Inverse document frequency values, for example IDF.json
+        weighting (WeightingType): Weighting scheme of stored values
+
+    Returns:
+        DocumentTermMatrix | None: Matrix with a row for every document.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not check_dict(idf, str, float, True) or weighting not in WEIGHTING_CODES:
+        return None
+    columns = {term: column for column, term in enumerate(idf)}
+    idf_values = array('d', idf.values()) if weighting == "tfidf" else None
+    indptr = array('q', [0])
+    indices = array('i')
+    data = array('f')
+    for tokens in documents:
+        if not check_list(tokens, str, True):
+            return None
+        counts: dict[int, int] = {}
+        for token in tokens:
+            column = columns.get(token)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+        total = len(tokens)
+        for column in sorted(counts):
+            indices.append(column)
+            value = counts[column] / total
+            data.append(value * idf_values[column] if idf_values is not None else value)
+        indptr.append(len(indices))
+    return DocumentTermMatrix((indptr, indices, data), list(idf), weighting)
+
+
+def _read_header(view: memoryview) -> tuple[WeightingType, int, tuple[int, ...]]:
+    """
+    Read the header of a matrix file.
+
+    Args:
+        view (memoryview): Contents of the matrix file
+
+    Returns:
+        tuple[WeightingType, int, tuple[int, ...]]: Weighting scheme, number of columns
+            and starts of the row boundaries, column indices, weights and term offsets
+    """
+    magic, version, weighting_code, rows, columns, nnz = struct.unpack_from(HEADER_FORMAT, view)
+    weightings = {code: weighting for weighting, code in WEIGHTING_CODES.items()}
+    if magic != MATRIX_MAGIC or version != MATRIX_VERSION or weighting_code not in weightings:
+        raise ValueError('Invalid matrix file')
+    indices_start = HEADER_SIZE + 8 * (rows + 1)
+    data_start = indices_start + 4 * nnz
+    return weightings[weighting_code], columns, (
+        HEADER_SIZE, indices_start, data_start, data_start + 4 * nnz
+    )
+
+
+def _read_vocabulary(view: memoryview, offsets_start: int, columns: int) -> list[str]:
+    """
+    Decode terms of a matrix file.
+
+    Args:
+        view (memoryview): Contents of the matrix file
+        offsets_start (int): Start of the term offsets
+        columns (int): Number of terms
+
+    Returns:
+        list[str]: Terms ordered by their column indices
+    """
+    terms_start = offsets_start + 8 * (columns + 1)
+    if len(view) < terms_start:
+        raise ValueError('Invalid matrix file')
+    with view[offsets_start:terms_start].cast("q") as offsets:
+        if len(view) < terms_start + offsets[columns]:
+            raise ValueError('Invalid matrix file')
+        return [bytes(view[terms_start + offsets[column]:terms_start + offsets[column + 1]])
+                .decode("utf-8") for column in range(columns)]
+
+
+def load_matrix(path: str | Path) -> DocumentTermMatrix:
+    """
+    Map a matrix file written by DocumentTermMatrix.save into memory.
+
+    Nothing but the vocabulary is deserialized: rows are read directly from
+    the mapped file, and its pages are shared by all processes which load it.
+    The matrix should be closed when it is no longer needed.
+
+    Args:
+        path (str | Path): Path of the matrix file
+
+    Returns:
+        DocumentTermMatrix: Memory-mapped matrix
+    """
+    file = open(path, "rb")  # pylint: disable=consider-using-with
+    with ExitStack() as release:
+        release.callback(file.close)
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:
+            raise ValueError('Invalid matrix file') from error
+        release.callback(mapped.close)
+        view = release.enter_context(memoryview(mapped))
+        try:
+            weighting, columns, starts = _read_header(view)
+            vocabulary = _read_vocabulary(view, starts[3], columns)
+            arrays = (
+                release.enter_context(view[starts[0]:starts[1]].cast("q")),
+                release.enter_context(view[starts[1]:starts[2]].cast("i")),
+                release.enter_context(view[starts[2]:starts[3]].cast("f")),
+            )
+            matrix = DocumentTermMatrix(arrays, vocabulary, weighting, (mapped, file))
+        except (ValueError, struct.error) as error:
+            raise ValueError('Invalid matrix file') from error
+        release.pop_all()
+    view.release()
+    return matrix
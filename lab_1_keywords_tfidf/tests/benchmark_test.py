@@ -0,0 +1,185 @@
+"""
+Checks the first lab benchmark suite
+"""
+
+import io
+import json
+import runpy
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.benchmark import (
+    benchmark_chi_squared,
+    benchmark_document_term_matrix,
+    benchmark_stages,
+    benchmark_tokenizers,
+    benchmark_vocabulary_index,
+    generate_zipf_corpus,
+    get_revision,
+    get_zipf_vocabulary,
+    main,
+    measure_memory,
+    read_assets,
+    read_fairy_tales,
+    RESULTS_PATH,
+    run_suite,
+    STAGES,
+    SuiteConfig,
+)
+from lab_1_keywords_tfidf.main import calculate_frequencies, clean_and_tokenize
+
+
+class BenchmarkTest(unittest.TestCase):
+    """
+    Tests synthetic corpora and stage measurements of the benchmark suite
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up small corpora of benchmark tests class.
+        """
+        self.texts = ["Кот и пёс гуляли.", "Пёс спал, кот гулял!"]
+        self.stop_words = ["и"]
+        self.idf = {"кот": 0.5, "пёс": 1.5}
+        self.corpus_freqs = {"кот": 10, "пёс": 3}
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_zipf_corpus(self) -> None:
+        """
+        Synthetic corpora are reproducible and ranked words are more frequent
+        """
+        vocabulary = get_zipf_vocabulary({"b": 5, "a": 5, "c": 10, "d": 1}, 3)
+        self.assertEqual(["c", "a", "b"], vocabulary)
+        words = [f"слово{index}" for index in range(100)]
+        corpus = generate_zipf_corpus(words, 3, 2000, seed=7)
+        self.assertEqual(corpus, generate_zipf_corpus(words, 3, 2000, seed=7))
+        self.assertNotEqual(corpus, generate_zipf_corpus(words, 3, 2000, seed=8))
+        self.assertEqual(3, len(corpus))
+        tokens = clean_and_tokenize(" ".join(corpus)) or []
+        self.assertEqual(6000, len(tokens))
+        frequencies = calculate_frequencies(tokens) or {}
+        self.assertGreater(frequencies["слово0"], 5 * frequencies.get("слово50", 0))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_stage_results(self) -> None:
+        """
+        Every stage is measured and results are JSON-serializable
+        """
+        results = benchmark_stages(self.texts, self.stop_words, {"кот": 0.5}, self.corpus_freqs,
+                                   repeats=1)
+        self.assertEqual(2, results["documents"])
+        self.assertEqual(8, results["tokens"])
+        self.assertEqual(list(STAGES), list(results["stages"]))
+        for measurement in results["stages"].values():
+            self.assertGreater(measurement["seconds"], 0)
+            self.assertGreater(measurement["tokens_per_second"], 0)
+            self.assertGreaterEqual(measurement["peak_memory_bytes"], 0)
+        self.assertEqual(results, json.loads(json.dumps(results)))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_assets(self) -> None:
+        """
+        Fairy tales and lab assets are read
+        """
+        texts = read_fairy_tales()
+        self.assertTrue(texts)
+        self.assertTrue(all(isinstance(text, str) and text for text in texts))
+        stop_words, idf, corpus_freqs = read_assets()
+        self.assertIn("и", stop_words)
+        self.assertTrue(idf)
+        self.assertTrue(corpus_freqs)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_revision(self) -> None:
+        """
+        Revision is a commit hash or None outside a git repository
+        """
+        revision = get_revision()
+        if revision is not None:
+            self.assertEqual(40, len(revision))
+        for error in (OSError(), subprocess.CalledProcessError(128, "git")):
+            with mock.patch("lab_1_keywords_tfidf.benchmark.subprocess.run", side_effect=error):
+                self.assertIsNone(get_revision())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_comparisons(self) -> None:
+        """
+        Alternative implementations are measured for every way of processing
+        """
+        tokenizers = benchmark_tokenizers(self.texts, repeats=1)
+        self.assertEqual(["clean_and_tokenize", "clean_and_tokenize_fast"], list(tokenizers))
+        scorers = benchmark_chi_squared(self.texts, self.stop_words, self.corpus_freqs, repeats=1)
+        self.assertEqual(["chain of main.py functions", "ChiSquaredScorer"], list(scorers))
+        for throughput in [*tokenizers.values(), *scorers.values()]:
+            self.assertGreater(throughput, 0)
+        representations = benchmark_document_term_matrix(
+            self.texts, self.stop_words, self.idf, repeats=1
+        )
+        self.assertEqual(["list of TF-IDF dictionaries", "DocumentTermMatrix"],
+                         list(representations))
+        for throughput, size in representations.values():
+            self.assertGreater(throughput, 0)
+            self.assertGreater(size, 0)
+        index_scorers = benchmark_vocabulary_index(
+            self.texts, self.stop_words, self.idf, self.corpus_freqs, repeats=1
+        )
+        self.assertEqual(["chain of main.py functions", "VocabularyIndex"], list(index_scorers))
+        for throughput, size in index_scorers.values():
+            self.assertGreater(throughput, 0)
+            self.assertGreater(size, 0)
+        result, allocated = measure_memory(lambda: [0] * 10000)
+        self.assertEqual([0] * 10000, result)
+        self.assertGreaterEqual(allocated, 10000 * 8)
+        with self.assertRaises(ZeroDivisionError):
+            measure_memory(lambda: 1 / 0)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_suite_and_report(self) -> None:
+        """
+        The suite covers both corpora and the report is stored as JSON
+        """
+        with mock.patch("lab_1_keywords_tfidf.benchmark.read_fairy_tales",
+                        return_value=self.texts):
+            results = run_suite(SuiteConfig(documents=2, document_length=30, vocabulary_size=50,
+                                            repeats=1))
+            self.assertEqual(["zipf", "fairy_tales.zip"], list(results["corpora"]))
+            self.assertEqual(2, results["corpora"]["zipf"]["documents"])
+            self.assertEqual(30, results["settings"]["document_length"])
+            with tempfile.TemporaryDirectory() as directory:
+                output = Path(directory) / "results.json"
+                arguments = ["benchmark.py", "--output", str(output), "--documents", "2",
+                             "--document-length", "30", "--vocabulary-size", "50",
+                             "--repeats", "1"]
+                with mock.patch.object(sys, "argv", arguments), \
+                        redirect_stdout(io.StringIO()) as stdout:
+                    main()
+                with open(output, "r", encoding="utf-8") as file:
+                    self.assertEqual(list(results), list(json.load(file)))
+        self.assertIn(f"Results are stored in {output}", stdout.getvalue())
+        self.assertFalse(RESULTS_PATH.is_absolute())
+        self.assertIn("DocumentTermMatrix", stdout.getvalue())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_script(self) -> None:
+        """
+        The module runs as a script
+        """
+        with mock.patch.object(sys, "argv", ["benchmark.py", "--help"]), \
+                redirect_stdout(io.StringIO()) as stdout, self.assertRaises(SystemExit):
+            runpy.run_path(str(Path(__file__).parent.parent / "benchmark.py"),
+                           run_name="__main__")
+        self.assertIn("--vocabulary-size", stdout.getvalue())
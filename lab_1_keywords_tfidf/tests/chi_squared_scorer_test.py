@@ -0,0 +1,75 @@
+"""
+Checks the first lab fused chi-squared scorer
+"""
+
+# pylint: disable=duplicate-code
+import json
+import unittest
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.main import (
+    calculate_chi_values,
+    calculate_expected_frequency,
+    calculate_frequencies,
+    clean_and_tokenize,
+    extract_significant_words,
+)
+from lab_1_keywords_tfidf.pipeline import ChiSquaredScorer
+
+
+class ChiSquaredScorerTest(unittest.TestCase):
+    """
+    Tests fused chi-squared scorer
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up resources of fused chi-squared scorer tests class.
+        """
+        assets = Path(__file__).parent.parent / "assets"
+        with zipfile.ZipFile(assets / "fairy_tales.zip", "r") as archive:
+            self.texts = [archive.read(name).decode("utf-8") for name in archive.namelist()[:10]]
+        with open(assets / "corpus_frequencies.json", "r", encoding="utf-8") as file:
+            self.corpus_freqs = json.load(file)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_score_matches_chain(self) -> None:
+        """
+        Fused scorer gives the same significant words as main.py functions
+        """
+        for alpha in (0.05, 0.01, 0.001):
+            scorer = ChiSquaredScorer(self.corpus_freqs, alpha)
+            for text in self.texts:
+                tokens = clean_and_tokenize(text) or []
+                frequencies = calculate_frequencies(tokens) or {}
+                expected_freqs = calculate_expected_frequency(frequencies, self.corpus_freqs)
+                chi_values = calculate_chi_values(expected_freqs or {}, frequencies) or {}
+                expected = extract_significant_words(chi_values, alpha)
+                self.assertEqual(expected, scorer.score(frequencies))
+                self.assertEqual(expected, scorer.score_tokens(tokens))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_score_empty_and_bad_input(self) -> None:
+        """
+        Empty documents and corrupt inputs give None
+        """
+        scorer = ChiSquaredScorer({"cat": 100})
+        self.assertIsNone(scorer.score({}))
+        self.assertIsNone(scorer.score_tokens([]))
+        self.assertIsNone(scorer.score(None))  # type: ignore[arg-type]
+        self.assertIsNone(scorer.score_tokens("cat"))  # type: ignore[arg-type]
+        self.assertIsNone(scorer.score({"cat": "x"}))  # type: ignore[dict-item]
+        self.assertIsNone(scorer.score({1: 2}))  # type: ignore[dict-item]
+        self.assertIsNone(scorer.score({"dog": 0}))
+        self.assertIsNone(scorer.score({"cat": 2, "dog": -1}))
+        self.assertIsNone(scorer.score_tokens([1, 2]))  # type: ignore[list-item]
+        self.assertEqual({}, scorer.score({"cat": 1}))
+        with self.assertRaises(ValueError):
+            ChiSquaredScorer({"cat": 1.0})  # type: ignore[dict-item]
+        with self.assertRaises(ValueError):
+            ChiSquaredScorer({"cat": 1}, 2.0)
@@ -0,0 +1,192 @@
+"""
+Checks the first lab mergeable corpus aggregates
+"""
+
+import json
+import unittest
+
+import pytest
+
+from lab_1_keywords_tfidf.aggregates import (
+    _aggregate_in_worker,
+    _init_worker,
+    _WORKER_STATE,
+    aggregate_corpus,
+    build_aggregate,
+    CorpusAggregate,
+    load_aggregate,
+    merge_aggregates,
+)
+from lab_1_keywords_tfidf.main import (
+    calculate_frequencies,
+    calculate_tf,
+    calculate_tfidf,
+    clean_and_tokenize,
+    remove_stop_words,
+)
+
+
+class CorpusAggregateTest(unittest.TestCase):
+    """
+    Tests mergeable corpus aggregates
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up corpus of corpus aggregate tests class.
+        """
+        self.texts = [
+            "The cat sat on the mat.",
+            "A dog chased the cat!",
+            "Birds sing; the dog sleeps.",
+            "Cat, dog and bird.",
+            "The mat is red.",
+            "Red birds, red cats.",
+        ]
+        self.stop_words = ["the", "a", "on", "is", "and"]
+        self.idf = {"cat": 0.5, "dog": 1.0, "mat": 2.0, "red": 1.2, "bird": 3.0}
+
+    def assert_aggregates_equal(self, expected: CorpusAggregate, actual: CorpusAggregate) -> None:
+        """
+        Compare aggregates up to rounding of TF-IDF sums.
+
+        Args:
+            expected (CorpusAggregate): Expected aggregate
+            actual (CorpusAggregate): Actual aggregate
+        """
+        expected_dict, actual_dict = expected.to_dict(), actual.to_dict()
+        for key in ("documents", "term_counts", "document_freqs"):
+            self.assertEqual(expected_dict[key], actual_dict[key])
+        self.assertEqual(expected_dict["tfidf_sums"].keys(), actual_dict["tfidf_sums"].keys())
+        for token, value in expected_dict["tfidf_sums"].items():
+            self.assertAlmostEqual(value, actual_dict["tfidf_sums"][token])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_aggregate_matches_lab_functions(self) -> None:
+        """
+        Statistics of a shard are sums of lab 1 function results
+        """
+        aggregate = build_aggregate(self.texts, self.stop_words, self.idf)
+        if aggregate is None:
+            self.fail("Aggregate is not built")
+        term_counts: dict[str, int] = {}
+        tfidf_sums: dict[str, float] = {}
+        for text in self.texts:
+            tokens = remove_stop_words(clean_and_tokenize(text) or [], self.stop_words) or []
+            frequencies = calculate_frequencies(tokens) or {}
+            for token, count in frequencies.items():
+                term_counts[token] = term_counts.get(token, 0) + count
+            tfidf = calculate_tfidf(calculate_tf(frequencies) or {}, self.idf) or {}
+            for token, value in tfidf.items():
+                tfidf_sums[token] = tfidf_sums.get(token, 0.0) + value
+
+        statistics = aggregate.to_dict()
+        self.assertEqual(statistics["term_counts"], aggregate.get_term_counts())
+        self.assertEqual(statistics["document_freqs"], aggregate.get_document_freqs())
+        self.assertEqual(statistics["tfidf_sums"], aggregate.get_tfidf_sums())
+        self.assertEqual(len(self.texts), len(aggregate))
+        self.assertEqual(term_counts, statistics["term_counts"])
+        self.assertEqual(3, statistics["document_freqs"]["cat"])
+        self.assertEqual(1, statistics["document_freqs"]["cats"])
+        self.assertEqual(2, statistics["document_freqs"]["red"])
+        for token, value in tfidf_sums.items():
+            self.assertAlmostEqual(value, statistics["tfidf_sums"][token])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_merge_is_associative_and_commutative(self) -> None:
+        """
+        Shards merged in any grouping and order give the same aggregate
+        """
+        shards = [build_aggregate(self.texts[index:index + 2], self.stop_words, self.idf)
+                  for index in range(0, len(self.texts), 2)]
+        first, second, third = [shard or CorpusAggregate() for shard in shards]
+        whole = build_aggregate(self.texts, self.stop_words, self.idf) or CorpusAggregate()
+
+        left = first.merge(second).merge(third)
+        right = first.merge(second.merge(third))
+        reordered = merge_aggregates([third, first, second])
+        for merged in (left, right, reordered):
+            self.assert_aggregates_equal(whole, merged)
+            for metric in ("count", "documents", "tfidf"):
+                self.assertEqual(whole.get_top(3, metric),  # type: ignore[arg-type]
+                                 merged.get_top(3, metric))  # type: ignore[arg-type]
+        self.assertEqual(2, len(first))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_top_ties_are_alphabetical(self) -> None:
+        """
+        Tokens with equal statistics are ranked alphabetically
+        """
+        aggregate = CorpusAggregate(2, {"b": 2, "a": 2, "c": 5}, {"b": 1, "a": 1, "c": 2},
+                                    {"b": 0.5, "a": 0.5, "c": 0.1})
+        self.assertEqual(["c", "a", "b"], aggregate.get_top(5, "count"))
+        self.assertEqual(["a", "b"], aggregate.get_top(2))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_round_trip_and_parallel(self) -> None:
+        """
+        Aggregates survive serialization and parallel aggregation matches sequential one
+        """
+        shards = [self.texts[:3], self.texts[3:5], self.texts[5:]]
+        sequential = merge_aggregates(
+            build_aggregate(shard, self.stop_words, self.idf) or CorpusAggregate()
+            for shard in shards
+        )
+        restored = load_aggregate(json.loads(json.dumps(sequential.to_dict())))
+        self.assertIsNotNone(restored)
+        self.assert_aggregates_equal(sequential, restored or CorpusAggregate())
+
+        parallel = aggregate_corpus(shards, self.stop_words, self.idf, processes=2)
+        self.assertIsNotNone(parallel)
+        self.assert_aggregates_equal(sequential, parallel or CorpusAggregate())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_worker_uses_initialized_resources(self) -> None:
+        """
+        Worker functions use the resources stored by the initializer
+        """
+        _WORKER_STATE.clear()
+        self.assertIsNone(_aggregate_in_worker(self.texts))
+        _init_worker(frozenset(self.stop_words), self.idf)
+        try:
+            expected = build_aggregate(self.texts, self.stop_words, self.idf)
+            self.assertIsNotNone(expected)
+            self.assert_aggregates_equal(expected or CorpusAggregate(),
+                                         _aggregate_in_worker(self.texts) or CorpusAggregate())
+            self.assertIsNone(_aggregate_in_worker([None]))  # type: ignore[list-item]
+        finally:
+            _WORKER_STATE.clear()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt shards, statistics and settings are rejected
+        """
+        aggregate = CorpusAggregate()
+        self.assertEqual(1, aggregate.add_document([1, 2], self.idf))  # type: ignore[list-item]
+        self.assertEqual(1, aggregate.add_document(["cat"], None))  # type: ignore[arg-type]
+        self.assertEqual(0, len(aggregate))
+        self.assertIsNone(aggregate.get_top(0))
+        self.assertIsNone(aggregate.get_top(3, "unknown"))  # type: ignore[arg-type]
+        self.assertIsNone(build_aggregate(self.texts, self.stop_words,
+                                          {"cat": 1}))  # type: ignore[dict-item]
+        self.assertIsNone(build_aggregate(self.texts, [None], self.idf))  # type: ignore[list-item]
+        self.assertIsNone(build_aggregate([None], self.stop_words,  # type: ignore[list-item]
+                                          self.idf))
+        self.assertIsNone(build_aggregate(self.texts, {"the"}, self.idf))  # type: ignore[arg-type]
+        self.assertIsNone(aggregate_corpus([self.texts], [None],  # type: ignore[list-item]
+                                           self.idf))
+        self.assertIsNone(aggregate_corpus([[None]], self.stop_words,  # type: ignore[list-item]
+                                           self.idf, 1))
+        for processes in (0, -1, 1.5, True, "2"):
+            self.assertIsNone(aggregate_corpus(
+                [self.texts], self.stop_words, self.idf, processes  # type: ignore[arg-type]
+            ))
+        self.assertIsNone(load_aggregate({"documents": 1}))
+        self.assertIsNone(load_aggregate(None))  # type: ignore[arg-type]
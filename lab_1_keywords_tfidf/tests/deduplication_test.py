@@ -0,0 +1,150 @@
+"""
+Checks the first lab near-duplicate detection
+"""
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.deduplication import (
+    build_deduplicated_index,
+    estimate_jaccard,
+    get_shingles,
+    iter_unique,
+    LshIndex,
+    MinHasher,
+)
+from lab_1_keywords_tfidf.incremental_idf import DocumentFrequencyIndex
+from lab_1_keywords_tfidf.main import clean_and_tokenize
+
+
+class DeduplicationTest(unittest.TestCase):
+    """
+    Tests MinHash signatures, LSH index and corpus deduplication
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up texts of deduplication tests class.
+        """
+        base = ("Жила-была на свете маленькая девочка, "
+                "которая очень любила гулять по лесу "
+                "и собирать цветы для своей бабушки. ") * 3
+        self.texts = [
+            base,
+            "Совсем другая сказка о храбром солдате, "
+            "который шёл домой с войны.",
+            base.replace("маленькая", "крохотная", 1),
+            base.upper(),
+            "Ещё одна история про кота, "
+            "который умел разговаривать с людьми.",
+        ]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_shingles(self) -> None:
+        """
+        Shingles are contiguous token sequences
+        """
+        self.assertEqual({"a b", "b c"}, get_shingles(["a", "b", "c"], 2))
+        self.assertEqual({"a b"}, get_shingles(["a", "b"], 3))
+        self.assertEqual(set(), get_shingles([]))
+        self.assertIsNone(get_shingles(["a", 1]))  # type: ignore[list-item]
+        self.assertIsNone(get_shingles(["a"], 0))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_signature_estimates_jaccard(self) -> None:
+        """
+        Share of equal components approximates Jaccard similarity
+        """
+        hasher = MinHasher(256)
+        first = set(f"shingle {index}" for index in range(100))
+        second = set(f"shingle {index}" for index in range(30, 130))
+        signature = hasher.get_signature(first)
+        if signature is None:
+            self.fail("Signature is not calculated")
+        self.assertEqual(256, len(hasher))
+        self.assertEqual(256, len(signature))
+        self.assertEqual(signature, MinHasher(256).get_signature(set(first)))
+        self.assertNotEqual(signature, MinHasher(256, seed=2).get_signature(first))
+        estimate = estimate_jaccard(signature, hasher.get_signature(second) or signature)
+        self.assertAlmostEqual(70 / 130, estimate, delta=0.1)
+        self.assertEqual(1.0, estimate_jaccard(hasher.get_signature(set()) or signature,
+                                               hasher.get_signature(set()) or signature))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_lsh_finds_near_duplicates(self) -> None:
+        """
+        Only near-duplicates are reported by the index
+        """
+        hasher = MinHasher()
+        index = LshIndex()
+        for text in self.texts:
+            signature = hasher.get_signature(get_shingles(clean_and_tokenize(text) or []) or set())
+            if signature is None:
+                self.fail("Signature is not calculated")
+            index.add(signature)
+        self.assertEqual(5, len(index))
+        query = hasher.get_signature(get_shingles(clean_and_tokenize(self.texts[0]) or []) or set())
+        if query is None:
+            self.fail("Signature is not calculated")
+        self.assertEqual([0, 2, 3], index.query(query, 0.7))
+        self.assertEqual([0, 3], index.query(query, 1.0))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_deduplicated_corpus_feeds_idf(self) -> None:
+        """
+        The first variant of every text is kept and counted in document frequencies
+        """
+        self.assertEqual([0, 1, 4], [position for position, _ in iter_unique(self.texts, 0.7)])
+        with mock.patch("lab_1_keywords_tfidf.deduplication.clean_and_tokenize",
+                        wraps=clean_and_tokenize) as tokenize:
+            index = build_deduplicated_index(self.texts, ["и", "по"], 0.7)
+        self.assertEqual(len(self.texts), tokenize.call_count)
+        if index is None:
+            self.fail("Index is not built")
+        expected = DocumentFrequencyIndex()
+        for position in (0, 1, 4):
+            expected.add_document(str(position), [
+                token for token in clean_and_tokenize(self.texts[position]) or []
+                if token not in ("и", "по")
+            ])
+        self.assertEqual(3, len(index))
+        self.assertEqual(expected.get_idf_dict(), index.get_idf_dict())
+        self.assertEqual(expected.get_corpus_frequencies(), index.get_corpus_frequencies())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt shingles, signatures and settings are rejected
+        """
+        hasher = MinHasher(16)
+        index = LshIndex(4, 4)
+        self.assertIsNone(hasher.get_signature(["a"]))  # type: ignore[arg-type]
+        self.assertIsNone(hasher.get_signature({1}))  # type: ignore[arg-type]
+        signature = MinHasher(8).get_signature({"a"})
+        if signature is None:
+            self.fail("Signature is not calculated")
+        self.assertIsNone(index.add(signature))
+        self.assertIsNone(index.query(signature))
+        self.assertIsNone(index.query(hasher.get_signature({"a"}), 0))  # type: ignore[arg-type]
+        for arguments in ((0, 4), (4, True)):
+            with self.assertRaises(ValueError):
+                LshIndex(*arguments)
+        with self.assertRaises(ValueError):
+            MinHasher(0)
+        with self.assertRaises(ValueError):
+            list(iter_unique(self.texts, 1.5))
+        corrupt_texts = [self.texts[0], self.texts[1], None, self.texts[4]]
+        unique = iter_unique(corrupt_texts)  # type: ignore[arg-type]
+        self.assertEqual([0, 1], [position for position, _ in (next(unique), next(unique))])
+        with self.assertRaises(ValueError):
+            next(unique)
+        self.assertIsNone(build_deduplicated_index(corrupt_texts, []))  # type: ignore[arg-type]
+        self.assertIsNone(build_deduplicated_index(self.texts, [None]))  # type: ignore[list-item]
+        self.assertIsNone(build_deduplicated_index(self.texts, [], 0))
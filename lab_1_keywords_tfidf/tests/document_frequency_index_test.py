@@ -0,0 +1,124 @@
+"""
+Checks the first lab incremental document frequency index
+"""
+
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.incremental_idf import (
+    DocumentFrequencyIndex,
+    load_document_frequency_index,
+    write_atomically,
+)
+
+
+class DocumentFrequencyIndexTest(unittest.TestCase):
+    """
+    Tests incremental document frequency index
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up index of document frequency index tests class.
+        """
+        self.index = DocumentFrequencyIndex()
+        self.index.add_document("first", ["cat", "sat", "cat"])
+        self.index.add_document("second", ["cat", "dog"])
+        self.index.add_document("third", ["bird"])
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        """
+        Remove temporary directory of document frequency index tests class.
+        """
+        self.directory.cleanup()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_add_documents(self) -> None:
+        """
+        Document and corpus frequencies are counted for added documents
+        """
+        self.assertEqual(3, len(self.index))
+        self.assertEqual(
+            {"cat": 3, "sat": 1, "dog": 1, "bird": 1}, self.index.get_corpus_frequencies()
+        )
+        expected = {
+            "cat": math.log(3 / 3),
+            "sat": math.log(3 / 2),
+            "dog": math.log(3 / 2),
+            "bird": math.log(3 / 2),
+        }
+        self.assertEqual(expected, self.index.get_idf_dict())
+        self.assertEqual(expected["cat"], self.index.get_idf("cat"))
+        self.assertIsNone(self.index.get_idf("fish"))
+        self.assertIsNone(self.index.get_idf(None))  # type: ignore[arg-type]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_remove_document(self) -> None:
+        """
+        Removing a document is the same as never adding it
+        """
+        expected = DocumentFrequencyIndex()
+        expected.add_document("first", ["cat", "sat", "cat"])
+        expected.add_document("third", ["bird"])
+        self.assertEqual(0, self.index.remove_document("second"))
+        self.assertEqual(expected.get_idf_dict(), self.index.get_idf_dict())
+        self.assertEqual(expected.get_corpus_frequencies(), self.index.get_corpus_frequencies())
+        self.assertEqual(1, self.index.remove_document("second"))
+        self.assertEqual(1, self.index.remove_document(None))  # type: ignore[arg-type]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_add_bad_input(self) -> None:
+        """
+        Corrupt documents and repeated identifiers are not added
+        """
+        self.assertEqual(1, self.index.add_document("first", ["fish"]))
+        self.assertEqual(1, self.index.add_document(None, ["fish"]))  # type: ignore[arg-type]
+        self.assertEqual(1, self.index.add_document("fourth", [1]))  # type: ignore[list-item]
+        self.assertEqual(1, self.index.add_frequencies("fourth", {"fish": 0}))
+        self.assertEqual(3, len(self.index))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_save_and_load(self) -> None:
+        """
+        Saved index is loaded with the same statistics, assets are exported
+        """
+        directory = Path(self.directory.name)
+        self.index.save(directory / "index.json")
+        loaded = load_document_frequency_index(directory / "index.json")
+        self.assertEqual(self.index.get_idf_dict(), loaded.get_idf_dict())
+        self.assertEqual(self.index.get_corpus_frequencies(), loaded.get_corpus_frequencies())
+
+        self.index.export_assets(directory / "IDF.json", directory / "corpus.json")
+        with open(directory / "IDF.json", "r", encoding="utf-8") as file:
+            self.assertEqual(self.index.get_idf_dict(), json.load(file))
+        with open(directory / "corpus.json", "r", encoding="utf-8") as file:
+            self.assertEqual(self.index.get_corpus_frequencies(), json.load(file))
+        self.assertEqual(
+            ["IDF.json", "corpus.json", "index.json"],
+            sorted(path.name for path in directory.iterdir()),
+        )
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_write_atomically_failure(self) -> None:
+        """
+        A failed replacement leaves neither a partial file nor a temporary file
+        """
+        directory = Path(self.directory.name)
+        (directory / "target").mkdir()
+        (directory / "target" / "child").write_text("", encoding="utf-8")
+        with self.assertRaises(OSError):
+            write_atomically(directory / "target", "content")
+        self.assertEqual(["target"], [path.name for path in directory.iterdir()])
+        with self.assertRaises(ValueError):
+            write_atomically("", "content")
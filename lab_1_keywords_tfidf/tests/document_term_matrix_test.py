@@ -0,0 +1,209 @@
+"""
+Checks the first lab sparse document-term matrix
+"""
+
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+from typing import Any, IO
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.main import calculate_frequencies, calculate_tf, calculate_tfidf
+from lab_1_keywords_tfidf.sparse_matrix import (
+    build_matrix,
+    DocumentTermMatrix,
+    HEADER_SIZE,
+    load_matrix,
+)
+
+
+class DocumentTermMatrixTest(unittest.TestCase):
+    """
+    Tests CSR document-term matrix builder, writer and loader
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up documents and temporary directory of document-term matrix tests class.
+        """
+        self.idf = {"кот": 0.5, "пёс": 2.0, "мышь": 1.5, "ёж": 3.0}
+        self.documents = [
+            ["пёс", "кот", "кот", "птица"],
+            [],
+            ["слон"],
+            ["ёж", "мышь", "ёж"],
+        ]
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self.directory.name) / "matrix.bin"
+        self.files: list[IO[Any]] = []
+
+    def tearDown(self) -> None:
+        """
+        Remove temporary directory of document-term matrix tests class.
+        """
+        self.directory.cleanup()
+
+    def open_and_keep(self, *args: Any, **kwargs: Any) -> IO[Any]:
+        """
+        Open a file and keep it to check that it is closed.
+
+        Args:
+            *args (Any): Positional arguments of open
+            **kwargs (Any): Keyword arguments of open
+
+        Returns:
+            IO[Any]: Opened file
+        """
+        # pylint: disable-next=consider-using-with,unspecified-encoding
+        file: IO[Any] = open(*args, **kwargs)
+        self.files.append(file)
+        return file
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_matches_lab_functions(self) -> None:
+        """
+        Rows are equal to TF and TF-IDF values of vocabulary terms
+        """
+        for weighting in ("tf", "tfidf"):
+            matrix = build_matrix(self.documents, self.idf, weighting)  # type: ignore[arg-type]
+            if matrix is None:
+                self.fail("Matrix is not built")
+            self.assertEqual((4, 4), matrix.get_shape())
+            self.assertEqual(weighting, matrix.get_weighting())
+            for index, tokens in enumerate(self.documents):
+                expected = calculate_tf(calculate_frequencies(tokens) or {}) or {}
+                if weighting == "tfidf":
+                    expected = calculate_tfidf(expected, self.idf) or {}
+                expected = {term: value for term, value in expected.items() if term in self.idf}
+                actual = matrix.to_dict(index)
+                self.assertEqual(expected.keys(), (actual or {}).keys())
+                for term, value in expected.items():
+                    self.assertAlmostEqual(value, (actual or {})[term], places=6)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_layout(self) -> None:
+        """
+        Rows are stored with int32 column indices in ascending order and float32 weights
+        """
+        matrix = build_matrix(self.documents, self.idf, "tf")
+        if matrix is None:
+            self.fail("Matrix is not built")
+        self.assertEqual(4, matrix.get_nnz())
+        self.assertEqual(list(self.idf), matrix.get_vocabulary())
+        self.assertEqual((array("i", [0, 1]), array("f", [0.5, 0.25])), matrix.get_row(0))
+        self.assertEqual((array("i"), array("f")), matrix.get_row(1))
+        rows = list(matrix.iter_rows())
+        self.assertEqual(4, len(rows))
+        self.assertEqual(array("i", [2, 3]), rows[3][0])
+        self.assertIsNone(matrix.get_row(4))
+        self.assertIsNone(matrix.to_dict(True))  # type: ignore[arg-type]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_save_and_load(self) -> None:
+        """
+        Memory-mapped matrix is equal to the saved one
+        """
+        matrix = build_matrix(self.documents, self.idf)
+        if matrix is None:
+            self.fail("Matrix is not built")
+        matrix.save(self.path)
+        with load_matrix(self.path) as loaded:
+            self.assertEqual(matrix.get_shape(), loaded.get_shape())
+            self.assertEqual("tfidf", loaded.get_weighting())
+            self.assertEqual(matrix.get_vocabulary(), loaded.get_vocabulary())
+            for index in range(len(matrix)):
+                self.assertEqual(matrix.to_dict(index), loaded.to_dict(index))
+            copy = Path(self.directory.name) / "copy.bin"
+            loaded.save(copy)
+        self.assertEqual(self.path.read_bytes(), copy.read_bytes())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_bad_input(self) -> None:
+        """
+        Corrupt documents, arrays, paths and files are rejected
+        """
+        self.assertIsNone(build_matrix([["кот", 1]], self.idf))  # type: ignore[list-item]
+        self.assertIsNone(build_matrix(self.documents, {"кот": 1}))  # type: ignore[dict-item]
+        self.assertIsNone(build_matrix(self.documents, self.idf, "bm25"))  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            DocumentTermMatrix((array("q", [0, 2]), array("i", [0]), array("f", [1.0])), [], "tf")
+        matrix = build_matrix(self.documents, self.idf)
+        if matrix is None:
+            self.fail("Matrix is not built")
+        with self.assertRaises(ValueError):
+            matrix.save("")
+        self.path.write_bytes(b"")
+        with self.assertRaises(ValueError):
+            load_matrix(self.path)
+        matrix.save(self.path)
+        self.path.write_bytes(self.path.read_bytes()[:60])
+        with self.assertRaises(ValueError):
+            load_matrix(self.path)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_of_sequences(self) -> None:
+        """
+        Matrices of plain sequences are saved in the same layout as typed arrays
+        """
+        matrix = DocumentTermMatrix(([0, 1, 1], [1], [0.5]), ["кот", "пёс"], "tf")
+        matrix.save(self.path)
+        with load_matrix(self.path) as loaded:
+            self.assertEqual((2, 2), loaded.get_shape())
+            self.assertEqual({"пёс": 0.5}, loaded.to_dict(0))
+            self.assertEqual({}, loaded.to_dict(1))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_close_with_rows(self) -> None:
+        """
+        Rows kept by callers stay readable after the matrix is closed
+        """
+        matrix = build_matrix(self.documents, self.idf, "tf")
+        if matrix is None:
+            self.fail("Matrix is not built")
+        matrix.save(self.path)
+
+        with mock.patch("lab_1_keywords_tfidf.sparse_matrix.open", create=True,
+                        side_effect=self.open_and_keep):
+            loaded = load_matrix(self.path)
+        row = loaded.get_row(0)
+        rows = list(loaded.iter_rows())
+        loaded.close()
+        loaded.close()
+        self.assertTrue(self.files[0].closed)
+        self.assertEqual((array("i", [0, 1]), array("f", [0.5, 0.25])), row)
+        self.assertEqual(array("i", [2, 3]), rows[3][0])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_matrix_corrupt_file_is_released(self) -> None:
+        """
+        Files with inconsistent arrays or terms are rejected and closed
+        """
+        matrix = build_matrix(self.documents, self.idf, "tf")
+        if matrix is None:
+            self.fail("Matrix is not built")
+        matrix.save(self.path)
+        content = self.path.read_bytes()
+        last_row_end = HEADER_SIZE + 8 * len(matrix)
+        inconsistent_indptr = content[:last_row_end] + bytes([9]) + content[last_row_end + 1:]
+        invalid_term = content[:-1] + b"\xff"
+
+        unknown_signature = b"NOMATRIX" + content[8:]
+
+        for corrupt_content in (inconsistent_indptr, invalid_term, content[:-1],
+                                unknown_signature):
+            self.path.write_bytes(corrupt_content)
+            with mock.patch("lab_1_keywords_tfidf.sparse_matrix.open", create=True,
+                            side_effect=self.open_and_keep), self.assertRaises(ValueError):
+                load_matrix(self.path)
+        self.assertEqual(4, len(self.files))
+        self.assertTrue(all(file.closed for file in self.files))
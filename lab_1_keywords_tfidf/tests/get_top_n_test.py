@@ -98,3 +98,28 @@ class GetTopNWordsTest(unittest.TestCase):
         self.assertEqual(expected, actual)
         actual = get_top_n({"happy": 2}, 0)
         self.assertEqual(expected, actual)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_get_top_n_same_as_sort(self) -> None:
+        """
+        Heap selection gives the same tokens as a stable sort, including ties
+        """
+        frequencies = {f"token{index}": float(index * 7919 % 101) for index in range(5000)}
+        ranked = sorted(frequencies.items(), key=lambda item: item[1], reverse=True)
+        for top in (1, 10, 257, 5000, 6000):
+            expected = [token for token, _ in ranked[:top]]
+            self.assertEqual(expected, get_top_n(frequencies, top))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_get_top_n_trusted(self) -> None:
+        """
+        Get top number of words skipping items validation for trusted input
+        """
+        self.assertEqual(["man"], get_top_n({"happy": 2, "man": 3}, 1, trusted=True))
+        self.assertEqual(["man"], get_top_n({"happy": 2, "man": 3, 5: 1},  # type: ignore[dict-item]
+                                            1, trusted=True))
+        self.assertIsNone(get_top_n({"happy": 2, "man": 3, 5: 1}, 1))  # type: ignore[dict-item]
+        self.assertIsNone(get_top_n({}, 1, trusted=True))
+        self.assertIsNone(get_top_n({"happy": 2}, 0, trusted=True))
@@ -0,0 +1,122 @@
+"""
+Checks the first lab binary IDF store
+"""
+
+# pylint: disable=duplicate-code
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.idf_store import compile_assets, compile_store, IdfStore
+
+
+class IdfStoreTest(unittest.TestCase):
+    """
+    Tests binary IDF store compiler and reader
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up temporary directory of IDF store tests class.
+        """
+        self.assets = Path(__file__).parent.parent / "assets"
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self.directory.name) / "store.bin"
+
+    def tearDown(self) -> None:
+        """
+        Remove temporary directory of IDF store tests class.
+        """
+        self.directory.cleanup()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_store_matches_assets(self) -> None:
+        """
+        Compiled assets give the same values as JSON files
+        """
+        with open(self.assets / "IDF.json", "r", encoding="utf-8") as file:
+            idf = json.load(file)
+        with open(self.assets / "corpus_frequencies.json", "r", encoding="utf-8") as file:
+            corpus_freqs = json.load(file)
+        compile_assets(
+            self.assets / "IDF.json", self.assets / "corpus_frequencies.json", self.path
+        )
+        with IdfStore(self.path) as store:
+            self.assertEqual(len(idf.keys() | corpus_freqs.keys()), len(store))
+            self.assertEqual(sum(corpus_freqs.values()), store.get_corpus_total())
+            for term in list(idf)[:300] + list(corpus_freqs)[-300:]:
+                self.assertEqual(idf.get(term), store.get_idf(term))
+                self.assertEqual(corpus_freqs.get(term, 0), store.get_frequency(term))
+            self.assertEqual((idf, corpus_freqs), store.to_dicts())
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_store_missing_terms(self) -> None:
+        """
+        Terms missing from one of the tables or from both are handled
+        """
+        compile_store({"кот": 0.5, "b": 1.5}, {"кот": 3, "ёж": 2}, self.path)
+        with IdfStore(self.path) as store:
+            self.assertEqual(3, len(store))
+            self.assertIn("ёж", store)
+            self.assertNotIn("пёс", store)
+            self.assertNotIn(1, store)
+            self.assertIsNone(store.get_idf("ёж"))
+            self.assertIsNone(store.get_idf("пёс"))
+            self.assertIsNone(store.get_idf(None))  # type: ignore[arg-type]
+            self.assertEqual(0, store.get_frequency("b"))
+            self.assertEqual(0, store.get_frequency(None))  # type: ignore[arg-type]
+            self.assertEqual(2, store.get_frequency("ёж"))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_store_round_trip_keeps_zero_counts(self) -> None:
+        """
+        Explicit zero counts are kept apart from terms missing from corpus frequencies
+        """
+        tables = ({"кот": 0.5, "b": 1.5}, {"кот": 0, "ёж": 2})
+        compile_store(*tables, self.path)
+        with IdfStore(self.path) as store:
+            self.assertEqual(tables, store.to_dicts())
+            self.assertEqual(0, store.get_frequency("кот"))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_store_bad_input(self) -> None:
+        """
+        Corrupt tables, paths and files are rejected
+        """
+        with self.assertRaises(ValueError):
+            compile_store({"a": 1}, {}, self.path)  # type: ignore[dict-item]
+        with self.assertRaises(ValueError):
+            compile_store({}, {}, "")
+        self.path.write_bytes(b"")
+        with self.assertRaises(ValueError):
+            IdfStore(self.path)
+        self.path.write_bytes(b"NOTSTORE" + bytes(16))
+        with self.assertRaises(ValueError):
+            IdfStore(self.path)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_store_truncated_file(self) -> None:
+        """
+        Files shorter than their header promises are rejected and released
+        """
+        compile_store({"кот": 0.5, "пёс": 1.5}, {"кот": 3}, self.path)
+        content = self.path.read_bytes()
+        for length in (len(content) - 1, 40, 24):
+            self.path.write_bytes(content[:length])
+            with mock.patch.object(IdfStore, "close", autospec=True,
+                                   side_effect=IdfStore.close) as close:
+                with self.assertRaises(ValueError):
+                    IdfStore(self.path)
+            close.assert_called_once()
+        self.path.write_bytes(content + b"x")
+        with self.assertRaises(ValueError):
+            IdfStore(self.path)
@@ -0,0 +1,71 @@
+"""
+Checks the first lab streaming tokenization function
+"""
+
+import io
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, iter_clean_tokens
+
+
+class IterCleanTokensTest(unittest.TestCase):
+    """
+    Tests streaming tokenize function
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up text of streaming tokenize tests class.
+        """
+        path = Path(__file__).parent.parent / "assets" / "Дюймовочка.txt"
+        with open(path, "r", encoding="utf-8") as file:
+            self.text = file.read()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_iter_clean_tokens_ideal(self) -> None:
+        """
+        Ideal streaming tokenize scenario
+        """
+        expected = ["the", "weather", "is", "sunny", "the", "man", "is", "happy"]
+        actual = iter_clean_tokens(["The weather is sunny, the m", "an is happy."])
+        self.assertEqual(expected, list(actual))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_iter_clean_tokens_chunk_boundaries(self) -> None:
+        """
+        Words split between chunks of any size give the same tokens
+        """
+        expected = clean_and_tokenize(self.text)
+        for size in (1, 7, 64, 1000, len(self.text)):
+            chunks = [self.text[start:start + size] for start in range(0, len(self.text), size)]
+            self.assertEqual(expected, list(iter_clean_tokens(chunks)))
+        self.assertEqual(expected, list(iter_clean_tokens(io.StringIO(self.text))))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_iter_clean_tokens_empty_chunks(self) -> None:
+        """
+        Empty chunks do not break words
+        """
+        expected = ["кот", "пёс"]
+        self.assertEqual(expected, list(iter_clean_tokens(["к", "", "от ", "", "пёс!"])))
+        self.assertEqual([], list(iter_clean_tokens([])))
+        self.assertEqual([], list(iter_clean_tokens(["", " ... ", "!"])))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_iter_clean_tokens_bad_input(self) -> None:
+        """
+        Streaming tokenize raises on corrupt chunks after the tokens before them
+        """
+        tokens = iter_clean_tokens(["one two ", None, "three"])  # type: ignore[list-item]
+        self.assertEqual(["one", "two"], [next(tokens), next(tokens)])
+        with self.assertRaises(ValueError):
+            next(tokens)
+        with self.assertRaises(ValueError):
+            list(iter_clean_tokens([1]))  # type: ignore[list-item]
@@ -0,0 +1,161 @@
+"""
+Checks the first lab keyword cache
+"""
+
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.pipeline import KeywordCache, KeywordExtractor
+
+
+class KeywordCacheTest(unittest.TestCase):
+    """
+    Tests keyword cache
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up extractor of keyword cache tests class.
+        """
+        self.idf = {"cat": 0.5, "dog": 2.0, "bird": 1.5}
+        self.corpus_freqs = {"cat": 30, "dog": 1, "the": 100}
+        self.extractor = KeywordExtractor(["the"], self.idf, self.corpus_freqs, top=2)
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        """
+        Remove temporary directory of keyword cache tests class.
+        """
+        self.directory.cleanup()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_reuses_keywords(self) -> None:
+        """
+        Repeated documents are not scored again
+        """
+        cache = KeywordCache(self.extractor)
+        texts = ["The cat and the dog.", "A bird", "The cat and the dog."]
+        expected = self.extractor.extract_batch(texts)
+        with mock.patch.object(self.extractor, "extract", wraps=self.extractor.extract) as spy:
+            self.assertEqual(expected, cache.extract_batch(texts))
+            self.assertEqual(expected, cache.extract_batch(texts))
+        self.assertEqual(2, spy.call_count)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """
+        Only the most recently used entries are kept in memory
+        """
+        cache = KeywordCache(self.extractor, capacity=2)
+        cache.extract_batch(["cat", "dog", "cat", "bird"])
+        self.assertEqual(2, len(cache))
+        with mock.patch.object(self.extractor, "extract", wraps=self.extractor.extract) as spy:
+            cache.extract_batch(["cat", "bird", "dog"])
+        self.assertEqual(1, spy.call_count)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_on_disk(self) -> None:
+        """
+        Entries stored on disk are reused by a new cache
+        """
+        KeywordCache(self.extractor, directory=self.directory.name).extract("cat dog")
+        expected = self.extractor.extract("cat dog")
+        cache = KeywordCache(self.extractor, directory=self.directory.name)
+        with mock.patch.object(self.extractor, "extract") as spy:
+            self.assertEqual(expected, cache.extract("cat dog"))
+        spy.assert_not_called()
+
+        for path in Path(self.directory.name).iterdir():
+            path.write_text("corrupt", encoding="utf-8")
+        cache = KeywordCache(self.extractor, directory=self.directory.name)
+        self.assertEqual(self.extractor.extract("cat dog"), cache.extract("cat dog"))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_prunes_disk_store(self) -> None:
+        """
+        The on-disk store keeps the most recently used entries within its capacity
+        """
+        directory = Path(self.directory.name)
+
+        def get_path(text: str) -> Path:
+            """
+            Get the path of the on-disk entry of a document.
+
+            Args:
+                text (str): Original text
+
+            Returns:
+                Path: Path of the entry
+            """
+            key = hashlib.sha256((self.extractor.get_fingerprint() + text).encode("utf-8"))
+            return directory / f"{key.hexdigest()}.json"
+
+        def glob_with_removed_entry(path: Path, pattern: str) -> list[Path]:
+            """
+            List entries together with one removed by another process.
+
+            Args:
+                path (Path): Directory to list
+                pattern (str): Pattern of file names
+
+            Returns:
+                list[Path]: Entries of the directory
+            """
+            return [*original_glob(path, pattern), path / "removed.json"]
+
+        cache = KeywordCache(self.extractor, capacity=1, directory=directory, disk_capacity=4)
+        for age, text in enumerate(["cat", "dog", "bird", "cat dog"], start=1):
+            cache.extract(text)
+            os.utime(get_path(text), ns=(age, age))
+        cache.extract("cat")
+        self.assertEqual(4, len(list(directory.glob("*.json"))))
+        original_glob = Path.glob
+        with mock.patch.object(Path, "glob", autospec=True, side_effect=glob_with_removed_entry):
+            cache.extract("bird dog")
+        self.assertEqual({get_path("cat"), get_path("bird dog")}, set(directory.glob("*.json")))
+
+        cache = KeywordCache(self.extractor, directory=directory, disk_capacity=3)
+        cache.extract_batch(["dog", "bird"])
+        self.assertEqual(1, len(list(directory.glob("*.json"))))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_invalidated_by_resources(self) -> None:
+        """
+        Keywords computed with another IDF table are not reused
+        """
+        KeywordCache(self.extractor, directory=self.directory.name).extract("cat dog")
+        changed_idf = {**self.idf, "cat": 10.0}
+        extractor = KeywordExtractor(["the"], changed_idf, self.corpus_freqs, top=2)
+        self.assertNotEqual(self.extractor.get_fingerprint(), extractor.get_fingerprint())
+        cache = KeywordCache(extractor, directory=self.directory.name)
+        self.assertEqual(extractor.extract("cat dog"), cache.extract("cat dog"))
+        self.assertEqual(["cat", "dog"], (cache.extract("cat dog") or ([], []))[0])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_cache_bad_input(self) -> None:
+        """
+        Corrupt documents and settings are rejected
+        """
+        cache = KeywordCache(self.extractor)
+        self.assertIsNone(cache.extract(None))  # type: ignore[arg-type]
+        self.assertEqual(0, len(cache))
+        with mock.patch.object(self.extractor, "extract", return_value=None):
+            self.assertIsNone(cache.extract("cat"))
+        with self.assertRaises(ValueError):
+            KeywordCache(None)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            KeywordCache(self.extractor, capacity=0)
+        with self.assertRaises(ValueError):
+            KeywordCache(self.extractor, disk_capacity=0)
@@ -0,0 +1,149 @@
+"""
+Checks the first lab batch keyword extractor
+"""
+
+# pylint: disable=duplicate-code
+import json
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.main import (
+    calculate_chi_values,
+    calculate_expected_frequency,
+    calculate_frequencies,
+    calculate_tf,
+    calculate_tfidf,
+    clean_and_tokenize,
+    extract_significant_words,
+    get_top_n,
+    remove_stop_words,
+)
+from lab_1_keywords_tfidf.pipeline import (
+    _extract_in_worker,
+    _init_worker,
+    _WORKER_STATE,
+    KeywordExtractor,
+)
+
+
+class KeywordExtractorTest(unittest.TestCase):
+    """
+    Tests batch keyword extractor
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up resources of keyword extractor tests class.
+        """
+        assets = Path(__file__).parent.parent / "assets"
+        with open(assets / "Дюймовочка.txt", "r", encoding="utf-8") as file:
+            self.text = file.read()
+        with open(assets / "stop_words.txt", "r", encoding="utf-8") as file:
+            self.stop_words = file.read().split("\n")
+        with open(assets / "IDF.json", "r", encoding="utf-8") as file:
+            self.idf = json.load(file)
+        with open(assets / "corpus_frequencies.json", "r", encoding="utf-8") as file:
+            self.corpus_freqs = json.load(file)
+
+    def _extract_with_chain(self, text: str) -> tuple[list[str], list[str]]:
+        """
+        Extract keywords with the chain of main.py functions.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            tuple[list[str], list[str]]: TF-IDF and chi-squared keywords
+        """
+        tokens = remove_stop_words(clean_and_tokenize(text) or [], self.stop_words) or []
+        frequencies = calculate_frequencies(tokens) or {}
+        tfidf = calculate_tfidf(calculate_tf(frequencies) or {}, self.idf) or {}
+        expected = calculate_expected_frequency(frequencies, self.corpus_freqs) or {}
+        chi_values = calculate_chi_values(expected, frequencies) or {}
+        significant = extract_significant_words(chi_values, 0.001) or {}
+        return get_top_n(tfidf, 10) or [], get_top_n(significant, 10) or []
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extract_matches_chain(self) -> None:
+        """
+        Keyword extractor gives the same keywords as main.py functions
+        """
+        extractor = KeywordExtractor(self.stop_words, self.idf, self.corpus_freqs)
+        documents = [self.text, self.text[:2000], "Дюймовочка и ласточка",
+                     "и в во", ""]
+        expected = [self._extract_with_chain(document) for document in documents]
+        self.assertEqual(expected, extractor.extract_batch(documents))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extract_parallel_keeps_order(self) -> None:
+        """
+        Keywords extracted by worker processes come back in the original order
+        """
+        extractor = KeywordExtractor(self.stop_words, self.idf, self.corpus_freqs)
+        documents = [self.text[start:start + 3000] for start in range(0, len(self.text), 3000)]
+        documents.append(None)  # type: ignore[arg-type]
+        expected = extractor.extract_batch(documents)
+        actual = list(extractor.extract_parallel(iter(documents), processes=2, chunksize=2) or [])
+        self.assertEqual(expected, actual)
+        self.assertIsNone(actual[-1])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_worker_in_process(self) -> None:
+        """
+        Worker functions use the extractor stored by the initializer
+        """
+        extractor = KeywordExtractor(["a"], {"cat": 0.5}, {"cat": 3}, top=1)
+        _WORKER_STATE.clear()
+        self.assertIsNone(_extract_in_worker("a cat"))
+        _init_worker(extractor)
+        try:
+            self.assertEqual(extractor.extract("a cat"), _extract_in_worker("a cat"))
+            self.assertIsNone(_extract_in_worker(None))  # type: ignore[arg-type]
+        finally:
+            _WORKER_STATE.clear()
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extract_parallel_bad_settings(self) -> None:
+        """
+        Non-positive or non-integer numbers of processes and chunk sizes are rejected
+        """
+        extractor = KeywordExtractor(["a"], {"cat": 0.5}, {"cat": 3}, top=1)
+        for processes, chunksize in ((0, 8), (-1, 8), (1.5, 8), (True, 8),
+                                     (None, 0), (None, "8"), (2, None)):
+            self.assertIsNone(extractor.extract_parallel(
+                ["a cat"], processes, chunksize  # type: ignore[arg-type]
+            ))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extract_batch_bad_document(self) -> None:
+        """
+        Corrupt documents get None without stopping the batch
+        """
+        extractor = KeywordExtractor(["a"], {"cat": 0.5}, {"cat": 3}, top=1)
+        actual = extractor.extract_batch(["a cat", None, "cat"])  # type: ignore[list-item]
+        self.assertEqual([(["cat"], []), None, (["cat"], [])], actual)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extractor_bad_resources(self) -> None:
+        """
+        Corrupt shared resources are rejected once on creation
+        """
+        bad_arguments = [
+            ([1], {}, {}, 10, 0.001),
+            ([], {"a": 1}, {}, 10, 0.001),
+            ([], {}, {"a": 1.0}, 10, 0.001),
+            ([], {}, {}, 0, 0.001),
+            ([], {}, {}, 10, 1.5),
+            ([], {}, {}, 10, 1),
+        ]
+        for arguments in bad_arguments:
+            with self.assertRaises(ValueError):
+                KeywordExtractor(*arguments)  # type: ignore[arg-type]
@@ -0,0 +1,103 @@
+"""
+Checks the first lab profiling hooks
+"""
+
+import unittest
+
+import pytest
+
+from lab_1_keywords_tfidf.main import (
+    calculate_frequencies,
+    calculate_tf,
+    clean_and_tokenize,
+    get_top_n,
+    remove_stop_words,
+)
+from lab_1_keywords_tfidf.pipeline import KeywordExtractor
+from lab_1_keywords_tfidf.profiling import get_size, profiled, StageRecorder
+
+
+class ProfilingTest(unittest.TestCase):
+    """
+    Tests stage recorder and profiled stages
+    """
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_recorder_captures_stages(self) -> None:
+        """
+        Every stage call is recorded with its sizes inside the recorder context only
+        """
+        text = "Кот и пёс, кот и мышь."
+        with StageRecorder() as recorder:
+            tokens = remove_stop_words(clean_and_tokenize(text) or [], ["и"]) or []
+            frequencies = calculate_frequencies(tokens) or {}
+            get_top_n(calculate_tf(frequencies) or {}, 2)
+        calculate_frequencies(tokens)
+        records = recorder.get_records()
+        self.assertEqual(
+            ["clean_and_tokenize", "remove_stop_words", "calculate_frequencies",
+             "calculate_tf", "get_top_n"],
+            [record["stage"] for record in records]
+        )
+        self.assertEqual(5, len(recorder))
+        self.assertEqual((len(text), 6), (records[0]["input_size"], records[0]["output_size"]))
+        self.assertEqual((4, 3), (records[2]["input_size"], records[2]["output_size"]))
+        self.assertTrue(all(record["seconds"] >= 0 for record in records))
+        self.assertTrue(all(isinstance(record["allocated_blocks"], int) for record in records))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_summary_callback_and_nesting(self) -> None:
+        """
+        Summaries aggregate calls, callbacks get measurements and nested recorders are isolated
+        """
+        streamed: list[str] = []
+        with StageRecorder(lambda record: streamed.append(record["stage"])) as outer:
+            calculate_frequencies(["a", "b"])
+            with StageRecorder() as inner:
+                calculate_frequencies(["a"])
+            calculate_frequencies(["c"])
+        self.assertEqual(["calculate_frequencies"] * 2, streamed)
+        self.assertEqual(1, len(inner))
+        summary = outer.summarize()
+        self.assertEqual(["calculate_frequencies"], list(summary))
+        self.assertEqual(2, summary["calculate_frequencies"]["calls"])
+        self.assertEqual(3, summary["calculate_frequencies"]["input_size"])
+        self.assertEqual(3, summary["calculate_frequencies"]["output_size"])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_methods_and_custom_stages(self) -> None:
+        """
+        Extractor stages record the sizes of their arguments, not of the extractor
+        """
+        extractor = KeywordExtractor(["и"], {"кот": 0.5}, {"кот": 3}, top=2)
+        with StageRecorder() as recorder:
+            extractor.extract("кот и пёс")
+        summary = recorder.summarize()
+        self.assertEqual(["clean_and_tokenize_fast", "KeywordExtractor.count", "get_top_n",
+                          "KeywordExtractor.score"], list(summary))
+        self.assertEqual(3, summary["KeywordExtractor.count"]["input_size"])
+        self.assertEqual(2, summary["KeywordExtractor.score"]["input_size"])
+
+        @profiled("custom")
+        def produce() -> int:
+            """
+            Produce an unsized value.
+
+            Returns:
+                int: Constant
+            """
+            return 1
+
+        with StageRecorder() as recorder:
+            self.assertEqual(1, produce())
+        self.assertEqual([("custom", None, None)], [
+            (record["stage"], record["input_size"], record["output_size"])
+            for record in recorder.get_records()
+        ])
+        self.assertIsNone(get_size(None))
+        self.assertEqual("calculate_tf", calculate_tf.__name__)
+        with self.assertRaises(ValueError):
+            StageRecorder(1)  # type: ignore[arg-type]
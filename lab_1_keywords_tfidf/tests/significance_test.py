@@ -0,0 +1,109 @@
+"""
+Checks the first lab chi-squared significance functions
+"""
+
+import unittest
+from array import array
+
+import pytest
+
+from lab_1_keywords_tfidf.main import extract_significant_words
+from lab_1_keywords_tfidf.pipeline import KeywordExtractor
+from lab_1_keywords_tfidf.significance import (
+    chi_squared_critical_value,
+    chi_squared_survival,
+    extract_significant,
+    filter_above,
+    sweep_significance,
+)
+
+
+class SignificanceTest(unittest.TestCase):
+    """
+    Tests chi-squared significance functions
+    """
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_critical_values_match_tables(self) -> None:
+        """
+        Critical values are equal to the ones from statistical tables
+        """
+        table = {
+            (0.05, 1): 3.841459,
+            (0.01, 1): 6.634897,
+            (0.001, 1): 10.827566,
+            (0.05, 2): 5.991465,
+            (0.5, 2): 1.386294,
+            (0.1, 10): 15.987179,
+            (0.01, 100): 135.806723,
+        }
+        for (alpha, degrees_of_freedom), expected in table.items():
+            actual = chi_squared_critical_value(alpha, degrees_of_freedom)
+            if actual is None:
+                self.fail("Critical value is not calculated")
+            self.assertAlmostEqual(expected, actual, places=5)
+            survival = chi_squared_survival(actual, degrees_of_freedom)
+            if survival is None:
+                self.fail("Survival is not calculated")
+            self.assertAlmostEqual(alpha, survival)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_survival_bounds(self) -> None:
+        """
+        Upper tail probability of non-positive values is one
+        """
+        self.assertEqual(1.0, chi_squared_survival(0.0))
+        self.assertEqual(1.0, chi_squared_survival(-5))
+        self.assertLess(chi_squared_survival(200.0, 3), 1e-40)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_filters(self) -> None:
+        """
+        Filters select the same values for every significance level
+        """
+        values = array("d", [0.5, 4.0, 12.0, 7.0, 3.9, 100.0])
+        self.assertEqual(array("q", [1, 2, 3, 5]), filter_above(values, 3.95))
+        expected = {
+            0.05: array("q", [1, 2, 3, 4, 5]),
+            0.01: array("q", [2, 3, 5]),
+            0.001: array("q", [2, 5]),
+        }
+        self.assertEqual(expected, sweep_significance(values, [0.05, 0.01, 0.001]))
+
+        chi_values = {"a": 0.5, "b": 4.0, "c": 12.0, "d": 3.0}
+        self.assertEqual(
+            extract_significant_words(chi_values, 0.05), extract_significant(chi_values, 0.05)
+        )
+        self.assertEqual(
+            {"b": 4.0, "c": 12.0, "d": 3.0}, extract_significant(chi_values, 0.12873)
+        )
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_extractor_any_alpha(self) -> None:
+        """
+        Keyword extractor accepts any significance level
+        """
+        strict = KeywordExtractor([], {}, {"cat": 1, "dog": 40}, alpha=0.001)
+        loose = KeywordExtractor([], {}, {"cat": 1, "dog": 40}, alpha=0.3)
+        self.assertEqual(["cat"], (strict.extract("cat cat dog") or ([], []))[1])
+        self.assertEqual(["cat", "dog"], (loose.extract("cat cat dog") or ([], []))[1])
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt significance levels and degrees of freedom are rejected
+        """
+        for alpha in (0.0, 1.0, -0.5, 1, None, "0.05"):
+            self.assertIsNone(chi_squared_critical_value(alpha))  # type: ignore[arg-type]
+            self.assertIsNone(extract_significant({"a": 1.0}, alpha))  # type: ignore[arg-type]
+        self.assertIsNone(chi_squared_critical_value(0.05, 0))
+        self.assertIsNone(chi_squared_survival(True))
+        self.assertIsNone(chi_squared_survival(1.0, 1.5))  # type: ignore[arg-type]
+        self.assertIsNone(sweep_significance([1.0], []))
+        self.assertIsNone(sweep_significance([1.0], [0.05, 2.0]))
+        self.assertIsNone(extract_significant({}, 0.05))
@@ -0,0 +1,127 @@
+"""
+Checks the first lab cosine similarity index
+"""
+
+import math
+import unittest
+
+import pytest
+
+from lab_1_keywords_tfidf.similarity import index_matrix, normalize, SimilarityIndex
+from lab_1_keywords_tfidf.sparse_matrix import build_matrix
+
+
+def cosine(first: dict[str, float], second: dict[str, float]) -> float:
+    """
+    Calculate cosine similarity of two sparse vectors by definition.
+
+    Args:
+        first (dict[str, float]): First vector
+        second (dict[str, float]): Second vector
+
+    Returns:
+        float: Cosine similarity
+    """
+    dot = sum(value * second.get(term, 0.0) for term, value in first.items())
+    first_norm = math.sqrt(sum(value * value for value in first.values()))
+    second_norm = math.sqrt(sum(value * value for value in second.values()))
+    return dot / (first_norm * second_norm)
+
+
+class SimilarityIndexTest(unittest.TestCase):
+    """
+    Tests cosine similarity index
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up vectors of similarity index tests class.
+        """
+        self.vectors = [
+            {"cat": 0.5, "dog": 0.25},
+            {"cat": 1.0, "dog": 0.5},
+            {"bird": 0.3, "fish": 0.1},
+            {"cat": 0.1, "fish": 0.7},
+            {},
+        ]
+        self.index = SimilarityIndex()
+        for vector in self.vectors:
+            self.index.add(vector)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_query_matches_brute_force(self) -> None:
+        """
+        Scores are cosine similarities and only documents sharing terms are returned
+        """
+        self.assertEqual(5, len(self.index))
+        query = {"cat": 0.2, "fish": 0.4, "whale": 0.3}
+        result = self.index.query(query, top=10)
+        self.assertIsNotNone(result)
+        expected = sorted(
+            ((document_id, cosine(query, vector)) for document_id, vector in enumerate(self.vectors)
+             if query.keys() & vector.keys()),
+            key=lambda item: (-item[1], item[0])
+        )
+        self.assertEqual([document_id for document_id, _ in expected],
+                         [document_id for document_id, _ in result or []])
+        for (_, expected_score), (_, actual_score) in zip(expected, result or []):
+            self.assertAlmostEqual(expected_score, actual_score, places=6)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_query_top_and_ties(self) -> None:
+        """
+        Only the best documents are returned and ties are broken by identifiers
+        """
+        result = self.index.query({"dog": 1.0, "cat": 2.0}, top=2) or []
+        self.assertEqual([0, 1], [document_id for document_id, _ in result])
+        self.assertAlmostEqual(1.0, result[0][1], places=6)
+        self.assertEqual([], self.index.query({"whale": 1.0}))
+        self.assertEqual([], self.index.query({}))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_query_batch(self) -> None:
+        """
+        Batch results are equal to separate queries
+        """
+        queries = [{"cat": 1.0}, {"fish": 0.5, "bird": 0.5}, {"whale": 1.0}, {"cat": 0.3}]
+        self.assertEqual([self.index.query(query, 3) for query in queries],
+                         self.index.query_batch(queries, 3))
+        self.assertEqual([], self.index.query_batch([]))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_near_duplicates_and_matrix(self) -> None:
+        """
+        Proportional vectors are near-duplicates and matrix rows are indexed by position
+        """
+        duplicates = self.index.find_near_duplicates(0.99) or []
+        self.assertEqual([(0, 1)], [(first, second) for first, second, _ in duplicates])
+        self.assertEqual(4, len(self.index.find_near_duplicates(0.01) or []))
+
+        idf = {"cat": 0.5, "dog": 2.0, "fish": 1.5}
+        matrix = build_matrix([["cat", "dog"], ["fish"], ["dog", "cat", "cat"]], idf)
+        if matrix is None:
+            self.fail("Matrix is not built")
+        index = index_matrix(matrix)
+        self.assertEqual(3, len(index))
+        self.assertEqual([1], [document_id for document_id, _ in index.query({"fish": 1.0}) or []])
+        self.assertEqual({}, normalize({"cat": 0.0}))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt vectors and settings are rejected
+        """
+        self.assertIsNone(self.index.add({"cat": 1}))  # type: ignore[dict-item]
+        self.assertIsNone(self.index.add(None))  # type: ignore[arg-type]
+        self.assertEqual(5, len(self.index))
+        self.assertIsNone(self.index.query({"cat": 1.0}, top=0))
+        self.assertIsNone(self.index.query({1: 1.0}))  # type: ignore[dict-item]
+        self.assertIsNone(self.index.query_batch([{"cat": 1.0}, None]))  # type: ignore[list-item]
+        self.assertIsNone(self.index.query_batch([{"cat": 1.0}], top=-1))
+        for threshold in (0, 1.5, True, None):
+            self.assertIsNone(self.index.find_near_duplicates(threshold))  # type: ignore[arg-type]
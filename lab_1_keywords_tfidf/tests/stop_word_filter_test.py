@@ -0,0 +1,74 @@
+"""
+Checks the first lab stop word filter
+"""
+
+import unittest
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, iter_clean_tokens, remove_stop_words
+from lab_1_keywords_tfidf.pipeline import KeywordExtractor, load_stop_words, StopWordFilter
+
+
+class StopWordFilterTest(unittest.TestCase):
+    """
+    Tests stop word filter
+    """
+
+    TOKENS = ["the", "weather", "is", "sunny", "the", "man", "is", "happy"]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_filter_ideal(self) -> None:
+        """
+        Ideal filtering of stop words scenario
+        """
+        stop_words = StopWordFilter(["the", "a", "is"])
+        expected = ["weather", "sunny", "man", "happy"]
+        self.assertEqual(expected, stop_words.remove(StopWordFilterTest.TOKENS))
+        self.assertEqual(expected, list(stop_words.filter(iter(StopWordFilterTest.TOKENS))))
+        self.assertEqual(expected, remove_stop_words(StopWordFilterTest.TOKENS,
+                                                     stop_words.get_words()))
+        self.assertIn("the", stop_words)
+        self.assertNotIn("man", stop_words)
+        self.assertEqual(3, len(stop_words))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_filter_streaming(self) -> None:
+        """
+        Stop words are lazily removed from streamed tokens
+        """
+        text = "The cat is on the mat. " * 3
+        stop_words = StopWordFilter(["the", "is", "on"])
+        expected = remove_stop_words(clean_and_tokenize(text) or [], ["the", "is", "on"])
+        self.assertEqual(expected, list(stop_words.filter(iter_clean_tokens([text]))))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_load_languages(self) -> None:
+        """
+        Stop words shipped with the labs are loaded by language
+        """
+        russian = load_stop_words("ru")
+        english = load_stop_words("en")
+        self.assertIsNotNone(russian)
+        self.assertIsNotNone(english)
+        self.assertIn("и", russian)
+        self.assertIn("the", english)
+        self.assertNotIn("", english)
+        self.assertIsNone(load_stop_words("fr"))
+        extractor = KeywordExtractor(english, {}, {}, top=1)  # type: ignore[arg-type]
+        self.assertEqual((["cat"], []), extractor.extract("The cat"))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt stop words are rejected
+        """
+        for bad_input in ([1], None, [["a"]]):
+            with self.assertRaises(ValueError):
+                StopWordFilter(bad_input)  # type: ignore[arg-type]
+        self.assertIsNone(remove_stop_words(["a"], frozenset([1])))  # type: ignore[list-item]
+        self.assertIsNone(remove_stop_words(None, frozenset(["a"])))  # type: ignore[arg-type]
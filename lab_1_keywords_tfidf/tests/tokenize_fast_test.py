@@ -0,0 +1,49 @@
+"""
+Checks the first lab fast tokenization function
+"""
+
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.main import clean_and_tokenize, clean_and_tokenize_fast
+
+
+class TokenizeFastTest(unittest.TestCase):
+    """
+    Tests fast tokenize function
+    """
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_tokenize_fast_ideal(self) -> None:
+        """
+        Ideal fast tokenize scenario
+        """
+        expected = ["the", "weather", "is", "sunny", "the", "man", "is", "happy"]
+        actual = clean_and_tokenize_fast("The weather is sunny, the man is happy.")
+        self.assertEqual(expected, actual)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_tokenize_fast_same_as_reference(self) -> None:
+        """
+        Fast tokenize gives the same tokens as the reference one
+        """
+        path = Path(__file__).parent.parent / "assets" / "Дюймовочка.txt"
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read()
+        self.assertEqual(clean_and_tokenize(text), clean_and_tokenize_fast(text))
+        tricky = "snake_case — «Ёлка»,  x²  ½ 3-й\tmid word end ..."
+        self.assertEqual(clean_and_tokenize(tricky), clean_and_tokenize_fast(tricky))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_tokenize_fast_bad_input(self) -> None:
+        """
+        Fast tokenize bad input argument scenario
+        """
+        bad_inputs = [[], {}, (), None, 9, 9.34, True]
+        for bad_input in bad_inputs:
+            self.assertIsNone(clean_and_tokenize_fast(bad_input))  # type: ignore[arg-type]
@@ -0,0 +1,107 @@
+"""
+Checks the first lab validation policies
+"""
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_1_keywords_tfidf.main import (
+    _are_instances,
+    calculate_frequencies,
+    check_dict,
+    check_list,
+    remove_stop_words,
+    validation_policy,
+    VALIDATION_PREFIX_SIZE,
+)
+
+
+class ValidationPolicyTest(unittest.TestCase):
+    """
+    Tests strict, prefix and disabled validation of collections
+    """
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_policy_per_call(self) -> None:
+        """
+        Policy of a call decides which elements are checked
+        """
+        corrupt_list = ["a"] * 1000 + [1]
+        corrupt_dict = {**{str(index): 1.0 for index in range(1000)}, "last": 1}
+        self.assertFalse(check_list(corrupt_list, str, False))
+        self.assertFalse(check_list(corrupt_list, str, False, "strict"))
+        self.assertTrue(check_list(corrupt_list, str, False, "off"))
+        self.assertFalse(check_dict(corrupt_dict, str, float, False))
+        self.assertTrue(check_list(corrupt_list, str, False, "prefix"))
+        self.assertTrue(check_dict(corrupt_dict, str, float, False, "prefix"))
+        self.assertTrue(check_dict(corrupt_dict, str, float, False, "off"))
+
+        self.assertFalse(check_list([1, 2], str, False, "prefix"))
+        self.assertFalse(check_dict({"a": 1}, str, float, False, "prefix"))
+        self.assertFalse(check_dict({1: 1.0}, str, float, False, "prefix"))
+        self.assertFalse(check_list(["a"] * (VALIDATION_PREFIX_SIZE - 1) + [1], str, False,
+                                    "prefix"))
+        for bad_policy in ("lenient", "", "Strict", 1):
+            with self.assertRaises(ValueError):
+                check_list(["a"], str, False, bad_policy)  # type: ignore[arg-type]
+            with self.assertRaises(ValueError):
+                check_dict({"a": 1.0}, str, float, False, bad_policy)  # type: ignore[arg-type]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_container_checked_by_every_policy(self) -> None:
+        """
+        Type and emptiness of collections are checked even without element checks
+        """
+        for policy in ("strict", "prefix", "off"):
+            self.assertFalse(check_list((1, 2), int, False, policy))  # type: ignore[arg-type]
+            self.assertFalse(check_list([], int, False, policy))  # type: ignore[arg-type]
+            self.assertTrue(check_list([], int, True, policy))  # type: ignore[arg-type]
+            self.assertFalse(check_dict([], str, int, True, policy))  # type: ignore[arg-type]
+            self.assertFalse(check_dict({}, str, int, False, policy))  # type: ignore[arg-type]
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_prefix_is_bounded(self) -> None:
+        """
+        Prefix policy checks a bounded number of first elements
+        """
+        with mock.patch("lab_1_keywords_tfidf.main._are_instances",
+                        wraps=_are_instances) as are_instances:
+            check_list(["a"] * 10000, str, False, "prefix")
+            check_dict({str(index): 1.0 for index in range(10000)}, str, float, False, "prefix")
+        checked = [call.args[0] for call in are_instances.call_args_list]
+        self.assertEqual([["a"] * VALIDATION_PREFIX_SIZE,
+                          [str(index) for index in range(VALIDATION_PREFIX_SIZE)],
+                          [1.0] * VALIDATION_PREFIX_SIZE], checked)
+
+        stop_words = frozenset(str(index) for index in range(10000))
+        with mock.patch("lab_1_keywords_tfidf.main._are_instances",
+                        wraps=_are_instances) as are_instances:
+            with validation_policy("prefix"):
+                self.assertEqual(["a"], remove_stop_words(["a"], stop_words))
+        self.assertEqual(VALIDATION_PREFIX_SIZE, len(are_instances.call_args_list[0].args[0]))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_policy_per_context(self) -> None:
+        """
+        Context policy applies to nested calls and is restored on exit
+        """
+        tokens = ["a", None, "b"]
+        with validation_policy("off"):
+            self.assertEqual({"a": 1, None: 1, "b": 1},
+                             calculate_frequencies(tokens))  # type: ignore[arg-type]
+            self.assertEqual(["a", None],
+                             remove_stop_words(tokens, frozenset({"b"})))  # type: ignore[arg-type]
+            with validation_policy("strict"):
+                self.assertIsNone(calculate_frequencies(tokens))  # type: ignore[arg-type]
+            self.assertFalse(check_list(tokens, str, False, "strict"))
+        self.assertIsNone(calculate_frequencies(tokens))  # type: ignore[arg-type]
+        self.assertIsNone(remove_stop_words(["a"], frozenset({1})))  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            with validation_policy("lenient"):  # type: ignore[arg-type]
+                pass
@@ -0,0 +1,111 @@
+"""
+Checks the first lab array-backed vocabulary index
+"""
+
+# pylint: disable=duplicate-code
+import json
+import unittest
+from pathlib import Path
+
+import pytest
+
+from lab_1_keywords_tfidf.main import (
+    calculate_chi_values,
+    calculate_expected_frequency,
+    calculate_frequencies,
+    calculate_tf,
+    calculate_tfidf,
+    clean_and_tokenize,
+)
+from lab_1_keywords_tfidf.pipeline import UNKNOWN_TERM_IDF
+from lab_1_keywords_tfidf.vocabulary_index import VocabularyIndex
+
+
+class VocabularyIndexTest(unittest.TestCase):
+    """
+    Tests array-backed vocabulary index
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up resources of vocabulary index tests class.
+        """
+        assets = Path(__file__).parent.parent / "assets"
+        with open(assets / "Дюймовочка.txt", "r", encoding="utf-8") as file:
+            self.tokens = clean_and_tokenize(file.read()) or []
+        with open(assets / "IDF.json", "r", encoding="utf-8") as file:
+            self.idf = json.load(file)
+        with open(assets / "corpus_frequencies.json", "r", encoding="utf-8") as file:
+            self.corpus_freqs = json.load(file)
+        self.index = VocabularyIndex(self.idf, self.corpus_freqs)
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_vectors_match_dictionaries(self) -> None:
+        """
+        Array-backed values are equal to the values of main.py functions
+        """
+        tokens = self.tokens + ["абракадабра"]
+        frequencies = calculate_frequencies(tokens) or {}
+        term_freq = calculate_tf(frequencies) or {}
+        expected_freqs = calculate_expected_frequency(frequencies, self.corpus_freqs) or {}
+
+        counted = self.index.count(tokens)
+        self.assertIsNotNone(counted)
+        ids, counts, unknown = counted  # type: ignore[misc]
+        tf_vector = self.index.calculate_tf(counts)
+        expected_vector = self.index.calculate_expected(ids, counts)
+
+        self.assertTrue(unknown)
+        self.assertEqual(frequencies, self.index.to_dict(ids, counts, unknown))
+        self.assertEqual(term_freq, self.index.to_dict(ids, tf_vector, unknown))
+        self.assertEqual(
+            calculate_tfidf(term_freq, self.idf),
+            self.index.to_dict(ids, self.index.calculate_tfidf(ids, tf_vector), unknown),
+        )
+        self.assertEqual(expected_freqs, self.index.to_dict(ids, expected_vector, unknown))
+        self.assertEqual(
+            calculate_chi_values(expected_freqs, frequencies),
+            self.index.to_dict(ids, self.index.calculate_chi(counts, expected_vector), unknown),
+        )
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_unknown_tokens_stay_in_vector(self) -> None:
+        """
+        Tokens missing from IDF and corpus get identifiers of a single vector only
+        """
+        size = len(self.index)
+        self.assertIsNone(self.index.get_id("абракадабра"))
+        known_id = self.index.get_id("девочка")
+        self.assertEqual("девочка", self.index.get_term(known_id or 0))
+        counted = self.index.count(["абракадабра", "девочка", "ёж",
+                                    "абракадабра"])
+        self.assertIsNotNone(counted)
+        ids, counts, unknown = counted  # type: ignore[misc]
+        self.assertEqual(([known_id, size, size], [1, 2, 1], ("абракадабра", "ёж")),
+                         (list(ids), list(counts), unknown))
+        self.assertEqual(size, len(self.index))
+        self.assertIsNone(self.index.get_term(size))
+        self.assertEqual({"абракадабра": 2, "девочка": 1, "ёж": 1},
+                         self.index.to_dict(ids, counts, unknown))
+        index = VocabularyIndex({"кот": 0.5}, {"кот": 4})
+        ids, counts, unknown = index.count(["пёс", "кот"]) or (ids, counts, unknown)
+        self.assertEqual({"пёс": 0.5 * UNKNOWN_TERM_IDF, "кот": 0.25},
+                         index.to_dict(ids, index.calculate_tfidf(ids, index.calculate_tf(counts)),
+                                       unknown))
+        self.assertEqual([10 / 6, 2 / 6], list(index.calculate_expected(ids, counts)))
+        self.assertEqual(1, len(index))
+
+    @pytest.mark.lab_1_keywords_tfidf
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt inputs are rejected
+        """
+        self.assertIsNone(self.index.count(None))  # type: ignore[arg-type]
+        self.assertIsNone(self.index.count([1, 2]))  # type: ignore[list-item]
+        self.assertIsNone(self.index.get_term(-1))
+        self.assertIsNone(self.index.get_term(len(self.index)))
+        with self.assertRaises(ValueError):
+            VocabularyIndex({"a": 1}, {})  # type: ignore[dict-item]
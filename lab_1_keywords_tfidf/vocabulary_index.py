@@ -0,0 +1,202 @@
+"""
+Lab 1.
+
+Array-backed TF, TF-IDF and chi-squared computation over a vocabulary index
+"""
+
+from array import array
+
+from lab_1_keywords_tfidf.main import check_dict, check_list
+from lab_1_keywords_tfidf.pipeline import UNKNOWN_TERM_IDF
+
+SparseVectorType = tuple[array, array, tuple[str, ...]]
+"Type alias for token ids of a document, their counts and out-of-vocabulary tokens."
+
+
+class VocabularyIndex:
+    """
+    Map tokens to integer ids and keep corpus statistics in typed arrays.
+
+    Ids are assigned to IDF terms first, then to corpus terms missing from IDF.
+    The index is read-only after creation, so one instance can be shared.
+    Tokens missing from it are kept by the vector of a single document only
+    and point to a sentinel slot with the default IDF value and zero corpus
+    occurrences, exactly as main.py functions treat them.
+
+    Values are computed by comprehensions over compact arrays: on CPython,
+    map with operator functions over arrays measured no faster.
+
+    Attributes:
+        _ids (dict[str, int]): Dictionary in the form of <token: identifier>
+        _terms (list[str]): Tokens ordered by their identifiers
+        _idf (array): Inverse document frequency values by identifier,
+            followed by the sentinel slot
+        _corpus_counts (array): Token occurrences in corpus by identifier,
+            followed by the sentinel slot
+        _corpus_total (int): Number of tokens in corpus
+    """
+
+    def __init__(self, idf: dict[str, float], corpus_freqs: dict[str, int]) -> None:
+        """
+        Initialize an instance of VocabularyIndex.
+
+        Args:
+            idf (dict[str, float]): Inverse document frequency values
+            corpus_freqs (dict[str, int]): Token frequencies in corpus
+        """
+        if not check_dict(idf, str, float, True) or not check_dict(corpus_freqs, str, int, True):
+            raise ValueError('Invalid input: corrupt IDF or corpus frequencies')
+        self._terms: list[str] = list(idf)
+        self._terms.extend(term for term in corpus_freqs if term not in idf)
+        self._ids: dict[str, int] = {term: token_id for token_id, term in enumerate(self._terms)}
+        self._idf = array('d', [UNKNOWN_TERM_IDF]) * (len(self._terms) + 1)
+        self._corpus_counts = array('q', [0]) * (len(self._terms) + 1)
+        for term, value in idf.items():
+            self._idf[self._ids[term]] = value
+        for term, count in corpus_freqs.items():
+            self._corpus_counts[self._ids[term]] = count
+        self._corpus_total = sum(corpus_freqs.values())
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed tokens.
+
+        Returns:
+            int: Number of tokens with identifiers
+        """
+        return len(self._terms)
+
+    def get_id(self, token: str) -> int | None:
+        """
+        Retrieve an identifier of a token.
+
+        Args:
+            token (str): Token to retrieve identifier for
+
+        Returns:
+            int | None: Identifier of the token.
+
+        In case of a token missing from the index, None is returned.
+        """
+        return self._ids.get(token)
+
+    def get_term(self, token_id: int) -> str | None:
+        """
+        Retrieve a token by its identifier.
+
+        Args:
+            token_id (int): Identifier of the token
+
+        Returns:
+            str | None: Token that corresponds to the identifier.
+
+        In case of unknown identifier, None is returned.
+        """
+        if not isinstance(token_id, int) or not 0 <= token_id < len(self._terms):
+            return None
+        return self._terms[token_id]
+
+    def count(self, tokens: list[str]) -> SparseVectorType | None:
+        """
+        Count token occurrences as a sparse vector.
+
+        Indexed tokens come first in order of their first occurrence, followed
+        by tokens missing from the index, whose identifiers are all len(index).
+
+        Args:
+            tokens (list[str]): Token sequence
+
+        Returns:
+            SparseVectorType | None: Identifiers, their counts and tokens missing from the index.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not check_list(tokens, str, True):
+            return None
+        frequencies: dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        known_terms = [token for token in frequencies if token in self._ids]
+        unknown_terms = tuple(token for token in frequencies if token not in self._ids)
+        ids = array('q', [self._ids[token] for token in known_terms])
+        ids.extend(array('q', [len(self._terms)]) * len(unknown_terms))
+        counts = array('q', [frequencies[token] for token in known_terms])
+        counts.extend(frequencies[token] for token in unknown_terms)
+        return ids, counts, unknown_terms
+
+    def to_dict(
+        self, ids: array, values: array, unknown_terms: tuple[str, ...] = ()
+    ) -> dict[str, float]:
+        """
+        Convert a sparse vector to a dictionary of main.py functions.
+
+        Args:
+            ids (array): Token identifiers
+            values (array): Values of tokens
+            unknown_terms (tuple[str, ...]): Tokens missing from the index returned by count
+
+        Returns:
+            dict[str, float]: Dictionary with tokens and their values
+        """
+        terms = self._terms
+        names = [terms[token_id] for token_id in ids[:len(ids) - len(unknown_terms)]]
+        names.extend(unknown_terms)
+        return dict(zip(names, values))
+
+    def calculate_tf(self, counts: array) -> array:
+        """
+        Calculate Term Frequency (TF) values of a sparse vector.
+
+        Args:
+            counts (array): Raw occurrences of tokens
+
+        Returns:
+            array: TF values in the same order
+        """
+        total = sum(counts)
+        return array('d', [count / total for count in counts])
+
+    def calculate_tfidf(self, ids: array, term_freq: array) -> array:
+        """
+        Calculate TF-IDF values of a sparse vector.
+
+        Args:
+            ids (array): Token identifiers
+            term_freq (array): TF values of tokens
+
+        Returns:
+            array: TF-IDF values in the same order
+        """
+        idf = self._idf
+        return array('d', [value * idf[token_id] for token_id, value in zip(ids, term_freq)])
+
+    def calculate_expected(self, ids: array, counts: array) -> array:
+        """
+        Calculate expected frequencies of a sparse vector.
+
+        Args:
+            ids (array): Token identifiers
+            counts (array): Raw occurrences of tokens in document
+
+        Returns:
+            array: Expected frequencies in the same order
+        """
+        corpus_counts = self._corpus_counts
+        total_doc = sum(counts)
+        total = total_doc + self._corpus_total
+        return array('d', [((count + corpus_counts[token_id]) * total_doc) / total
+                           for token_id, count in zip(ids, counts)])
+
+    def calculate_chi(self, counts: array, expected: array) -> array:
+        """
+        Calculate chi-squared values of a sparse vector.
+
+        Args:
+            counts (array): Observed occurrences of tokens
+            expected (array): Expected frequencies of tokens
+
+        Returns:
+            array: Chi-squared values in the same order
+        """
+        return array('d', [((observed - expectation) ** 2) / expectation
+                           for observed, expectation in zip(counts, expected)])
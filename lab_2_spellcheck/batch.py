@@ -0,0 +1,197 @@
+"""
+Lab 2.
+
+Batch spellchecking of tokens and sentences with several methods at once
+"""
+
+from typing import Callable, Literal
+
+from lab_1_keywords_tfidf.main import check_dict, check_list, clean_and_tokenize
+from lab_2_spellcheck.main import (
+    calculate_jaccard_distance,
+    calculate_jaro_winkler_distance,
+    calculate_levenshtein_distance,
+    select_closest_candidate,
+)
+from lab_2_spellcheck.symspell import SymSpellIndex
+
+MethodType = Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"]
+"Type alias for a correction method of find_correct_word."
+
+METHODS: tuple[MethodType, ...] = ("jaccard", "frequency-based", "levenshtein", "jaro-winkler")
+
+CorrectionsType = dict[str, dict[str, str | None]]
+"Type alias for corrections of misspelled words by every method."
+
+
+class BatchCorrector:
+    """
+    Correct many misspelled words with several methods at once.
+
+    The vocabulary is validated and indexed once. Every unique misspelled word
+    is corrected once, with a single scan of the vocabulary shared by the
+    jaccard, levenshtein and jaro-winkler methods and a lookup of a symmetric
+    deletion index for the frequency-based method. Corrections are the same
+    as those of find_correct_word.
+
+    Attributes:
+        _vocabulary (dict[str, float]): Relative frequencies of words
+        _methods (tuple[MethodType, ...]): Requested correction methods
+        _frequency_index (SymSpellIndex | None): Index of the frequency-based method
+        _corrections (CorrectionsType): Corrections of the words seen so far
+    """
+
+    def __init__(
+        self,
+        vocabulary: dict[str, float],
+        alphabet: list[str] | None = None,
+        methods: tuple[MethodType, ...] = METHODS,
+    ) -> None:
+        """
+        Initialize an instance of BatchCorrector.
+
+        Args:
+            vocabulary (dict[str, float]): Vocabulary built by build_vocabulary
+            alphabet (list[str] | None): Letters for candidates creation
+                of the frequency-based method
+            methods (tuple[MethodType, ...]): Correction methods to apply
+        """
+        if not check_dict(vocabulary, str, float, False):
+            raise ValueError('Invalid input: vocabulary must be a non-empty dictionary')
+        if alphabet is not None and (
+            not check_list(alphabet, str, False)
+            or any(len(letter) != 1 for letter in alphabet)
+        ):
+            raise ValueError('Invalid input: alphabet must be a non-empty list of letters')
+        if (
+            not isinstance(methods, tuple)
+            or not methods
+            or any(method not in METHODS for method in methods)
+        ):
+            raise ValueError('Invalid input: methods must be a tuple of correction methods')
+        self._vocabulary = vocabulary
+        self._methods = methods
+        self._frequency_index = None
+        if "frequency-based" in methods and alphabet is not None:
+            self._frequency_index = SymSpellIndex(vocabulary, alphabet)
+        self._corrections: CorrectionsType = {}
+
+    def correct_word(self, wrong_word: str) -> dict[str, str | None] | None:
+        """
+        Find corrections of a word by all requested methods.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+
+        Returns:
+            dict[str, str | None] | None: Corrections by method, None for methods
+                whose distances cannot be calculated.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(wrong_word, str):
+            return None
+        if wrong_word not in self._corrections:
+            corrections = self._scan(wrong_word)
+            if "frequency-based" in self._methods:
+                if self._frequency_index is None:
+                    corrections["frequency-based"] = select_closest_candidate(
+                        wrong_word, list(self._vocabulary)
+                    )
+                else:
+                    corrections["frequency-based"] = self._frequency_index.find_correct_word(
+                        wrong_word
+                    )
+            self._corrections[wrong_word] = {method: corrections[method]
+                                             for method in self._methods}
+        return self._corrections[wrong_word]
+
+    def correct_tokens(self, tokens: list[str]) -> CorrectionsType | None:
+        """
+        Correct every unique out-of-vocabulary token.
+
+        Args:
+            tokens (list[str]): Tokens to check.
+
+        Returns:
+            CorrectionsType | None: Corrections by method of out-of-vocabulary tokens
+                in order of their first occurrence.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not check_list(tokens, str, True):
+            return None
+        corrections: CorrectionsType = {}
+        for token in tokens:
+            if token not in self._vocabulary and token not in corrections:
+                corrections[token] = self.correct_word(token) or {}
+        return corrections
+
+    def correct_sentences(self, sentences: list[str]) -> list[CorrectionsType] | None:
+        """
+        Correct out-of-vocabulary tokens of every sentence.
+
+        Words repeated across sentences are corrected once.
+
+        Args:
+            sentences (list[str]): Texts to check.
+
+        Returns:
+            list[CorrectionsType] | None: Corrections of every sentence.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not check_list(sentences, str, True):
+            return None
+        sentence_corrections = []
+        for sentence in sentences:
+            corrections = self.correct_tokens(clean_and_tokenize(sentence) or [])
+            if corrections is None:
+                return None
+            sentence_corrections.append(corrections)
+        return sentence_corrections
+
+    def _scan(self, wrong_word: str) -> dict[str, str | None]:
+        """
+        Find the closest words by the distance methods in one pass over the vocabulary.
+
+        The best Levenshtein distance found so far bounds the distances
+        of the next words, as in find_closest_by_levenshtein.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+
+        Returns:
+            dict[str, str | None]: Corrections by every requested distance method.
+        """
+        calculators: dict[str, Callable[[str, str], float | None]] = {
+            "jaccard": calculate_jaccard_distance,
+            "jaro-winkler": calculate_jaro_winkler_distance,
+        }
+        calculators = {method: calculator for method, calculator in calculators.items()
+                       if method in self._methods}
+        scan_levenshtein = "levenshtein" in self._methods
+        min_distances: dict[str, float] = {}
+        candidates: dict[str, list[str]] = {method: [] for method in calculators}
+        if scan_levenshtein:
+            candidates["levenshtein"] = []
+        failed = set()
+        for token in self._vocabulary:
+            distances = {method: calculator(wrong_word, token)
+                         for method, calculator in calculators.items()}
+            if scan_levenshtein:
+                distances["levenshtein"] = calculate_levenshtein_distance(
+                    wrong_word, token,
+                    int(min_distances.get("levenshtein", max(len(wrong_word), len(token))))
+                )
+            for method, distance in distances.items():
+                if distance is None:
+                    failed.add(method)
+                elif method not in min_distances or distance < min_distances[method]:
+                    min_distances[method] = distance
+                    candidates[method] = [token]
+                elif distance == min_distances[method]:
+                    candidates[method].append(token)
+        return {method: None if method in failed
+                else select_closest_candidate(wrong_word, method_candidates)
+                for method, method_candidates in candidates.items()}
@@ -0,0 +1,184 @@
+"""
+Lab 2.
+
+BK-tree vocabulary index for Levenshtein candidate search
+"""
+
+from lab_1_keywords_tfidf.main import check_dict
+from lab_2_spellcheck.main import calculate_levenshtein_distance, select_closest_candidate
+
+
+class BKTree:
+    """
+    Metric tree of vocabulary words under the Levenshtein distance.
+
+    Every node keeps its children by their distance to it. By the triangle
+    inequality, words within distance k of a query word w can only be found
+    under children whose distance d' to a node satisfies |d(w, node) - d'| <= k,
+    so the search skips the other subtrees.
+
+    Attributes:
+        _words (list[str]): Words of nodes, the root first
+        _children (list[dict[int, int]]): Child nodes of every node by distance to it
+        _max_length (int): Length of the longest indexed word
+    """
+
+    def __init__(self, vocabulary: dict[str, float]) -> None:
+        """
+        Initialize an instance of BKTree.
+
+        Args:
+            vocabulary (dict[str, float]): Vocabulary built by build_vocabulary
+        """
+        if not check_dict(vocabulary, str, float, False):
+            raise ValueError('Invalid input: vocabulary must be a non-empty dictionary')
+        self._words: list[str] = []
+        self._children: list[dict[int, int]] = []
+        self._max_length = 0
+        for word in vocabulary:
+            self.add(word)
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed words.
+
+        Returns:
+            int: Number of nodes
+        """
+        return len(self._words)
+
+    def add(self, word: str) -> bool:
+        """
+        Insert a word into the tree.
+
+        Args:
+            word (str): Word to insert.
+
+        Returns:
+            bool: True if the word is inserted, False if it is already indexed or corrupt.
+        """
+        if not isinstance(word, str):
+            return False
+        node = 0
+        while self._words:
+            distance = self._get_distance(word, node, max(len(word), len(self._words[node])))
+            if distance is None or distance == 0:
+                return False
+            child = self._children[node].get(distance)
+            if child is None:
+                self._children[node][distance] = len(self._words)
+                break
+            node = child
+        self._words.append(word)
+        self._children.append({})
+        self._max_length = max(self._max_length, len(word))
+        return True
+
+    def search(self, word: str, max_distance: int) -> list[tuple[str, int]] | None:
+        """
+        Find all indexed words within the distance of a word.
+
+        Args:
+            word (str): Word to search for.
+            max_distance (int): Maximum Levenshtein distance.
+
+        Returns:
+            list[tuple[str, int]] | None: Words and their distances sorted by distance,
+                then alphabetically.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if (
+            not isinstance(word, str)
+            or not isinstance(max_distance, int)
+            or isinstance(max_distance, bool)
+            or max_distance < 0
+        ):
+            return None
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self._get_distance(word, node, max_distance + self._get_farthest_child(node))
+            if distance is None:
+                return None
+            if distance <= max_distance:
+                found.append((self._words[node], distance))
+            stack.extend(child for child_distance, child in self._children[node].items()
+                         if abs(child_distance - distance) <= max_distance)
+        return sorted(found, key=lambda item: (item[1], item[0]))
+
+    def find_closest(self, wrong_word: str, max_distance: int | None = None) -> str | None:
+        """
+        Find the closest indexed word with the tie-breaking of find_correct_word.
+
+        The search radius shrinks to the best distance found so far, so only
+        subtrees which may contain equally close words are visited. Subtrees
+        closer to the word are searched first to shrink the radius early.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+            max_distance (int | None): Maximum Levenshtein distance, unlimited by default.
+
+        Returns:
+            str | None: The closest word, for ties the closest in length and
+                lexicographically first one.
+
+        In case of no words within the distance or corrupt input arguments, None is returned.
+        """
+        if not isinstance(wrong_word, str) or (max_distance is not None and (
+            not isinstance(max_distance, int) or isinstance(max_distance, bool)
+            or max_distance < 0
+        )):
+            return None
+        radius = max(len(wrong_word), self._max_length) if max_distance is None else max_distance
+        candidates: list[str] = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self._get_distance(wrong_word, node, radius + self._get_farthest_child(node))
+            if distance is None:
+                return None
+            if distance < radius or (distance == radius and not candidates):
+                radius = distance
+                candidates = [self._words[node]]
+            elif distance == radius:
+                candidates.append(self._words[node])
+            children = [(abs(child_distance - distance), child)
+                        for child_distance, child in self._children[node].items()
+                        if abs(child_distance - distance) <= radius]
+            children.sort(reverse=True)
+            stack.extend(child for _, child in children)
+        return select_closest_candidate(wrong_word, candidates)
+
+    def _get_distance(self, word: str, node: int, max_distance: int) -> int | None:
+        """
+        Calculate the bounded Levenshtein distance from a word to a node.
+
+        Args:
+            word (str): Word to compare
+            node (int): Index of the node
+            max_distance (int): Largest distance of interest, larger distances
+                are reported as max_distance + 1
+
+        Returns:
+            int | None: Distance to the word of the node.
+
+        In case the distance cannot be calculated, None is returned.
+        """
+        return calculate_levenshtein_distance(word, self._words[node], max_distance)
+
+    def _get_farthest_child(self, node: int) -> int:
+        """
+        Get the largest distance from a node to its children.
+
+        Distances to the query beyond radius plus this value do not matter,
+        as no subtree of the node can be within the radius then.
+
+        Args:
+            node (int): Index of the node
+
+        Returns:
+            int: Largest key of the children, 0 for a leaf
+        """
+        return max(self._children[node], default=0)
@@ -3,10 +3,29 @@ Lab 2.
 """
 
 # pylint:disable=unused-argument
-from typing import Literal
+import functools
+from typing import Any, Literal
 
 from lab_1_keywords_tfidf.main import check_dict, check_list
 
+BIT_PARALLEL_MAX_LENGTH = 64
+"Length of the longest word whose distances are calculated by the bit-parallel algorithm."
+
+
+def _check_distance_bound(max_distance: Any) -> bool:
+    """
+    Check if the object is a bound of Levenshtein distances.
+
+    Args:
+        max_distance (Any): Object to check
+
+    Returns:
+        bool: True if it is a non-negative integer (not bool), False otherwise
+    """
+    return (
+        isinstance(max_distance, int) and not isinstance(max_distance, bool) and max_distance >= 0
+    )
+
 
 def build_vocabulary(tokens: list[str]) -> dict[str, float] | None:
     """
@@ -76,6 +95,7 @@ def calculate_distance(
     vocabulary: dict[str, float],
     method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
     alphabet: list[str] | None = None,
+    max_distance: int | None = None,
 ) -> dict[str, float] | None:
     """
     Calculate distance between two strings using the specified method.
@@ -85,6 +105,8 @@ def calculate_distance(
         vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
         method (str): Method to use for comparison.
         alphabet (list[str]): The alphabet with letters.
+        max_distance (int | None): Largest Levenshtein distance of interest, larger
+            distances are reported as max_distance + 1. Exact distances by default.
 
     Returns:
         dict[str, float] | None: Calculated distance score.
@@ -98,18 +120,24 @@ def calculate_distance(
         or (alphabet is not None and not check_list(alphabet, str, False))
         ):
         return None
+    if max_distance is not None and not _check_distance_bound(max_distance):
+        return None
     if method == "frequency-based":
         if alphabet is None:
             return {token: 1.0 for token in vocabulary}
-        freq_distance = calculate_frequency_distance(first_token, vocabulary, alphabet)
-        if freq_distance is None:
-            return None
-        return freq_distance
-    distance = {}
+        return calculate_frequency_distance(first_token, vocabulary, alphabet)
+    distance: dict[str, float] = {}
+    if method == "levenshtein":
+        for token in vocabulary:
+            # a distance never exceeds the longer length, so this bound keeps it exact
+            bound = max(len(first_token), len(token)) if max_distance is None else max_distance
+            levenshtein_distance = calculate_levenshtein_distance(first_token, token, bound)
+            if levenshtein_distance is None:
+                return None
+            distance[token] = levenshtein_distance
+        return distance
     if method == "jaccard":
         calc_distance = calculate_jaccard_distance
-    elif method == "levenshtein":
-        calc_distance = calculate_levenshtein_distance
     elif method == "jaro-winkler":
         calc_distance = calculate_jaro_winkler_distance
     else:
@@ -151,12 +179,80 @@ def find_correct_word(
         or method not in ["jaccard", "frequency-based", "levenshtein", "jaro-winkler"]
         ):
         return None
+    if method == "levenshtein":
+        return _find_closest_by_levenshtein(wrong_word, vocabulary)
     distances = calculate_distance(wrong_word, vocabulary, method, alphabet)
     if not distances:
         return None
     min_distance = min(distances.values())
     candidates = [token for token, token_distance in distances.items()
                   if token_distance == min_distance]
+    return select_closest_candidate(wrong_word, candidates)
+
+
+def find_closest_by_levenshtein(wrong_word: str, vocabulary: dict[str, float]) -> str | None:
+    """
+    Find the closest vocabulary word by the Levenshtein distance.
+
+    The best distance found so far bounds the distance of the next words,
+    so farther words are rejected without filling their rows.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        vocabulary (dict[str, float]): Dict of candidate words.
+
+    Returns:
+        str | None: Word from vocabulary with the lowest distance.
+             In case of ties, the closest in length and lexicographically first is chosen.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not isinstance(wrong_word, str) or not check_dict(vocabulary, str, float, False):
+        return None
+    return _find_closest_by_levenshtein(wrong_word, vocabulary)
+
+
+def _find_closest_by_levenshtein(wrong_word: str, vocabulary: dict[str, float]) -> str | None:
+    """
+    Find the closest word of a validated vocabulary by the Levenshtein distance.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        vocabulary (dict[str, float]): Non-empty dict of candidate words.
+
+    Returns:
+        str | None: Word from vocabulary with the lowest distance.
+
+    In case the distance cannot be calculated, None is returned.
+    """
+    min_distance = None
+    candidates: list[str] = []
+    for token in vocabulary:
+        bound = max(len(wrong_word), len(token)) if min_distance is None else min_distance
+        distance = calculate_levenshtein_distance(wrong_word, token, bound)
+        if distance is None:
+            return None
+        if min_distance is None or distance < min_distance:
+            min_distance = distance
+            candidates = [token]
+        elif distance == min_distance:
+            candidates.append(token)
+    return select_closest_candidate(wrong_word, candidates)
+
+
+def select_closest_candidate(wrong_word: str, candidates: list[str]) -> str | None:
+    """
+    Break ties between candidates with the same distance to the word.
+
+    Args:
+        wrong_word (str): Word that might be misspelled.
+        candidates (list[str]): Words with the lowest distance score.
+
+    Returns:
+        str | None: The shortest and lexicographically first candidate.
+
+    In case of no candidates, None is returned.
+    """
     if not candidates:
         return None
     if len(candidates) == 1:
@@ -226,13 +322,19 @@ def fill_levenshtein_matrix(token: str, candidate: str) -> list[list[int]] | Non
     return matrix
 
 
-def calculate_levenshtein_distance(token: str, candidate: str) -> int | None:
+def calculate_levenshtein_distance(
+    token: str, candidate: str, max_distance: int | None = None
+) -> int | None:
     """
     Calculate the Levenshtein edit distance between two strings.
 
     Args:
         token (str): First string.
         candidate (str): Second string.
+        max_distance (int | None): Largest distance of interest. If given, the distance
+            is calculated by the bit-parallel algorithm for tokens of up to
+            BIT_PARALLEL_MAX_LENGTH letters and by calculate_bounded_levenshtein_distance
+            for longer ones instead of filling the full matrix.
 
     Returns:
         int | None: Minimum number of single-character edits (insertions, deletions,
@@ -240,12 +342,139 @@ def calculate_levenshtein_distance(token: str, candidate: str) -> int | None:
     """
     if not isinstance(token, str) or not isinstance(candidate, str):
         return None
+    if max_distance is not None:
+        if len(token) > BIT_PARALLEL_MAX_LENGTH:
+            return calculate_bounded_levenshtein_distance(token, candidate, max_distance)
+        if (
+            not isinstance(max_distance, int)
+            or isinstance(max_distance, bool)
+            or max_distance < 0
+            ):
+            return None
+        if abs(len(token) - len(candidate)) > max_distance:
+            return max_distance + 1
+        distance = calculate_bit_parallel_levenshtein_distance(token, candidate)
+        if distance is None:
+            return None
+        return min(distance, max_distance + 1)
     matrix = fill_levenshtein_matrix(token, candidate)
     if matrix is None:
         return None
     return matrix[-1][-1]
 
 
+@functools.lru_cache(maxsize=256)
+def get_pattern_masks(pattern: str) -> dict[str, int]:
+    """
+    Encode positions of every letter of a word as bits of an integer.
+
+    Masks are cached, so a word compared with a whole vocabulary is encoded once.
+    The returned dictionary is shared between calls and must not be modified.
+
+    Args:
+        pattern (str): Word to encode.
+
+    Returns:
+        dict[str, int]: Bitmasks with the i-th bit set if the letter is at position i.
+    """
+    masks: dict[str, int] = {}
+    for position, letter in enumerate(pattern):
+        masks[letter] = masks.get(letter, 0) | 1 << position
+    return masks
+
+
+def calculate_bit_parallel_levenshtein_distance(token: str, candidate: str) -> int | None:
+    """
+    Calculate the Levenshtein edit distance with the bit-parallel algorithm of Myers and Hyyro.
+
+    A column of the matrix is kept as bit vectors of vertical differences
+    between adjacent cells, so every letter of the candidate updates the whole
+    column with a fixed number of integer operations.
+
+    Args:
+        token (str): First string, encoded as bitmasks.
+        candidate (str): Second string, scanned letter by letter.
+
+    Returns:
+        int | None: Minimum number of single-character edits (insertions, deletions,
+             substitutions) required to transform token into candidate.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if not isinstance(token, str) or not isinstance(candidate, str):
+        return None
+    if not token:
+        return len(candidate)
+    masks = get_pattern_masks(token)
+    full_mask = (1 << len(token)) - 1
+    last_bit = 1 << (len(token) - 1)
+    positive_vertical, negative_vertical = full_mask, 0
+    distance = len(token)
+    for letter in candidate:
+        equal = masks.get(letter, 0)
+        vertical = equal | negative_vertical
+        horizontal = (((equal & positive_vertical) + positive_vertical)
+                      ^ positive_vertical) | equal
+        positive_horizontal = negative_vertical | (~(horizontal | positive_vertical) & full_mask)
+        negative_horizontal = positive_vertical & horizontal
+        if positive_horizontal & last_bit:
+            distance += 1
+        elif negative_horizontal & last_bit:
+            distance -= 1
+        positive_horizontal = ((positive_horizontal << 1) | 1) & full_mask
+        negative_horizontal = (negative_horizontal << 1) & full_mask
+        positive_vertical = negative_horizontal | (~(vertical | positive_horizontal) & full_mask)
+        negative_vertical = positive_horizontal & vertical
+    return distance
+
+
+def calculate_bounded_levenshtein_distance(
+    token: str, candidate: str, max_distance: int
+) -> int | None:
+    """
+    Calculate the Levenshtein edit distance keeping only two rows of the matrix.
+
+    Pairs whose lengths differ by more than the bound are skipped, and
+    calculation stops as soon as every cell of a row exceeds the bound.
+
+    Args:
+        token (str): First string.
+        candidate (str): Second string.
+        max_distance (int): Largest distance of interest.
+
+    Returns:
+        int | None: Minimum number of single-character edits, max_distance + 1
+             if it exceeds max_distance.
+
+    In case of corrupt input arguments, None is returned.
+    """
+    if (
+        not isinstance(token, str)
+        or not isinstance(candidate, str)
+        or not isinstance(max_distance, int)
+        or isinstance(max_distance, bool)
+        or max_distance < 0
+        ):
+        return None
+    if abs(len(token) - len(candidate)) > max_distance:
+        return max_distance + 1
+    if len(token) < len(candidate):
+        token, candidate = candidate, token
+    previous_row = list(range(len(candidate) + 1))
+    for row, token_letter in enumerate(token, 1):
+        current_row = [row]
+        for column, candidate_letter in enumerate(candidate, 1):
+            current_row.append(min(
+                previous_row[column] + 1,
+                current_row[column - 1] + 1,
+                previous_row[column - 1] + (token_letter != candidate_letter),
+            ))
+        if min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    return min(previous_row[-1], max_distance + 1)
+
+
 def delete_letter(word: str) -> list[str]:
     """
     Generate all possible words by deleting one letter from the word.
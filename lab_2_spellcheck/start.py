@@ -4,13 +4,13 @@ Spellcheck starter
 
 # pylint:disable=unused-variable, duplicate-code, too-many-locals
 from lab_1_keywords_tfidf.main import clean_and_tokenize, remove_stop_words
+from lab_2_spellcheck.batch import BatchCorrector
 from lab_2_spellcheck.main import (
     build_vocabulary,
     calculate_distance,
     calculate_frequency_distance,
     calculate_jaro_winkler_distance,
     calculate_levenshtein_distance,
-    find_correct_word,
     find_out_of_vocab_words,
 )
 
@@ -54,27 +54,15 @@ def main() -> None:
     print(jaro_winkler_distance)
     result = jaro_winkler_distance
 
-    all_wrong_words = []
-    for sentence in sentences:
-        sentence_tokens = clean_and_tokenize(sentence) or []
-        out_of_vocab = find_out_of_vocab_words(sentence_tokens, tokens_vocab) or []
-        all_wrong_words.extend(out_of_vocab)
-    unique_wrong_words = sorted(set(all_wrong_words))
-
-    for wrong_word in unique_wrong_words:
+    corrector = BatchCorrector(tokens_vocab, alphabet)
+    all_corrections = {}
+    for corrections in corrector.correct_sentences(sentences) or []:
+        all_corrections.update(corrections)
+    for wrong_word in sorted(all_corrections):
         print(f"Исправления для слова '{wrong_word}':")
-        correct_word = find_correct_word(wrong_word, tokens_vocab, "jaccard", alphabet)
-        if correct_word and correct_word != wrong_word:
-            print(f"jaccard: {correct_word}")
-        correct_word = find_correct_word(wrong_word, tokens_vocab, "frequency-based", alphabet)
-        if correct_word and correct_word != wrong_word:
-            print(f"frequency-based: {correct_word}")
-        correct_word = find_correct_word(wrong_word, tokens_vocab, "levenshtein", alphabet)
-        if correct_word and correct_word != wrong_word:
-            print(f"levenshtein: {correct_word}")
-        correct_word = find_correct_word(wrong_word, tokens_vocab, "jaro-winkler", alphabet)
-        if correct_word and correct_word != wrong_word:
-            print(f"jaro-winkler: {correct_word}")
+        for method, correct_word in all_corrections[wrong_word].items():
+            if correct_word and correct_word != wrong_word:
+                print(f"{method}: {correct_word}")
     assert result, "Result is None"
 
 
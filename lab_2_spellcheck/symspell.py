@@ -0,0 +1,176 @@
+"""
+Lab 2.
+
+Symmetric deletion index for frequency-based candidate search
+"""
+
+from lab_1_keywords_tfidf.main import check_dict, check_list
+from lab_2_spellcheck.main import generate_candidates, select_closest_candidate
+
+MAX_EDITS = 2
+"Number of edits applied by propose_candidates."
+
+
+def get_deletions(word: str, depth: int = MAX_EDITS) -> set[str]:
+    """
+    Generate all strings obtained by deleting up to several letters from the word.
+
+    Args:
+        word (str): The input word.
+        depth (int): Maximum number of deleted letters.
+
+    Returns:
+        set[str]: The word itself and its deletion variants.
+    """
+    deletions = {word}
+    level = {word}
+    for _ in range(depth):
+        level = {variant[:i] + variant[i + 1:] for variant in level for i in range(len(variant))}
+        deletions.update(level)
+    return deletions
+
+
+def get_predecessors(word: str, letters: frozenset[str], fillers: frozenset[str]) -> set[str]:
+    """
+    Generate the words which generate_candidates turns into the word.
+
+    Args:
+        word (str): Word obtained by an edit.
+        letters (frozenset[str]): Letters which can be inserted or put instead of others.
+        fillers (frozenset[str]): Letters which may have been deleted or replaced.
+
+    Returns:
+        set[str]: Words differing from the word by one deletion of a letter,
+            insertion of a letter, replacement of a letter or swap of adjacent letters.
+    """
+    predecessors = {word[:i] + filler + word[i:]
+                    for i in range(len(word) + 1) for filler in fillers}
+    for i, letter in enumerate(word):
+        if letter in letters:
+            predecessors.add(word[:i] + word[i + 1:])
+            predecessors.update(word[:i] + filler + word[i + 1:] for filler in fillers)
+    predecessors.update(word[:i] + word[i + 1] + word[i] + word[i + 2:]
+                        for i in range(len(word) - 1))
+    return predecessors
+
+
+class SymSpellIndex:
+    """
+    Symmetric deletion index of vocabulary words.
+
+    If up to two edits turn a word into a vocabulary word, both words share
+    a string obtained by deleting at most two letters from each of them. So
+    candidates are found by looking up deletion variants of a word only, and
+    then kept if they are indeed reachable with the edits of propose_candidates.
+
+    Attributes:
+        _vocabulary (dict[str, float]): Relative frequencies of words
+        _alphabet (list[str]): Letters for candidates creation
+        _letters (frozenset[str]): Letters for candidates creation
+        _deletions (dict[str, list[str]]): Vocabulary words by their deletion variants
+    """
+
+    def __init__(self, vocabulary: dict[str, float], alphabet: list[str]) -> None:
+        """
+        Initialize an instance of SymSpellIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Vocabulary built by build_vocabulary
+            alphabet (list[str]): Letters for candidates creation
+        """
+        if not check_dict(vocabulary, str, float, False):
+            raise ValueError('Invalid input: vocabulary must be a non-empty dictionary')
+        if not check_list(alphabet, str, False) or any(len(letter) != 1 for letter in alphabet):
+            raise ValueError('Invalid input: alphabet must be a non-empty list of letters')
+        self._vocabulary = vocabulary
+        self._alphabet = alphabet
+        self._letters = frozenset(alphabet)
+        self._deletions: dict[str, list[str]] = {}
+        for word in vocabulary:
+            for deletion in get_deletions(word):
+                self._deletions.setdefault(deletion, []).append(word)
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed words.
+
+        Returns:
+            int: Number of vocabulary words
+        """
+        return len(self._vocabulary)
+
+    def propose_candidates(self, word: str) -> tuple[str, ...] | None:
+        """
+        Find vocabulary words among the candidates of propose_candidates.
+
+        Args:
+            word (str): The input incorrect word.
+
+        Returns:
+            tuple[str, ...] | None: Sorted vocabulary words reachable with up to two edits.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        if not isinstance(word, str):
+            return None
+        found = set()
+        for deletion in get_deletions(word):
+            found.update(self._deletions.get(deletion, ()))
+        first_level_candidates = set(generate_candidates(word, self._alphabet) or [])
+        first_level_candidates.add(word)
+        fillers = self._letters.union(word)
+        return tuple(sorted(
+            candidate for candidate in found
+            if candidate in first_level_candidates
+            or not first_level_candidates.isdisjoint(
+                get_predecessors(candidate, self._letters, fillers)
+            )
+        ))
+
+    def calculate_frequency_distance(self, word: str) -> dict[str, float] | None:
+        """
+        Calculate frequency distances as calculate_frequency_distance does.
+
+        Args:
+            word (str): The input incorrect word.
+
+        Returns:
+            dict[str, float] | None: Distances of all vocabulary words.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        candidates = self.propose_candidates(word)
+        if candidates is None:
+            return None
+        frequency_distances = {token: 1.0 for token in self._vocabulary}
+        for candidate in candidates:
+            frequency_distances[candidate] = 1.0 - self._vocabulary[candidate]
+        return frequency_distances
+
+    def find_correct_word(self, wrong_word: str) -> str | None:
+        """
+        Find the most frequent candidate with the tie-breaking of find_correct_word.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+
+        Returns:
+            str | None: Word from vocabulary with the lowest frequency distance.
+
+        In case of corrupt input arguments, None is returned.
+        """
+        candidates = self.propose_candidates(wrong_word)
+        if candidates is None:
+            return None
+        min_distance = min((1.0 - self._vocabulary[candidate] for candidate in candidates),
+                           default=1.0)
+        if min_distance < 1.0:
+            return select_closest_candidate(wrong_word, [
+                candidate for candidate in candidates
+                if 1.0 - self._vocabulary[candidate] == min_distance
+            ])
+        distances = self.calculate_frequency_distance(wrong_word) or {}
+        min_distance = min(distances.values())
+        return select_closest_candidate(wrong_word, [
+            token for token, distance in distances.items() if distance == min_distance
+        ])
@@ -0,0 +1,100 @@
+"""
+Checks the second lab batch corrector
+"""
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.batch import BatchCorrector, METHODS
+from lab_2_spellcheck.main import calculate_jaccard_distance, find_correct_word
+from lab_2_spellcheck.tests.fixtures import VOCABULARY
+
+
+class BatchCorrectorTest(unittest.TestCase):
+    """
+    Tests batch corrections against find_correct_word.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up vocabulary for batch corrector tests class.
+        """
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+        self.vocabulary = dict(VOCABULARY)
+        self.corrector = BatchCorrector(self.vocabulary, self.alphabet)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_corrections_match_find_correct_word(self) -> None:
+        """
+        Every method gives the correction of find_correct_word
+        """
+        for word in ["boyi", "streat", "coffe", "cta", "laved", "", "xyz", "stories1"]:
+            for alphabet in (self.alphabet, None):
+                expected = {method: find_correct_word(word, self.vocabulary, method, alphabet)
+                            for method in METHODS}
+                self.assertEqual(expected,
+                                 BatchCorrector(self.vocabulary, alphabet).correct_word(word), word)
+        corrector = BatchCorrector(self.vocabulary, methods=("levenshtein",))
+        self.assertEqual({"levenshtein": "boy"}, corrector.correct_word("boyi"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_misspellings_are_corrected_once(self) -> None:
+        """
+        Repeated words are corrected once across tokens and sentences
+        """
+        with mock.patch("lab_2_spellcheck.batch.calculate_jaccard_distance",
+                        wraps=calculate_jaccard_distance) as jaccard:
+            tokens_corrections = self.corrector.correct_tokens(["cta", "boy", "boyi", "cta"])
+            sentence_corrections = self.corrector.correct_sentences(
+                ["The cta and the boyi.", "", "Boyi!"]
+            )
+        if tokens_corrections is None or sentence_corrections is None:
+            self.fail("Corrections are not found")
+        self.assertEqual(["cta", "boyi"], list(tokens_corrections))
+        self.assertEqual("cat", tokens_corrections["cta"]["levenshtein"])
+        self.assertEqual(["the", "cta", "and", "boyi"], list(sentence_corrections[0]))
+        self.assertEqual([{}, {"boyi": tokens_corrections["boyi"]}], sentence_corrections[1:])
+        self.assertIs(tokens_corrections["cta"], sentence_corrections[0]["cta"])
+        self.assertEqual(4 * len(self.vocabulary), jaccard.call_count)
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_distance_none(self) -> None:
+        """
+        Methods whose distances cannot be calculated give None corrections
+        """
+        with mock.patch("lab_2_spellcheck.batch.calculate_jaccard_distance", return_value=None):
+            corrections = self.corrector.correct_word("cta")
+        if corrections is None:
+            self.fail("Corrections are not found")
+        self.assertIsNone(corrections["jaccard"])
+        self.assertEqual("cat", corrections["levenshtein"])
+        with mock.patch("lab_2_spellcheck.batch.clean_and_tokenize", return_value=[1]):
+            self.assertIsNone(self.corrector.correct_sentences(["cta"]))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt vocabularies, alphabets, methods and batches are rejected
+        """
+        bad_arguments = [
+            (None, self.alphabet, METHODS),
+            ({"cat": 1}, self.alphabet, METHODS),
+            (self.vocabulary, [], METHODS),
+            (self.vocabulary, ["ab"], METHODS),
+            (self.vocabulary, [""], METHODS),
+            (self.vocabulary, self.alphabet, ()),
+            (self.vocabulary, self.alphabet, ["jaccard"]),
+            (self.vocabulary, self.alphabet, ("hamming",)),
+        ]
+        for arguments in bad_arguments:
+            with self.assertRaises(ValueError):
+                BatchCorrector(*arguments)  # type: ignore[arg-type]
+        self.assertIsNone(self.corrector.correct_word(None))  # type: ignore[arg-type]
+        self.assertIsNone(self.corrector.correct_tokens(["cta", 1]))  # type: ignore[list-item]
+        self.assertIsNone(self.corrector.correct_sentences("cta"))  # type: ignore[arg-type]
@@ -0,0 +1,117 @@
+"""
+Checks the second lab BK-tree vocabulary index
+"""
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.bk_tree import BKTree
+from lab_2_spellcheck.main import (
+    calculate_levenshtein_distance,
+    find_correct_word,
+    select_closest_candidate,
+)
+from lab_2_spellcheck.tests.fixtures import TIE_WORDS, VOCABULARY
+
+
+class BKTreeTest(unittest.TestCase):
+    """
+    Tests BK-tree search against exhaustive Levenshtein search.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up vocabulary for BK-tree tests class.
+        """
+        self.vocabulary = {**VOCABULARY, **TIE_WORDS}
+        self.tree = BKTree(self.vocabulary)
+        self.words = ["boyi", "streat", "coffe", "cta", "livd", "cat", "xyz", "", "lovedd",
+                      "storie", "bt", "kinda", "catz", "ct"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_find_closest_matches_find_correct_word(self) -> None:
+        """
+        Closest words and their tie-breaking are the same as in find_correct_word
+        """
+        self.assertEqual(len(self.vocabulary), len(self.tree))
+        for word in self.words:
+            self.assertEqual(find_correct_word(word, self.vocabulary, "levenshtein"),
+                             self.tree.find_closest(word), word)
+        self.assertEqual("ca", self.tree.find_closest("ct"))
+        self.assertEqual("bat", self.tree.find_closest("bt"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_ties_go_to_the_shortest_candidate(self) -> None:
+        """
+        Ties are broken by the shortest candidate, not the closest in length
+        """
+        self.assertEqual("ab", select_closest_candidate("abcd", ["abcdef", "ab"]))
+        self.assertEqual("aa", select_closest_candidate("abcd", ["bb", "aa"]))
+        self.assertEqual("abcdef", select_closest_candidate("abcd", ["abcdef"]))
+        self.assertIsNone(select_closest_candidate("abcd", []))
+        vocabulary = {"abcdef": 0.5, "ab": 0.5}
+        self.assertEqual("ab", BKTree(vocabulary).find_closest("abcd"))
+        self.assertEqual("ab", find_correct_word("abcd", vocabulary, "levenshtein"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_search_within_distance(self) -> None:
+        """
+        Search returns exactly the words within the distance
+        """
+        for word in self.words:
+            for max_distance in range(4):
+                expected = sorted(
+                    ((token, calculate_levenshtein_distance(word, token) or 0)
+                     for token in self.vocabulary
+                     if (calculate_levenshtein_distance(word, token) or 0) <= max_distance),
+                    key=lambda item: (item[1], item[0])
+                )
+                self.assertEqual(expected, self.tree.search(word, max_distance))
+        self.assertEqual("boy", self.tree.find_closest("boyi", 2))
+        self.assertIsNone(self.tree.find_closest("xyzxyz", 2))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_add(self) -> None:
+        """
+        Words are inserted once
+        """
+        self.assertFalse(self.tree.add("cat"))
+        self.assertFalse(self.tree.add(None))  # type: ignore[arg-type]
+        self.assertTrue(self.tree.add("catalogue"))
+        self.assertEqual(len(self.vocabulary) + 1, len(self.tree))
+        self.assertEqual("catalogue", self.tree.find_closest("catalog"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt vocabularies, words and distances are rejected
+        """
+        for vocabulary in (None, {}, {"cat": 1}, ["cat"]):
+            with self.assertRaises(ValueError):
+                BKTree(vocabulary)  # type: ignore[arg-type]
+        for max_distance in (-1, True, 1.5, "1"):
+            self.assertIsNone(self.tree.search("cat", max_distance))  # type: ignore[arg-type]
+            self.assertIsNone(self.tree.find_closest("cat", max_distance))  # type: ignore[arg-type]
+        self.assertIsNone(self.tree.search(None, 1))  # type: ignore[arg-type]
+        self.assertIsNone(self.tree.find_closest(42))  # type: ignore[arg-type]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_distance_none(self) -> None:
+        """
+        Distances which cannot be calculated are not taken for a match
+        """
+        size = len(self.tree)
+        with mock.patch("lab_2_spellcheck.bk_tree.calculate_levenshtein_distance",
+                        return_value=None):
+            self.assertFalse(self.tree.add("dog"))
+            self.assertIsNone(self.tree.search("cat", 1))
+            self.assertIsNone(self.tree.find_closest("cat"))
+        self.assertEqual(size, len(self.tree))
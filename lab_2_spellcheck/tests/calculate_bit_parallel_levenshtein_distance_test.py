@@ -0,0 +1,78 @@
+"""
+Checks the second lab bit-parallel Levenshtein metric calculation function
+"""
+
+import random
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    calculate_bit_parallel_levenshtein_distance,
+    calculate_distance,
+    calculate_levenshtein_distance,
+    get_pattern_masks,
+)
+
+
+class CalculateBitParallelLevenshteinDistanceTest(unittest.TestCase):
+    """
+    Tests function for bit-parallel Levenshtein metric calculation.
+    """
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_bit_parallel_levenshtein_distance_ideal(self) -> None:
+        """
+        Distances are the same as with the full matrix
+        """
+        generator = random.Random(42)
+        words = ["word", "ord", "cord", "board", "owrd", "drow", "different", "",
+                 "кот", "кто"]
+        words.extend("".join(generator.choice("abc") for _ in range(generator.randint(0, 12)))
+                     for _ in range(60))
+        for token in words:
+            for candidate in words:
+                self.assertEqual(calculate_levenshtein_distance(token, candidate),
+                                 calculate_bit_parallel_levenshtein_distance(token, candidate),
+                                 (token, candidate))
+        self.assertEqual({"a": 0b101, "b": 0b10}, get_pattern_masks("aba"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_long_words(self) -> None:
+        """
+        Words longer than a machine word are handled by both backends
+        """
+        token = "ab" * 40
+        candidate = "ba" * 40
+        self.assertEqual(2, calculate_bit_parallel_levenshtein_distance(token, candidate))
+        self.assertEqual(2, calculate_levenshtein_distance(token, candidate, 5))
+        self.assertEqual(2, calculate_levenshtein_distance(token, candidate, 1))
+        self.assertEqual({candidate: 2, "a": 79},
+                         calculate_distance(token, {candidate: 0.5, "a": 0.5}, "levenshtein"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_bit_parallel_levenshtein_distance_bad_input(self) -> None:
+        """
+        Bad input argument scenario
+        """
+        for bad_input in [[], {}, (), None, 42, 3.14, True]:
+            self.assertIsNone(calculate_bit_parallel_levenshtein_distance(bad_input, "word"))
+            self.assertIsNone(calculate_bit_parallel_levenshtein_distance("word", bad_input))
+        for bad_bound in [-1, True, 1.5, "1", []]:
+            self.assertIsNone(calculate_levenshtein_distance(
+                "word", "ward", bad_bound  # type: ignore[arg-type]
+            ))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_kernel_distance_none(self) -> None:
+        """
+        Bounded distance is None when the bit-parallel kernel gives no distance
+        """
+        with mock.patch("lab_2_spellcheck.main.calculate_bit_parallel_levenshtein_distance",
+                        return_value=None):
+            self.assertIsNone(calculate_levenshtein_distance("word", "ward", 1))
@@ -0,0 +1,123 @@
+"""
+Checks the second lab bounded Levenshtein metric calculation functions
+"""
+
+# pylint: disable=duplicate-code
+
+import unittest
+from unittest import mock
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    calculate_bounded_levenshtein_distance,
+    calculate_distance,
+    calculate_levenshtein_distance,
+    find_closest_by_levenshtein,
+    find_correct_word,
+)
+
+
+class CalculateBoundedLevenshteinDistanceTest(unittest.TestCase):
+    """
+    Tests functions for bounded Levenshtein metric calculation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up for bounded Levenshtein metric tests class.
+        """
+        self.vocabulary = {
+            "35": 0.04,
+            "across": 0.08,
+            "boy": 0.04,
+            "cat": 0.16,
+            "coffee": 0.04,
+            "kind": 0.04,
+            "library": 0.12,
+            "lived": 0.04,
+            "loved": 0.08,
+            "street": 0.08,
+            "bat": 0.04,
+            "ca": 0.04,
+        }
+        self.words = ["boyi", "streat", "coffe", "cta", "livd", "", "ct", "different", "bt"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_bounded_levenshtein_distance_ideal(self) -> None:
+        """
+        Distances within the bound are exact, larger ones are reported as the bound plus one
+        """
+        for word in self.words:
+            for token in self.vocabulary:
+                expected = calculate_levenshtein_distance(word, token)
+                if expected is None:
+                    self.fail("Distance is not calculated")
+                for max_distance in range(6):
+                    self.assertEqual(
+                        min(expected, max_distance + 1),
+                        calculate_bounded_levenshtein_distance(word, token, max_distance),
+                        (word, token, max_distance)
+                    )
+                    self.assertEqual(
+                        calculate_bounded_levenshtein_distance(word, token, max_distance),
+                        calculate_levenshtein_distance(word, token, max_distance)
+                    )
+        self.assertEqual(3, calculate_bounded_levenshtein_distance("a", "abcdef", 2))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_calculate_bounded_levenshtein_distance_bad_input(self) -> None:
+        """
+        Bad input argument scenario
+        """
+        for bad_input in [[], {}, (), None, 42, 3.14, True]:
+            self.assertIsNone(calculate_bounded_levenshtein_distance(bad_input, "word", 1))
+            self.assertIsNone(calculate_bounded_levenshtein_distance("word", bad_input, 1))
+        for bad_bound in [-1, True, 1.5, "1", None]:
+            self.assertIsNone(calculate_bounded_levenshtein_distance(
+                "word", "ward", bad_bound  # type: ignore[arg-type]
+            ))
+        for bad_bound in [-1, True, 1.5, "1"]:
+            self.assertIsNone(calculate_distance(
+                "word", self.vocabulary, "levenshtein", None, bad_bound  # type: ignore[arg-type]
+            ))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_scans_match_full_matrix(self) -> None:
+        """
+        Vocabulary scans give the distances and corrections of the full matrix
+        """
+        for word in self.words:
+            exact = {}
+            for token in self.vocabulary:
+                distance = calculate_levenshtein_distance(word, token)
+                if distance is None:
+                    self.fail("Distance is not calculated")
+                exact[token] = distance
+            self.assertEqual(exact, calculate_distance(word, self.vocabulary, "levenshtein"))
+            self.assertEqual(
+                {token: min(distance, 2) for token, distance in exact.items()},
+                calculate_distance(word, self.vocabulary, "levenshtein", max_distance=1)
+            )
+            min_distance = min(exact.values())
+            closest = sorted(token for token, distance in exact.items()
+                             if distance == min_distance)
+            self.assertIn(find_closest_by_levenshtein(word, self.vocabulary), closest)
+            self.assertEqual(find_closest_by_levenshtein(word, self.vocabulary),
+                             find_correct_word(word, self.vocabulary, "levenshtein"))
+        self.assertEqual("ca", find_closest_by_levenshtein("ct", self.vocabulary))
+        self.assertIsNone(find_closest_by_levenshtein("ct", {}))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_scan_distance_none(self) -> None:
+        """
+        Vocabulary scans give None when a distance cannot be calculated
+        """
+        with mock.patch("lab_2_spellcheck.main.calculate_levenshtein_distance",
+                        return_value=None):
+            self.assertIsNone(find_closest_by_levenshtein("ct", self.vocabulary))
+            self.assertIsNone(find_correct_word("ct", self.vocabulary, "levenshtein"))
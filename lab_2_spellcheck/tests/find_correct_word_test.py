@@ -8,6 +8,7 @@ from unittest import mock
 import pytest
 
 from lab_2_spellcheck.main import find_correct_word
+from lab_2_spellcheck.tests.fixtures import VOCABULARY
 
 
 class FindCorrectWordTest(unittest.TestCase):
@@ -19,25 +20,7 @@ class FindCorrectWordTest(unittest.TestCase):
         """
         Set up for word search tests class.
         """
-        self.vocabulary = {
-            "35": 0.04,
-            "across": 0.08,
-            "boy": 0.04,
-            "cat": 0.16,
-            "coffee": 0.04,
-            "friend": 0.04,
-            "kind": 0.04,
-            "library": 0.12,
-            "lived": 0.04,
-            "loved": 0.08,
-            "named": 0.04,
-            "opened": 0.04,
-            "shops": 0.04,
-            "smart": 0.04,
-            "stories": 0.04,
-            "stories101": 0.04,
-            "street": 0.08,
-        }
+        self.vocabulary = dict(VOCABULARY)
 
         self.misspelled = ["boyi", "streat", "coffe", "cta"]
         self.expected = ["boy", "street", "coffee", "cat"]
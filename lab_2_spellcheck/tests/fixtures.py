@@ -0,0 +1,27 @@
+"""
+Vocabulary shared by the second lab correction tests
+"""
+
+VOCABULARY = {
+    "35": 0.04,
+    "across": 0.08,
+    "boy": 0.04,
+    "cat": 0.16,
+    "coffee": 0.04,
+    "friend": 0.04,
+    "kind": 0.04,
+    "library": 0.12,
+    "lived": 0.04,
+    "loved": 0.08,
+    "named": 0.04,
+    "opened": 0.04,
+    "shops": 0.04,
+    "smart": 0.04,
+    "stories": 0.04,
+    "stories101": 0.04,
+    "street": 0.08,
+}
+"Relative frequencies of words of the vocabulary built from the lab texts."
+
+#: Words which make ties of distances and frequencies in the shared vocabulary
+TIE_WORDS = {"bat": 0.04, "cats": 0.04, "ca": 0.04}
@@ -0,0 +1,91 @@
+"""
+Checks the second lab symmetric deletion index
+"""
+
+import unittest
+
+import pytest
+
+from lab_2_spellcheck.main import (
+    calculate_frequency_distance,
+    find_correct_word,
+    propose_candidates,
+)
+from lab_2_spellcheck.symspell import get_deletions, get_predecessors, SymSpellIndex
+from lab_2_spellcheck.tests.fixtures import TIE_WORDS, VOCABULARY
+
+
+class SymSpellIndexTest(unittest.TestCase):
+    """
+    Tests deletion index lookups against exhaustive candidate generation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up vocabulary for symmetric deletion index tests class.
+        """
+        self.alphabet = list("abcdefghijklmnopqrstuvwxyz")
+        self.vocabulary = {**VOCABULARY, **TIE_WORDS, "tac": 0.04}
+        self.index = SymSpellIndex(self.vocabulary, self.alphabet)
+        self.words = ["boyi", "streat", "coffe", "cta", "livd", "cat", "xyz", "", "lovedd",
+                      "storie", "bt", "kinda", "catz", "ct", "act", "stories1", "3", "librar"]
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_candidates_match_propose_candidates(self) -> None:
+        """
+        Found words are exactly the vocabulary words among proposed candidates
+        """
+        self.assertEqual(len(self.vocabulary), len(self.index))
+        for word in self.words:
+            expected = tuple(sorted(set(propose_candidates(word, self.alphabet) or ())
+                                    & set(self.vocabulary)))
+            self.assertEqual(expected, self.index.propose_candidates(word), word)
+        self.assertEqual(("bat", "ca", "cat", "cats", "tac"), self.index.propose_candidates("act"))
+        index = SymSpellIndex(self.vocabulary, ["z"])
+        self.assertEqual((), index.propose_candidates(""))
+        self.assertEqual(("ca", "cat", "tac"), index.propose_candidates("atc"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_distances_and_correction_match_frequency_method(self) -> None:
+        """
+        Distances and corrections are the same as with the frequency-based method
+        """
+        for word in self.words:
+            self.assertEqual(calculate_frequency_distance(word, self.vocabulary, self.alphabet),
+                             self.index.calculate_frequency_distance(word), word)
+            self.assertEqual(
+                find_correct_word(word, self.vocabulary, "frequency-based", self.alphabet),
+                self.index.find_correct_word(word), word
+            )
+        self.assertEqual("cat", self.index.find_correct_word("cta"))
+        self.assertEqual("35", self.index.find_correct_word("qwertyuiop"))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_edit_variants(self) -> None:
+        """
+        Deletion variants and predecessors cover the edits of generate_candidates
+        """
+        self.assertEqual({"ab", "a", "b", ""}, get_deletions("ab"))
+        self.assertEqual({"abc"}, get_deletions("abc", 0))
+        self.assertEqual({"xab", "axb", "abx", "a", "ax", "ba"},
+                         get_predecessors("ab", frozenset("b"), frozenset("x")))
+        self.assertEqual({"x"}, get_predecessors("", frozenset("b"), frozenset("x")))
+
+    @pytest.mark.lab_2_spellcheck
+    @pytest.mark.mark10
+    def test_bad_input(self) -> None:
+        """
+        Corrupt vocabularies, alphabets and words are rejected
+        """
+        for vocabulary in (None, {}, {"cat": 1}, ["cat"]):
+            with self.assertRaises(ValueError):
+                SymSpellIndex(vocabulary, self.alphabet)  # type: ignore[arg-type]
+        for alphabet in (None, "abc", [], ["ab"], [1]):
+            with self.assertRaises(ValueError):
+                SymSpellIndex(self.vocabulary, alphabet)  # type: ignore[arg-type]
+        self.assertIsNone(self.index.propose_candidates(None))  # type: ignore[arg-type]
+        self.assertIsNone(self.index.calculate_frequency_distance(42))  # type: ignore[arg-type]
+        self.assertIsNone(self.index.find_correct_word([]))  # type: ignore[arg-type]